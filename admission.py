@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+요청 수락 제어
+동시에 분석하는 요청 수를 제한하고, 대기 줄이 가득 차거나 오래 기다린 요청은 바로 거절해서
+과부하 상황에서도 수락한 요청의 지연 시간이 일정 범위 안에 머물도록 한다
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+
+class Overloaded(Exception):
+    """요청을 수락할 수 없음 (status_code: 429 대기 줄 가득 참, 503 대기 시간 초과)"""
+
+    def __init__(self, status_code: int, detail: str, retry_after: int = 1):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+        self.retry_after = retry_after
+
+
+class AdmissionLimiter:
+    """
+    동시 실행 수 + 대기 줄 길이 제한
+
+    - 실행 중인 요청이 max_active개 미만이면 바로 실행
+    - 아니면 대기 줄(최대 max_queue개)에서 최대 queue_timeout초 대기
+    - 대기 줄이 가득 차 있으면 429, 대기 시간을 넘기면 503
+    """
+
+    def __init__(self, max_active: int, max_queue: int = 0, queue_timeout: float = 1.0):
+        """
+        Args:
+            max_active: 동시에 실행할 요청 수 (0이면 제한 없음)
+            max_queue: 대기할 수 있는 요청 수
+            queue_timeout: 대기 시간 상한 (초)
+        """
+        self.max_active = max_active
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.active = 0
+        self.waiting = 0
+        self.rejected_full = 0
+        self.rejected_timeout = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None  # 이벤트 루프 안에서 생성
+
+    @asynccontextmanager
+    async def admit(self, timeout: Optional[float] = None) -> AsyncIterator[None]:
+        """
+        실행 슬롯 하나를 잡고 블록 실행
+
+        Args:
+            timeout: 이 요청의 대기 시간 상한 (초, None이면 queue_timeout, 둘 중 짧은 쪽 사용)
+
+        Raises:
+            Overloaded: 대기 줄이 가득 찼거나 대기 시간을 넘긴 경우
+        """
+        await self.acquire(timeout)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self, timeout: Optional[float] = None) -> None:
+        """
+        실행 슬롯 잡기 (admit을 쓸 수 없는 스트리밍 응답용, 끝나면 release 호출)
+
+        Raises:
+            Overloaded: 대기 줄이 가득 찼거나 대기 시간을 넘긴 경우
+        """
+        if self.max_active <= 0:
+            self.active += 1
+            return
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_active)
+
+        if self._semaphore.locked():
+            if self.waiting >= self.max_queue:
+                self.rejected_full += 1
+                raise Overloaded(429, "요청이 너무 많습니다. 잠시 후 다시 시도하세요.")
+
+            wait = self.queue_timeout if timeout is None else min(timeout, self.queue_timeout)
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), max(wait, 0.0))
+            except asyncio.TimeoutError:
+                self.rejected_timeout += 1
+                raise Overloaded(503, "서버가 바쁩니다. 잠시 후 다시 시도하세요.") from None
+            finally:
+                self.waiting -= 1
+        else:
+            await self._semaphore.acquire()
+
+        self.active += 1
+
+    def release(self) -> None:
+        """acquire로 잡은 실행 슬롯 반환"""
+        self.active -= 1
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        현재 상태
+
+        Returns:
+            실행 중/대기 중 요청 수, 거절 횟수 딕셔너리
+        """
+        return {
+            "active": self.active,
+            "waiting": self.waiting,
+            "max_active": self.max_active,
+            "max_queue": self.max_queue,
+            "rejected_full": self.rejected_full,
+            "rejected_timeout": self.rejected_timeout,
+        }
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+MeCab 분석 실행 백엔드
+CPU를 많이 쓰는 analyze_sentence를 이벤트 루프 밖(스레드/프로세스 풀)에서 실행
+"""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import metrics
+from japanese_pron import JapanesePronunciationExtractor, AnalysisOptions
+
+
+BACKEND_KINDS = ("inline", "thread", "process")
+
+# 프로세스 워커마다 하나씩 두는 extractor
+_worker_state = threading.local()
+
+
+class AnalysisTimeout(Exception):
+    """요청의 분석 마감 시각을 넘김"""
+
+
+def init_worker(dict_path: Optional[str] = None, segment_chars: Optional[int] = None) -> None:
+    """
+    워커 초기화: 워커 전용 JapanesePronunciationExtractor 생성
+
+    Args:
+        dict_path: 사전 경로 (None이면 기본 사전)
+        segment_chars: 긴 줄을 나누는 글자 수 (None이면 extractor 기본값, 0이면 나누지 않음)
+    """
+    _worker_state.extractor = JapanesePronunciationExtractor(dict_path, segment_chars=segment_chars)
+
+
+def analyze_until(extractor: JapanesePronunciationExtractor, texts: List[str],
+                  options: Optional[AnalysisOptions], deadline: Optional[float]) -> List[Dict[str, Any]]:
+    """
+    마감 시각 안에서 여러 줄을 순서대로 분석
+    줄마다 남은 시간을 확인하고, 줄 하나의 시간 제한(time_limit)도 남은 시간 이하로 줄인다
+    (남은 시간 때문에 줄인 줄은 truncated 결과가 되므로 캐시되지 않음)
+
+    Args:
+        extractor: 분석에 사용할 extractor
+        texts: 분석할 줄 리스트 (정규화된 텍스트)
+        options: 분석 설정 (None이면 extractor 기본값)
+        deadline: 마감 time.monotonic() 시각 (None이면 제한 없음, 프로세스 간에도 같은 시계)
+
+    Returns:
+        줄별 analyze_sentence 결과 리스트
+
+    Raises:
+        AnalysisTimeout: 마감 시각을 넘긴 경우
+    """
+    if deadline is None:
+        return [extractor.analyze_sentence(text, options) for text in texts]
+
+    options = options or extractor.default_options
+    results = []
+    for text in texts:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise AnalysisTimeout()
+        line_options = options
+        if options.time_limit <= 0 or remaining < options.time_limit:
+            line_options = options._replace(time_limit=remaining)
+        results.append(extractor.analyze_sentence(text, line_options))
+    return results
+
+
+def analyze_texts(texts: List[str], options: Optional[AnalysisOptions] = None,
+                  deadline: Optional[float] = None) -> List[Dict[str, Any]]:
+    """
+    워커에서 여러 줄을 순서대로 분석
+
+    Args:
+        texts: 분석할 줄 리스트 (정규화된 텍스트)
+        options: 분석 설정 (None이면 extractor 기본값)
+        deadline: 마감 time.monotonic() 시각 (None이면 제한 없음)
+
+    Returns:
+        줄별 analyze_sentence 결과 리스트
+
+    Raises:
+        AnalysisTimeout: 마감 시각을 넘긴 경우
+    """
+    extractor = getattr(_worker_state, "extractor", None)
+    if extractor is None:
+        init_worker()
+        extractor = _worker_state.extractor
+    return analyze_until(extractor, texts, options, deadline)
+
+
+def analyze_texts_with_metrics(texts: List[str], options: Optional[AnalysisOptions] = None,
+                               deadline: Optional[float] = None
+                               ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    프로세스 워커용 analyze_texts: 분석 중 워커에 쌓인 지표도 함께 반환
+
+    Returns:
+        (줄별 analyze_sentence 결과 리스트, metrics.REGISTRY.drain() 결과) 튜플
+    """
+    results = analyze_texts(texts, options, deadline)
+    return results, metrics.REGISTRY.drain()
+
+
+def split_chunks(items: List[Any], count: int) -> List[List[Any]]:
+    """
+    리스트를 순서를 유지한 채 최대 count개의 비슷한 크기 덩어리로 나누기
+
+    Args:
+        items: 나눌 리스트
+        count: 덩어리 개수 상한
+
+    Returns:
+        덩어리 리스트
+    """
+    count = max(1, min(count, len(items)))
+    size, remainder = divmod(len(items), count)
+    chunks = []
+    start = 0
+    for i in range(count):
+        end = start + size + (1 if i < remainder else 0)
+        chunks.append(items[start:end])
+        start = end
+    return chunks
+
+
+async def gather_chunks(futures: List["asyncio.Future"]) -> List[Any]:
+    """
+    덩어리별 결과를 순서대로 모으기
+    한 덩어리가 실패해도 나머지가 끝날 때까지 기다린 뒤 첫 번째 예외를 다시 발생
+    (마감 시각을 넘기면 모든 덩어리가 곧 멈추므로 오래 기다리지 않음)
+    """
+    chunk_results = await asyncio.gather(*futures, return_exceptions=True)
+    for chunk_result in chunk_results:
+        if isinstance(chunk_result, BaseException):
+            raise chunk_result
+    return chunk_results
+
+
+class AnalysisBackend:
+    """
+    analyze_sentence 실행 백엔드
+
+    - inline: 호출한 스레드에서 바로 실행 (이벤트 루프를 막음, 디버깅용)
+    - thread: 스레드 풀 (extractor 하나를 공유, Tagger는 extractor의 TaggerPool에서 대여)
+    - process: 프로세스 풀 (프로세스마다 extractor 하나, 코어 수만큼 확장)
+    """
+
+    def __init__(self, kind: str = "thread", workers: Optional[int] = None,
+                 dict_path: Optional[str] = None,
+                 extractor: Optional[JapanesePronunciationExtractor] = None,
+                 segment_chars: Optional[int] = None):
+        """
+        Args:
+            kind: 백엔드 종류 (inline, thread, process)
+            workers: 워커 수 (None이면 CPU 코어 수)
+            dict_path: 워커 extractor의 사전 경로
+            extractor: inline/thread 백엔드에서 사용할 extractor
+            segment_chars: 워커 extractor가 긴 줄을 나누는 글자 수
+                (None이면 extractor 기본값, 0이면 나누지 않음, extractor를 넘긴 경우 그 설정을 따름)
+        """
+        if kind not in BACKEND_KINDS:
+            raise ValueError(f"알 수 없는 분석 백엔드: {kind} (사용 가능: {', '.join(BACKEND_KINDS)})")
+
+        self.kind = kind
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.dict_path = dict_path
+        self.extractor = extractor
+        self._executor: Optional[Executor] = None
+
+        if kind == "process":
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=init_worker,
+                initargs=(dict_path, segment_chars),
+            )
+            return
+
+        if self.extractor is None:
+            self.extractor = JapanesePronunciationExtractor(dict_path, pool_size=self.workers,
+                                                            segment_chars=segment_chars)
+        if kind == "thread":
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix="mecab",
+            )
+
+    @classmethod
+    def from_env(cls, extractor: Optional[JapanesePronunciationExtractor] = None,
+                 segment_chars: Optional[int] = None) -> "AnalysisBackend":
+        """
+        환경 변수로 백엔드 생성 (segment_chars는 생성자와 동일)
+
+        - ANALYSIS_BACKEND: inline, thread, process (기본 thread)
+        - ANALYSIS_WORKERS: 워커 수 (기본 CPU 코어 수)
+        - MECAB_DICDIR: 사전 경로
+        """
+        workers = os.environ.get("ANALYSIS_WORKERS")
+        return cls(
+            kind=os.environ.get("ANALYSIS_BACKEND", "thread"),
+            workers=int(workers) if workers else None,
+            dict_path=os.environ.get("MECAB_DICDIR") or None,
+            extractor=extractor,
+            segment_chars=segment_chars,
+        )
+
+    async def analyze(self, texts: List[str], options: Optional[AnalysisOptions] = None,
+                      deadline: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        여러 줄을 워커들에 나눠 분석 (입력 순서 유지)
+
+        Args:
+            texts: 분석할 줄 리스트 (정규화된 텍스트)
+            options: 분석 설정 (None이면 extractor 기본값)
+            deadline: 마감 time.monotonic() 시각 (None이면 제한 없음)
+
+        Returns:
+            줄별 analyze_sentence 결과 리스트
+
+        Raises:
+            AnalysisTimeout: 마감 시각을 넘긴 경우 (워커들도 다음 줄로 넘어가기 전에 멈춤)
+        """
+        if not texts:
+            return []
+
+        if self._executor is None:
+            return analyze_until(self.extractor, texts, options, deadline)
+
+        loop = asyncio.get_running_loop()
+        chunks = split_chunks(list(texts), self.workers)
+        results = []
+        if self.kind == "process":
+            # 워커 프로세스의 지표는 결과와 함께 받아서 이 프로세스의 지표에 합침
+            futures = [loop.run_in_executor(self._executor, analyze_texts_with_metrics, chunk, options, deadline)
+                       for chunk in chunks]
+            for chunk_result, delta in await gather_chunks(futures):
+                results.extend(chunk_result)
+                metrics.REGISTRY.merge(delta)
+            return results
+
+        futures = [loop.run_in_executor(self._executor, analyze_until, self.extractor, chunk, options, deadline)
+                   for chunk in chunks]
+        for chunk_result in await gather_chunks(futures):
+            results.extend(chunk_result)
+        return results
+
+    async def warmup(self, texts: List[str], options: Optional[AnalysisOptions] = None) -> None:
+        """
+        사전 페이지와 워커를 미리 데우기
+        워커마다 한 벌씩 돌도록 texts를 워커 수만큼 반복해서 분석
+        (프로세스 백엔드는 이때 워커 프로세스가 뜨고 사전을 로드함)
+
+        Args:
+            texts: 예열용 줄 리스트
+            options: 분석 설정 (None이면 extractor 기본값)
+        """
+        if texts:
+            await self.analyze(list(texts) * self.workers, options)
+
+    def shutdown(self) -> None:
+        """워커 풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -3,30 +3,394 @@
 FastAPI 웹 애플리케이션 - 일본어 가사 한글 변환기
 """
 
-from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel
-from typing import List
+from pydantic import BaseModel, Field, field_validator
+from typing import List, Dict, Any, AsyncIterator, Iterable, Iterator, Literal, Optional, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+import asyncio
+import hashlib
+import importlib
 import json
+import logging
+import os
+import time
+from functools import partial
 
-from japanese_pron import JapanesePronunciationExtractor
+from japanese_pron import (JapanesePronunciationExtractor, AnalysisOptions, MAX_NBEST as DEFAULT_MAX_NBEST,
+                           merge_segment_results, normalize_fields)
+from japanese_script import split_long_line
+from analysis_pool import AnalysisBackend, AnalysisTimeout
+from admission import AdmissionLimiter, Overloaded
+from line_cache import EMPTY_LINE_HASH, LineCache, document_hash, line_hash, normalize_document, normalize_line
+import persistent_cache as persistent_cache_module
+import jobs
+from persistent_cache import options_key
+from compact_format import CANDIDATE_FIELDS, encode_compact, dumps
+from hangul_render import RenderOptions, render_lines
+import metrics
+from metrics import StageTimer
+
+# uvicorn 로그와 같은 곳에 출력
+logger = logging.getLogger("uvicorn.error")
+
+# 모듈 로드 시각 (시작 단계 시간 측정 기준)
+MODULE_LOADED_AT = time.perf_counter()
+
+# 예열용 가사 (WARMUP_CORPUS로 변경 가능)
+# WARMUP: background (기본, 요청을 받으면서 예열), blocking (예열이 끝난 뒤 요청 수신), off
+WARMUP_CORPUS = os.environ.get(
+    "WARMUP_CORPUS",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "warmup_lyrics.txt"),
+)
+WARMUP_MODE = os.environ.get("WARMUP", "background")
+
+# 요청에서 지정할 수 있는 N-best 상한
+MAX_NBEST = int(os.environ.get("MAX_NBEST", str(DEFAULT_MAX_NBEST)))
+
+# MeCab extractor와 분석 실행 백엔드 (lifespan에서 생성)
+extractor: Optional[JapanesePronunciationExtractor] = None
+backend: Optional[AnalysisBackend] = None
+
+# 비동기 변환 작업 (lifespan에서 생성, JOB_STORE/JOB_WORKERS 등은 jobs.from_env 참고)
+job_manager: Optional[jobs.JobManager] = None
+
+# 줄 단위 분석 결과 캐시 (줄 해시로 조회, LINE_CACHE_SIZE=0이면 비활성화)
+line_cache = LineCache(max_size=int(os.environ.get("LINE_CACHE_SIZE", "4096")))
+
+# 문서 해시 → 정규화된 문서 텍스트 (GET /api/result/{문서 해시}로 다시 조회할 수 있도록 변환한 문서를 보관)
+document_store = LineCache(max_size=int(os.environ.get("DOCUMENT_STORE_SIZE", "1024")))
+
+# GET /api/result 응답을 브라우저/CDN이 보관할 시간 (초)
+# 내용 주소 방식이라 같은 URL의 결과는 사전이 바뀌기 전까지 변하지 않고, 그 뒤에는 ETag로 재검증됨
+RESULT_MAX_AGE = int(os.environ.get("RESULT_MAX_AGE", "86400"))
+
+# 버전(?v=내용 해시)이 붙은 정적 파일의 캐시 헤더
+STATIC_IMMUTABLE = "public, max-age=31536000, immutable"
+
+# 디스크 캐시 (PERSISTENT_CACHE 경로를 지정한 경우만, 줄 캐시에 없을 때 조회)
+# 인스턴스 재시작과 여러 워커 사이에서 공유되며 이미지 빌드 시 미리 채울 수 있음
+persistent_cache = persistent_cache_module.from_env()
+
+# 디스크 캐시 전용 스레드 (lifespan에서 생성)
+# SQLite 잠금 대기(여러 워커가 같은 파일에 쓸 때)가 이벤트 루프를 막지 않도록 조회/저장을 모두 이 스레드에서
+# 순서대로 실행 (스레드 하나이므로 연결도 하나, 저장 뒤의 조회는 저장한 결과를 봄)
+cache_executor: Optional[ThreadPoolExecutor] = None
+
+# 요청 하나의 입력 크기 상한 (0이면 제한 없음)
+MAX_TEXT_CHARS = int(os.environ.get("MAX_TEXT_CHARS", "100000"))
+MAX_LINES = int(os.environ.get("MAX_LINES", "5000"))
+
+# 이 글자 수보다 긴 줄은 문장/구절 경계에서 나눈 조각 단위로 캐시 조회/분석 (0이면 나누지 않음)
+# 나누는 곳은 analyze_unique_lines 한 곳이며, 서버의 extractor와 분석 워커는 받은 조각을 다시 나누지 않음
+SEGMENT_CHARS = int(os.environ.get("SEGMENT_CHARS", str(JapanesePronunciationExtractor.segment_chars)))
+
+# 비동기 작업 입력 크기 제한 (앨범/가사 모음용, 0이면 제한 없음)
+JOB_MAX_TEXT_CHARS = int(os.environ.get("JOB_MAX_TEXT_CHARS", "2000000"))
+JOB_MAX_LINES = int(os.environ.get("JOB_MAX_LINES", "100000"))
+
+# 요청 마감 시간 (대기 시간 포함, 밀리초, 0이면 제한 없음)
+REQUEST_TIMEOUT_MS = int(os.environ.get("REQUEST_TIMEOUT_MS", "10000"))
+
+# 분석 요청 수락 제어: 동시 실행 수, 대기 줄 길이, 대기 시간 상한 (MAX_ACTIVE_REQUESTS=0이면 제한 없음)
+# 요청 하나가 분석 워커 전체에 나눠지므로 동시 실행 수는 작게 두고 나머지는 짧게 대기시킨다
+admission = AdmissionLimiter(
+    max_active=int(os.environ.get("MAX_ACTIVE_REQUESTS", "4")),
+    max_queue=int(os.environ.get("MAX_QUEUED_REQUESTS", "16")),
+    queue_timeout=int(os.environ.get("QUEUE_TIMEOUT_MS", "2000")) / 1000,
+)
+
+# 시작 단계별 소요 시간 (밀리초)과 예열 완료 여부
+startup_timings: Dict[str, float] = {}
+ready = False
+
+# preload()로 fork 전에 부모 프로세스가 사전 로드와 예열을 마쳤는지 여부 (fork한 워커에 그대로 복사됨)
+preloaded = False
+
+
+@contextmanager
+def startup_phase(name: str) -> Iterator[None]:
+    """시작 단계 소요 시간을 기록하고 로그로 출력"""
+    start = time.perf_counter()
+    yield
+    elapsed = (time.perf_counter() - start) * 1000
+    startup_timings[name] = round(elapsed, 1)
+    logger.info("시작 단계 %s: %.1fms", name, elapsed)
+
+
+def load_warmup_lines() -> List[str]:
+    """예열용 가사 읽기 (파일이 없으면 빈 리스트)"""
+    try:
+        with open(WARMUP_CORPUS, encoding="utf-8") as f:
+            return [line.strip() for line in f if line.strip()]
+    except OSError:
+        logger.warning("예열용 가사 파일을 읽을 수 없습니다: %s", WARMUP_CORPUS)
+        return []
+
+
+def create_extractor() -> JapanesePronunciationExtractor:
+    """
+    환경 변수 설정으로 extractor 생성
+    MECAB_DICDIR: 사전 경로, 분석 설정 기본값: NBEST, MAX_CANDIDATES, LINE_TIME_LIMIT_MS
+    (긴 줄은 SEGMENT_CHARS로 analyze_unique_lines에서 나누므로 extractor는 나누지 않음)
+    """
+    return JapanesePronunciationExtractor(
+        os.environ.get("MECAB_DICDIR") or None,
+        nbest=int(os.environ.get("NBEST", "1")),
+        max_candidates=int(os.environ.get("MAX_CANDIDATES", "0")),
+        time_limit=int(os.environ.get("LINE_TIME_LIMIT_MS", "0")) / 1000,
+        segment_chars=0,
+    )
+
+
+def preload() -> None:
+    """
+    워커를 fork하기 전에 부모 프로세스에서 사전 로드와 예열 (server.py 다중 워커 모드)
+    워커의 lifespan은 이 extractor를 그대로 사용하므로 사전 로드와 예열 단계를 건너뛴다
+    """
+    global extractor, preloaded
+    with startup_phase("dictionary"):
+        extractor = create_extractor()
+    with startup_phase("preload"):
+        for text in load_warmup_lines():
+            extractor.analyze_sentence(text)
+        for name in ("main.html", "input.html", "edit.html", "output.html"):
+            templates.get_template(name)
+    # 예열 분석의 지표가 워커마다 복사되어 중복 집계되지 않도록 버림
+    metrics.REGISTRY.drain()
+    preloaded = True
+
+
+async def warm_up() -> None:
+    """
+    사전 페이지, 워커, 템플릿을 미리 데운 뒤 준비 완료로 표시
+    preload()한 부모에서 fork한 워커는 같은 extractor와 템플릿이 이미 데워져 있으므로 건너뛴다
+    (프로세스 백엔드의 분석 워커는 fork한 뒤 새로 뜨므로 예열)
+    """
+    global ready
+    try:
+        with startup_phase("warmup"):
+            if not preloaded or backend.kind == "process":
+                await backend.warmup(load_warmup_lines())
+                for name in ("main.html", "input.html", "edit.html", "output.html"):
+                    templates.get_template(name)
+    except Exception:
+        # 예열은 최선 노력: 실패해도 요청은 처리할 수 있으므로 준비 완료로 진행
+        logger.exception("예열 실패")
+    startup_timings["total"] = round((time.perf_counter() - MODULE_LOADED_AT) * 1000, 1)
+    ready = True
+    logger.info("준비 완료: 모듈 로드 후 %.1fms", startup_timings["total"])
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    시작: 사전 로드 (미리 로드하지 않은 경우) → 분석 백엔드 생성 → 예열 (미리 예열한 경우 건너뜀)
+    종료: 예열 취소, 작업 워커 중지, 분석 워커 풀 종료
+    """
+    global extractor, backend, job_manager, ready, cache_executor
+    
+    if persistent_cache is not None:
+        cache_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="persistent-cache")
+    
+    # MeCab 초기화 (preload()로 fork 전에 로드했으면 그대로 사용)
+    if extractor is None:
+        with startup_phase("dictionary"):
+            extractor = create_extractor()
+    logger.info("사전: %s (%s)", extractor.dictionary_id, extractor.features.dictionary_format)
+    
+    # 분석 실행 백엔드 (ANALYSIS_BACKEND=inline/thread/process, ANALYSIS_WORKERS=N)
+    with startup_phase("backend"):
+        backend = AnalysisBackend.from_env(extractor=extractor, segment_chars=0)
+    
+    job_manager = jobs.from_env(analyze_job_lines)
+    await job_manager.start()
+    
+    warmup_task = None
+    if WARMUP_MODE == "blocking":
+        await warm_up()
+    elif WARMUP_MODE == "off":
+        ready = True
+    else:
+        warmup_task = asyncio.ensure_future(warm_up())
+    
+    try:
+        yield
+    finally:
+        if warmup_task is not None:
+            warmup_task.cancel()
+        await job_manager.stop()
+        backend.shutdown()
+        if cache_executor is not None:
+            # 대기 중인 저장을 마치고 캐시 스레드의 연결을 닫음
+            cache_executor.submit(persistent_cache.close)
+            await asyncio.to_thread(cache_executor.shutdown)
+            cache_executor = None
+        ready = False
+
+
+app = FastAPI(title="일본어 가사 한글 변환기", lifespan=lifespan)
+
+# Accept-Encoding에 gzip이 있으면 큰 응답 압축 (스트리밍 응답은 청크마다 flush하므로 지연 없음)
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=int(os.environ.get("GZIP_MINIMUM_SIZE", "1024")),
+    compresslevel=int(os.environ.get("GZIP_LEVEL", "6")),
+)
+
+
+@app.exception_handler(Overloaded)
+async def overloaded_handler(request: Request, exc: Overloaded):
+    """수락 제어로 거절한 요청 (429/503, Retry-After 포함)"""
+    reason = "queue_full" if exc.status_code == 429 else "queue_timeout"
+    metrics.REQUESTS_REJECTED.inc(1, reason)
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"detail": exc.detail},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+@app.exception_handler(AnalysisTimeout)
+async def analysis_timeout_handler(request: Request, exc: AnalysisTimeout):
+    """요청 마감 시간 초과 (504)"""
+    metrics.REQUESTS_REJECTED.inc(1, "deadline")
+    return JSONResponse(status_code=504, content={"detail": timeout_message()})
+
+
+class VersionedStaticFiles(StaticFiles):
+    """
+    정적 파일 (static_url로 만든 ?v=내용 해시 URL은 1년 동안 캐시, 나머지는 매번 ETag로 재검증)
+    """
+    
+    async def get_response(self, path: str, scope) -> Response:
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            versioned = b"v=" in scope.get("query_string", b"")
+            response.headers["Cache-Control"] = STATIC_IMMUTABLE if versioned else "no-cache"
+        return response
+
+
+# 정적 파일 경로 → 내용 해시 (파일은 배포 단위로만 바뀌므로 처음 한 번만 계산)
+_static_versions: Dict[str, str] = {}
+
+
+def static_url(name: str) -> str:
+    """
+    템플릿에서 사용할 정적 파일 URL (내용이 바뀌면 URL도 바뀌도록 ?v=내용 해시)
+    
+    Args:
+        name: static 디렉터리 기준 파일 경로 (예: "api.js")
+        
+    Returns:
+        "/static/api.js?v=1a2b3c4d5e6f" 형식 URL
+    """
+    version = _static_versions.get(name)
+    if version is None:
+        with open(os.path.join("static", name), "rb") as f:
+            version = hashlib.sha256(f.read()).hexdigest()[:12]
+        _static_versions[name] = version
+    return f"/static/{name}?v={version}"
 
-app = FastAPI(title="일본어 가사 한글 변환기")
 
 # 정적 파일 및 템플릿 설정
-app.mount("/static", StaticFiles(directory="static"), name="static")
+app.mount("/static", VersionedStaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
+templates.env.globals["static_url"] = static_url
 
-# MeCab 초기화 (전역으로 한 번만)
-extractor = JapanesePronunciationExtractor()
+
+class AnalysisSettings(BaseModel):
+    """
+    요청별 분석 설정 (생략하면 서버 기본값)
+    fields는 후보에 계산해서 넣을 필드/프로필 이름 (예: ["hangul_pron", "pos1"], ["hangul"], 생략하면 전체)
+    """
+    nbest: Optional[int] = Field(None, ge=1, le=MAX_NBEST)
+    max_candidates: Optional[int] = Field(None, ge=0)
+    time_limit_ms: Optional[int] = Field(None, ge=0)
+    fields: Optional[Tuple[str, ...]] = None
+    
+    @field_validator("fields")
+    @classmethod
+    def check_fields(cls, value: Optional[Tuple[str, ...]]) -> Optional[Tuple[str, ...]]:
+        """필드/프로필 이름을 정규화 (알 수 없는 이름이면 422)"""
+        return None if value is None else normalize_fields(value)
+    
+    def to_options(self) -> AnalysisOptions:
+        """서버 기본값과 합쳐서 AnalysisOptions로 변환"""
+        default = extractor.default_options
+        return AnalysisOptions(
+            nbest=self.nbest if self.nbest is not None else default.nbest,
+            max_candidates=self.max_candidates if self.max_candidates is not None else default.max_candidates,
+            time_limit=self.time_limit_ms / 1000 if self.time_limit_ms is not None else default.time_limit,
+            fields=self.fields if self.fields is not None else default.fields,
+        )
 
 
-class ConvertRequest(BaseModel):
-    """변환 요청 모델"""
+class ConvertRequest(AnalysisSettings):
+    """변환 요청 모델 (format=compact이면 문자열 테이블 기반 압축 응답)"""
     text: str
     detail_mode: bool = False
+    format: Literal["json", "compact"] = "json"
+
+
+class RenderRequest(AnalysisSettings):
+    """렌더링 요청 모델 (출력 옵션 기본값은 출력 페이지와 동일, format=text이면 평문 응답)"""
+    text: str
+    use_hyphen: bool = True
+    add_space: bool = False
+    clarify_nn: bool = False
+    clarify_xts: bool = False
+    show_original: bool = False
+    format: Literal["json", "text"] = "json"
+    
+    def to_render_options(self) -> RenderOptions:
+        """출력 옵션을 RenderOptions로 변환"""
+        return RenderOptions(
+            use_hyphen=self.use_hyphen,
+            add_space=self.add_space,
+            clarify_nn=self.clarify_nn,
+            clarify_xts=self.clarify_xts,
+            show_original=self.show_original,
+        )
+
+
+class BatchDocument(BaseModel):
+    """일괄 변환 문서 (id는 클라이언트가 지정)"""
+    id: str
+    text: str
+
+
+class BatchConvertRequest(AnalysisSettings):
+    """일괄 변환 요청 모델"""
+    documents: List[BatchDocument]
+    detail_mode: bool = False
+
+
+class IncrementalConvertRequest(AnalysisSettings):
+    """
+    증분 변환 요청 모델
+    hashes는 줄마다 정규화된 줄의 해시(line_hash), texts에는 서버에 없을 수 있는 줄만 해시 → 원문으로 담는다
+    """
+    hashes: List[str]
+    texts: Dict[str, str] = {}
+    detail_mode: bool = False
+    format: Literal["json", "compact"] = "json"
+
+
+class JobRequest(AnalysisSettings):
+    """
+    비동기 작업 제출 요청 모델
+    text(문서 하나) 또는 documents(문서 여러 개) 중 하나, priority가 클수록 먼저 실행
+    """
+    text: Optional[str] = None
+    documents: Optional[List[BatchDocument]] = None
+    detail_mode: bool = False
+    priority: int = Field(0, ge=-100, le=100)
 
 
 class UpdateSelectionRequest(BaseModel):
@@ -36,6 +400,323 @@ class UpdateSelectionRequest(BaseModel):
     selected_id: int
 
 
+def timeout_message() -> str:
+    return f"분석 시간 제한({REQUEST_TIMEOUT_MS}ms)을 넘겼습니다. 입력을 나눠서 다시 시도하세요."
+
+
+def request_deadline() -> Optional[float]:
+    """요청 마감 time.monotonic() 시각 (REQUEST_TIMEOUT_MS=0이면 None)"""
+    return time.monotonic() + REQUEST_TIMEOUT_MS / 1000 if REQUEST_TIMEOUT_MS > 0 else None
+
+
+def remaining_time(deadline: Optional[float]) -> Optional[float]:
+    """마감까지 남은 시간 (초, 마감이 없으면 None)"""
+    return deadline - time.monotonic() if deadline is not None else None
+
+
+def check_input_size(line_count: int, char_count: int,
+                     max_chars: Optional[int] = None, max_lines: Optional[int] = None) -> None:
+    """
+    입력 크기 제한 확인
+    
+    Args:
+        line_count: 줄 수
+        char_count: 전체 글자 수
+        max_chars: 글자 수 상한 (None이면 MAX_TEXT_CHARS, 0이면 제한 없음)
+        max_lines: 줄 수 상한 (None이면 MAX_LINES, 0이면 제한 없음)
+        
+    Raises:
+        HTTPException: 제한을 넘으면 413
+    """
+    max_chars = MAX_TEXT_CHARS if max_chars is None else max_chars
+    max_lines = MAX_LINES if max_lines is None else max_lines
+    if max_chars and char_count > max_chars:
+        raise HTTPException(status_code=413, detail=f"입력이 너무 깁니다 ({char_count}자, 최대 {max_chars}자)")
+    if max_lines and line_count > max_lines:
+        raise HTTPException(status_code=413, detail=f"줄이 너무 많습니다 ({line_count}줄, 최대 {max_lines}줄)")
+
+
+def split_request_lines(text: str) -> List[str]:
+    """요청 텍스트를 줄로 나누고 입력 크기 제한 확인"""
+    lines = text.strip().split('\n')
+    check_input_size(len(lines), len(text))
+    return lines
+
+
+async def run_in_cache_thread(func, *args: Any) -> Any:
+    """디스크 캐시 작업을 캐시 전용 스레드에서 실행하고 결과 반환"""
+    return await asyncio.get_running_loop().run_in_executor(cache_executor, partial(func, *args))
+
+
+async def lookup_cached(texts: List[str], options: AnalysisOptions) -> Dict[str, Dict[str, Any]]:
+    """
+    정규화된 줄(또는 긴 줄의 조각)들을 메모리 캐시, 디스크 캐시 순서로 조회
+    (디스크 캐시는 캐시 전용 스레드에서 조회)
+    
+    Args:
+        texts: 정규화된 텍스트 리스트 (중복 없이)
+        options: 분석 설정
+        
+    Returns:
+        텍스트 → 분석 결과 딕셔너리 (찾은 것만)
+    """
+    found = {}
+    missing = []
+    for text in texts:
+        line_result = line_cache.get((extractor.dictionary_id, options, line_hash(text)))
+        # 메모리 캐시 키는 64비트 해시이므로 디스크 캐시(get_texts)처럼 원문까지 같아야 적중
+        if line_result is None or line_result["original_text"] != text:
+            missing.append(text)
+        else:
+            found[text] = line_result
+    
+    if missing and persistent_cache is not None:
+        # 메모리 캐시에 없는 줄은 디스크 캐시에서 한 번에 조회
+        stored = await run_in_cache_thread(persistent_cache.get_texts, extractor.dictionary_id, options, missing)
+        for text, line_result in stored.items():
+            line_cache.put((extractor.dictionary_id, options, line_hash(text)), line_result)
+        found.update(stored)
+    return found
+
+
+def store_results(items: List[Tuple[str, Dict[str, Any]]], options: AnalysisOptions) -> None:
+    """
+    분석 결과를 메모리/디스크 캐시에 저장
+    시간 제한으로 줄인 결과는 부하 상황에 따라 달라지므로 캐시하지 않음
+    디스크 저장은 캐시 전용 스레드에 넘기고 기다리지 않음 (응답이 SQLite 쓰기 잠금을 기다리지 않도록)
+    """
+    items = [(text, line_result) for text, line_result in items if not line_result.get("truncated")]
+    for text, line_result in items:
+        line_cache.put((extractor.dictionary_id, options, line_hash(text)), line_result)
+    if items and persistent_cache is not None:
+        cache_executor.submit(persistent_cache.put_many, extractor.dictionary_id, options, items)
+
+
+def split_segments(text: str) -> List[str]:
+    """
+    긴 줄을 분석 단위 조각으로 나누기 (SEGMENT_CHARS 이하 줄은 [text])
+    조각 끝의 공백도 토큰이 되므로 정규화하지 않고 빈 조각만 제외 (합친 결과가 줄 전체 분석과 같도록)
+    """
+    return [segment for segment in split_long_line(text, SEGMENT_CHARS) if segment]
+
+
+async def analyze_unique_lines(lines: List[str], options: AnalysisOptions,
+                               timer: Optional[StageTimer] = None,
+                               deadline: Optional[float] = None) -> Tuple[Dict[str, Dict[str, Any]], int]:
+    """
+    여러 줄의 고유한 텍스트를 분석 (캐시 적용, 중복 제거)
+    캐시에 없는 줄만 모아서 분석 백엔드에 한 번에 넘긴다
+    SEGMENT_CHARS보다 긴 줄은 문장/구절 경계에서 나눈 조각을 분석 단위로 삼고
+    (조각별 캐시, 워커 분산, 조각마다 마감 시각 확인) 결과를 줄 하나로 합친다
+    
+    Args:
+        lines: 입력 줄 리스트 (중복, 빈 줄 포함 가능)
+        options: 분석 설정
+        timer: 캐시 조회(cache)와 분석(analysis) 시간을 기록할 StageTimer
+        deadline: 분석 마감 time.monotonic() 시각 (None이면 제한 없음)
+        
+    Returns:
+        (정규화된 줄 → 분석 결과 딕셔너리, 실제로 분석한 줄 수 (긴 줄은 조각 수)) 튜플
+        
+    Raises:
+        AnalysisTimeout: 마감 시각을 넘긴 경우
+    """
+    started = time.perf_counter()
+    texts = list(dict.fromkeys(text for text in map(normalize_line, lines) if text))
+    found = await lookup_cached(texts, options)  # 정규화된 줄 → 분석 결과
+    pending = [text for text in texts if text not in found]
+    
+    # 분석 단위: 짧은 줄은 그대로, 긴 줄은 조각 (같은 조각은 한 번만)
+    segments_by_line = {
+        text: split_segments(text) for text in pending if SEGMENT_CHARS and len(text) > SEGMENT_CHARS
+    }
+    units = list(dict.fromkeys(unit for text in pending for unit in segments_by_line.get(text, [text])))
+    unit_results = {}
+    if segments_by_line:
+        # 캐시에 없는 긴 줄의 조각은 다른 줄에서 분석한 적이 있을 수 있으므로 조각 단위로 다시 조회
+        pending_set = set(pending)
+        unit_results = await lookup_cached([unit for unit in units if unit not in pending_set], options)
+    missing = [unit for unit in units if unit not in unit_results]
+    looked_up = time.perf_counter()
+    
+    analyzed = list(zip(missing, await backend.analyze(missing, options, deadline)))
+    unit_results.update(analyzed)
+    
+    merged = []
+    for text, segments in segments_by_line.items():
+        line_result = merge_segment_results(text, [unit_results[segment] for segment in segments])
+        unit_results[text] = line_result
+        merged.append((text, line_result))
+    store_results(analyzed + merged, options)
+    for text in pending:
+        found[text] = unit_results[text]
+    
+    if timer is not None:
+        timer.add("cache", looked_up - started)
+        timer.add("analysis", time.perf_counter() - looked_up)
+    if metrics.ENABLED and missing:
+        metrics.LINES_ANALYZED.inc(len(missing))
+    return found, len(missing)
+
+
+def build_line_results(lines: List[str], found: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    분석 결과를 입력 줄 순서대로 배치
+    
+    Args:
+        lines: 입력 줄 리스트
+        found: analyze_unique_lines가 반환한 분석 결과
+        
+    Returns:
+        줄별 분석 결과 리스트
+    """
+    result = []
+    for line_text in lines:
+        text = normalize_line(line_text)
+        if not text:
+            # 빈 줄은 빈 단어 리스트로
+            result.append({
+                "original_text": line_text,
+                "word_count": 0,
+                "words": []
+            })
+        else:
+            result.append(found[text])
+    
+    return result
+
+
+async def analyze_lines(lines: List[str], options: AnalysisOptions,
+                        timer: Optional[StageTimer] = None,
+                        deadline: Optional[float] = None) -> List[Dict[str, Any]]:
+    """
+    여러 줄을 분석 (캐시 및 요청 내 중복 제거 적용)
+    
+    Args:
+        lines: 입력 줄 리스트
+        options: 분석 설정
+        timer: 단계별 시간을 기록할 StageTimer
+        deadline: 분석 마감 time.monotonic() 시각 (None이면 제한 없음)
+        
+    Returns:
+        줄별 분석 결과 리스트 (입력 순서 유지)
+    """
+    found, _ = await analyze_unique_lines(lines, options, timer, deadline)
+    return build_line_results(lines, found)
+
+
+async def analyze_job_lines(lines: List[str], options: Tuple[Any, ...]) -> List[Dict[str, Any]]:
+    """비동기 작업 워커용 줄 분석 (캐시 적용, 요청 마감 시각 없음)"""
+    options = AnalysisOptions(*options)
+    # SQLite 작업 저장소는 설정을 JSON으로 저장하므로 fields가 리스트로 돌아옴 (캐시 키는 튜플)
+    return await analyze_lines(lines, options._replace(fields=tuple(options.fields)))
+
+
+def encode_lines_response(result: List[Dict[str, Any]], detail_mode: bool, output_format: str,
+                          options: AnalysisOptions, **extra: Any) -> Response:
+    """
+    변환 결과 응답 생성 (compact이면 압축 형식)
+    
+    Args:
+        result: 줄별 분석 결과 리스트
+        detail_mode: 상세 모드 여부
+        output_format: json 또는 compact
+        options: 결과를 분석한 설정 (compact 형식의 후보 필드)
+        extra: 응답에 추가할 최상위 필드 (예: stats)
+        
+    Returns:
+        JSON 응답
+    """
+    if output_format == "compact":
+        payload = encode_compact(result, options.fields or CANDIDATE_FIELDS, detail_mode=detail_mode, **extra)
+        return Response(content=dumps(payload), media_type="application/json")
+    return JSONResponse(content={"lines": result, "detail_mode": detail_mode, **extra})
+
+
+# 분석 결과와 응답 형식을 정하는 모듈 (소스가 바뀐 배포에서는 GET /api/result의 ETag도 바뀜)
+RESULT_MODULES = ("japanese_pron", "japanese_script", "hangul_helper", "mecab_features",
+                  "lattice_index", "compact_format")
+_result_version: Optional[str] = None
+
+
+def result_version() -> str:
+    """RESULT_MODULES 소스 파일의 내용 해시 (처음 호출할 때 한 번만 계산)"""
+    global _result_version
+    if _result_version is None:
+        digest = hashlib.sha256()
+        for name in RESULT_MODULES:
+            with open(importlib.import_module(name).__file__, "rb") as f:
+                digest.update(f.read())
+        _result_version = digest.hexdigest()[:12]
+    return _result_version
+
+
+def result_etag(doc_hash: str, options: AnalysisOptions, output_format: str, detail_mode: bool) -> str:
+    """
+    변환 결과의 약한 ETag
+    결과는 문서 내용, 사전, 분석 코드(result_version), 분석 설정, 응답 형식으로 정해지므로
+    분석하지 않고도 계산할 수 있다
+    (GZipMiddleware가 Accept-Encoding에 따라 같은 ETag로 gzip/원본 표현을 보내므로 바이트 단위로 같다는
+    강한 ETag 대신 W/ 사용)
+    
+    Returns:
+        W/"..." 형식 ETag 문자열
+    """
+    key = (f"{doc_hash}|{extractor.dictionary_id}|{result_version()}|{options_key(options)}|"
+           f"{output_format}|{int(detail_mode)}")
+    return 'W/"' + hashlib.sha256(key.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def result_location(doc_hash: str, settings: "AnalysisSettings", output_format: str, detail_mode: bool) -> str:
+    """같은 결과를 GET으로 다시 받을 수 있는 /api/result URL (기본값이 아닌 설정만 쿼리에 포함)"""
+    params = [f"format={output_format}"]
+    if detail_mode:
+        params.append("detail_mode=true")
+    for name in ("nbest", "max_candidates", "time_limit_ms"):
+        value = getattr(settings, name)
+        if value is not None:
+            params.append(f"{name}={value}")
+    if settings.fields:
+        params.append(f"fields={','.join(settings.fields)}")
+    return f"/api/result/{doc_hash}?{'&'.join(params)}"
+
+
+def remember_document(lines: Iterable[str]) -> str:
+    """
+    변환한 문서를 GET /api/result로 다시 조회할 수 있도록 보관
+    
+    Args:
+        lines: 요청 줄 또는 분석 결과의 original_text 리스트
+        
+    Returns:
+        문서 해시
+    """
+    document = normalize_document(lines)
+    doc_hash = document_hash(document)
+    document_store.put(doc_hash, document)
+    return doc_hash
+
+
+def etag_matches(request: Request, etag: str, exists: bool) -> bool:
+    """
+    If-None-Match 헤더가 etag와 일치하는지 여부
+    If-None-Match는 약한 비교이므로 W/ 유무와 관계없이 따옴표 안의 값이 같으면 일치
+    
+    Args:
+        request: 요청
+        etag: 현재 결과의 ETag (result_etag)
+        exists: 결과를 만들 문서가 저장소에 있는지 여부 ("*"는 있을 때만 일치)
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [value.strip() for value in header.split(",")]
+    if exists and "*" in candidates:
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    return any((candidate[2:] if candidate.startswith("W/") else candidate) == opaque for candidate in candidates)
+
+
 @app.get("/", response_class=HTMLResponse)
 async def main_page(request: Request):
     """메인 페이지"""
@@ -65,29 +746,322 @@ async def convert_text(request: ConvertRequest):
     """
     일본어 텍스트를 한글로 변환
     여러 줄 입력을 받아서 각 줄마다 분석
+    단계별 처리 시간은 Server-Timing 헤더로 반환 (cache, analysis, serialize, total; 밀리초)
+    """
+    timer = StageTimer()
+    deadline = request_deadline()
+    lines = split_request_lines(request.text)
+    options = request.to_options()
+    async with admission.admit(remaining_time(deadline)):
+        result = await analyze_lines(lines, options, timer, deadline)
+    
+    with timer.stage("serialize"):
+        response = encode_lines_response(result, request.detail_mode, request.format, options)
+    
+    # 같은 결과를 GET으로 다시 받을 수 있는 주소 (브라우저/CDN 캐시 가능, ETag는 GET 응답에만)
+    doc_hash = remember_document(lines)
+    response.headers["Content-Location"] = result_location(doc_hash, request, request.format, request.detail_mode)
+    response.headers["Server-Timing"] = timer.finish("convert", sum(1 for line in lines if line.strip()))
+    return response
+
+
+@app.get("/api/result/{doc_hash}")
+async def get_result(
+    request: Request,
+    doc_hash: str,
+    format: Literal["json", "compact"] = "json",
+    detail_mode: bool = False,
+    nbest: Optional[int] = Query(None, ge=1, le=MAX_NBEST),
+    max_candidates: Optional[int] = Query(None, ge=0),
+    time_limit_ms: Optional[int] = Query(None, ge=0),
+    fields: Optional[str] = None,
+):
+    """
+    내용 주소 방식의 변환 결과 조회
+    doc_hash는 정규화된 문서의 해시(line_cache.document_hash)이며, 서버가 변환한 적이 있는 문서만 조회된다
+    (POST /api/convert 응답의 Content-Location과 같은 URL, 없으면 404이므로 POST로 변환)
+    
+    - If-None-Match가 ETag와 같으면 분석하지 않고 304
+    - 응답은 RESULT_MAX_AGE초 동안 공개 캐시 가능 (브라우저/CDN)
+    - 시간 제한으로 줄인 줄이 있으면 결과가 부하에 따라 달라지므로 ETag 없이 no-store
+    """
+    try:
+        field_names = normalize_fields(fields.split(",")) if fields else None
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    settings = AnalysisSettings(nbest=nbest, max_candidates=max_candidates, time_limit_ms=time_limit_ms,
+                                fields=field_names)
+    options = settings.to_options()
+    etag = result_etag(doc_hash, options, format, detail_mode)
+    cache_headers = {"ETag": etag, "Cache-Control": f"public, max-age={RESULT_MAX_AGE}"}
+    
+    # ETag는 내용 해시로 계산하므로 문서가 저장소에서 밀려났어도 같은 ETag의 재검증에는 응답 가능
+    # ("*"는 어떤 결과든 있으면 일치이므로 문서가 있을 때만)
+    document = document_store.get(doc_hash)
+    if etag_matches(request, etag, document is not None):
+        return Response(status_code=304, headers=cache_headers)
+    
+    if document is None:
+        return JSONResponse(
+            status_code=404,
+            content={"detail": "저장된 문서가 없습니다. POST /api/convert로 변환하세요."},
+            headers={"Cache-Control": "no-store"},
+        )
+    
+    timer = StageTimer()
+    deadline = request_deadline()
+    lines = document.split("\n")
+    async with admission.admit(remaining_time(deadline)):
+        result = await analyze_lines(lines, options, timer, deadline)
+    
+    with timer.stage("serialize"):
+        response = encode_lines_response(result, detail_mode, format, options)
+    
+    if any(line_result.get("truncated") for line_result in result):
+        response.headers["Cache-Control"] = "no-store"
+    else:
+        response.headers.update(cache_headers)
+    response.headers["Server-Timing"] = timer.finish("result", sum(1 for line in lines if line))
+    return response
+
+
+@app.post("/api/render")
+async def render_text(request: RenderRequest):
+    """
+    일본어 텍스트를 최종 한글 텍스트로 변환
+    출력 페이지와 같은 규칙으로 서버에서 렌더링하여 줄 단위 문자열만 반환
+    """
+    deadline = request_deadline()
+    lines = split_request_lines(request.text)
+    async with admission.admit(remaining_time(deadline)):
+        result = await analyze_lines(lines, request.to_options(), deadline=deadline)
+    output_lines = render_lines(result, request.to_render_options())
+    
+    if request.format == "text":
+        return PlainTextResponse("\n".join(output_lines))
+    
+    return JSONResponse(content={"lines": output_lines})
+
+
+@app.post("/api/convert_incremental")
+async def convert_incremental(request: IncrementalConvertRequest):
+    """
+    일본어 텍스트를 한글로 변환 (증분)
+    해시만 보낸 줄은 서버의 결과 저장소에서 꺼내고, 원문을 보낸 줄만 분석
+    저장소에서 밀려난 줄이 있으면 분석하지 않고 409와 {"missing": [해시...]}를 반환하므로
+    클라이언트는 해당 줄의 원문을 채워서 다시 요청한다
     """
-    lines = request.text.strip().split('\n')
+    options = request.to_options()
+    deadline = request_deadline()
+    check_input_size(len(request.hashes), sum(len(text) for text in request.texts.values()))
+    
+    # 원문이 있는 줄은 일반 변환과 같은 경로로 분석 (저장소 키는 서버가 계산한 해시)
+    async with admission.admit(remaining_time(deadline)):
+        found, analyzed_count = await analyze_unique_lines(
+            list(request.texts.values()), options, deadline=deadline)
+    by_hash = {
+        client_hash: found.get(normalize_line(text))
+        for client_hash, text in request.texts.items()
+    }
+    
+    missing = []
+    for client_hash in request.hashes:
+        if client_hash in by_hash or client_hash == EMPTY_LINE_HASH:
+            continue
+        line_result = line_cache.get((extractor.dictionary_id, options, client_hash))
+        by_hash[client_hash] = line_result
+        if line_result is None:
+            missing.append(client_hash)
+    
+    if missing and persistent_cache is not None:
+        stored = await run_in_cache_thread(persistent_cache.get_many, extractor.dictionary_id, options, missing)
+        for client_hash, (_, line_result) in stored.items():
+            line_cache.put((extractor.dictionary_id, options, client_hash), line_result)
+            by_hash[client_hash] = line_result
+        missing = [client_hash for client_hash in missing if client_hash not in stored]
+    
+    if missing:
+        return JSONResponse(status_code=409, content={"missing": missing})
+    
     result = []
+    for client_hash in request.hashes:
+        line_result = by_hash.get(client_hash)
+        if line_result is None:
+            # 빈 줄
+            line_result = {"original_text": "", "word_count": 0, "words": []}
+        result.append(line_result)
     
-    for line_text in lines:
-        if not line_text.strip():
-            # 빈 줄은 빈 단어 리스트로
-            result.append({
-                "original_text": line_text,
-                "word_count": 0,
-                "words": []
-            })
-        else:
-            # 각 줄을 분석
-            line_result = extractor.analyze_sentence(line_text.strip())
-            result.append(line_result)
+    stats = {
+        "lines": len(result),
+        "analyzed_lines": analyzed_count,
+    }
+    
+    response = encode_lines_response(result, request.detail_mode, request.format, options, stats=stats)
+    
+    # 클라이언트가 보낸 해시는 믿지 않고 결과의 원문으로 문서 해시를 계산
+    doc_hash = remember_document(line_result["original_text"] for line_result in result)
+    response.headers["Content-Location"] = result_location(doc_hash, request, request.format, request.detail_mode)
+    return response
+
+
+@app.post("/api/convert_batch")
+async def convert_batch(request: BatchConvertRequest):
+    """
+    여러 문서(곡)를 한 번에 변환
+    문서 전체에서 같은 줄은 한 번만 분석하고 문서별 결과로 나눠서 반환
+    """
+    deadline = request_deadline()
+    doc_lines = [document.text.strip().split('\n') for document in request.documents]
+    all_lines = [line_text for lines in doc_lines for line_text in lines]
+    check_input_size(len(all_lines), sum(len(document.text) for document in request.documents))
+    
+    async with admission.admit(remaining_time(deadline)):
+        found, analyzed_count = await analyze_unique_lines(all_lines, request.to_options(), deadline=deadline)
+    
+    documents = [
+        {"id": document.id, "lines": build_line_results(lines, found)}
+        for document, lines in zip(request.documents, doc_lines)
+    ]
     
     return JSONResponse(content={
-        "lines": result,
-        "detail_mode": request.detail_mode
+        "documents": documents,
+        "detail_mode": request.detail_mode,
+        "stats": {
+            "documents": len(documents),
+            "total_lines": sum(1 for line_text in all_lines if normalize_line(line_text)),
+            "unique_lines": len(found),
+            "analyzed_lines": analyzed_count,
+        }
     })
 
 
+@app.post("/api/jobs", status_code=202)
+async def submit_job(request: JobRequest):
+    """
+    비동기 변환 작업 제출 (요청 시간 제한 안에 끝나지 않는 앨범/가사 모음용)
+    작업 상태를 바로 반환하고, Location 헤더의 주소로 진행률을 조회
+    """
+    if (request.text is None) == (request.documents is None):
+        raise HTTPException(status_code=422, detail="text와 documents 중 하나만 지정하세요")
+    if request.text is not None:
+        documents = [("0", request.text.strip().split('\n'))]
+        char_count = len(request.text)
+    else:
+        documents = [(document.id, document.text.strip().split('\n')) for document in request.documents]
+        char_count = sum(len(document.text) for document in request.documents)
+    check_input_size(sum(len(lines) for _, lines in documents), char_count, JOB_MAX_TEXT_CHARS, JOB_MAX_LINES)
+    
+    job = job_manager.submit(documents, request.to_options(), request.detail_mode, request.priority)
+    return JSONResponse(status_code=202, content=job.to_dict(), headers={"Location": f"/api/jobs/{job.id}"})
+
+
+@app.get("/api/jobs")
+async def job_stats():
+    """상태별 작업 수와 작업 워커 설정"""
+    return job_manager.stats()
+
+
+def find_job(job_id: str) -> jobs.Job:
+    """작업 조회 (없거나 TTL이 지나 삭제된 작업이면 404)"""
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업이 없습니다 (끝난 작업은 일정 시간 후 삭제됨)")
+    return job
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str):
+    """작업 상태와 진행률 (lines_done / total_lines)"""
+    return find_job(job_id).to_dict()
+
+
+@app.get("/api/jobs/{job_id}/result")
+async def get_job_result(job_id: str, offset: int = Query(0, ge=0)):
+    """
+    작업 결과 (진행 중이면 지금까지 끝난 줄까지)
+    offset을 주면 작업 전체에서 offset번째 줄부터 반환 (이전 조회 이후 새로 끝난 줄만 받을 때)
+    """
+    job = find_job(job_id)
+    return {
+        "job": job.to_dict(),
+        "detail_mode": job.detail_mode,
+        "offset": offset,
+        "documents": job_manager.document_results(job, offset),
+    }
+
+
+@app.delete("/api/jobs/{job_id}")
+async def cancel_job(job_id: str):
+    """작업 취소 (실행 중이면 지금 분석 중인 묶음이 끝난 뒤 멈춤, 끝난 줄의 결과는 TTL 동안 조회 가능)"""
+    job = job_manager.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업이 없습니다 (끝난 작업은 일정 시간 후 삭제됨)")
+    return job.to_dict()
+
+
+async def stream_lines(lines: List[str], options: AnalysisOptions,
+                       deadline: Optional[float] = None) -> AsyncIterator[str]:
+    """
+    줄별 분석 결과를 NDJSON(한 줄에 JSON 객체 하나)으로 순서대로 생성
+    동시에 분석 중인 줄은 워커 수만큼으로 제한하여 요청당 메모리를 일정하게 유지
+    마감 시각을 넘기면 {"error": ...} 객체 한 줄을 보내고 끝낸다 (이미 200을 보낸 뒤이므로)
+    
+    Args:
+        lines: 입력 줄 리스트
+        options: 분석 설정
+        deadline: 분석 마감 time.monotonic() 시각 (None이면 제한 없음)
+        
+    Yields:
+        줄 분석 결과 JSON 문자열 (개행 포함)
+    """
+    window = max(1, backend.workers)
+    pending = deque()
+    
+    try:
+        for line_text in lines:
+            pending.append(asyncio.ensure_future(analyze_lines([line_text], options, deadline=deadline)))
+            if len(pending) >= window:
+                line_result = (await pending.popleft())[0]
+                yield json.dumps(line_result, ensure_ascii=False) + "\n"
+        
+        while pending:
+            line_result = (await pending.popleft())[0]
+            yield json.dumps(line_result, ensure_ascii=False) + "\n"
+    except AnalysisTimeout:
+        metrics.REQUESTS_REJECTED.inc(1, "deadline")
+        yield json.dumps({"error": timeout_message()}, ensure_ascii=False) + "\n"
+    finally:
+        # 클라이언트 연결이 끊기거나 마감 시각을 넘긴 경우 남은 분석 취소
+        for task in pending:
+            task.cancel()
+
+
+class AdmittedStreamingResponse(StreamingResponse):
+    """
+    수락 제어 실행 슬롯을 잡은 채 보내는 스트리밍 응답
+    응답이 끝나거나 연결이 끊기면 슬롯 반환 (본문 생성기가 시작되지 않은 경우 포함)
+    """
+    
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            admission.release()
+
+
+@app.post("/api/convert/stream")
+async def convert_text_stream(request: ConvertRequest):
+    """
+    일본어 텍스트를 한글로 변환 (스트리밍)
+    각 줄의 분석이 끝나는 대로 NDJSON 한 줄씩 전송
+    """
+    deadline = request_deadline()
+    lines = split_request_lines(request.text)
+    await admission.acquire(remaining_time(deadline))
+    return AdmittedStreamingResponse(
+        stream_lines(lines, request.to_options(), deadline), media_type="application/x-ndjson")
+
+
 @app.post("/api/update_selection")
 async def update_selection(request: UpdateSelectionRequest):
     """
@@ -102,12 +1076,54 @@ async def update_selection(request: UpdateSelectionRequest):
     })
 
 
+@app.get("/api/cache_stats")
+async def cache_stats():
+    """줄 캐시 통계 (디스크 캐시를 사용하면 persistent에 디스크 캐시 통계 포함)"""
+    stats = line_cache.stats()
+    if persistent_cache is not None:
+        stats["persistent"] = persistent_cache.stats()
+    return stats
+
+
+@app.get("/metrics")
+async def metrics_endpoint():
+    """
+    Prometheus 형식 지표
+    줄 단위 분석 단계별 시간, 줄당 단어/후보 수, 요청 단계별 시간, 줄 캐시 상태
+    """
+    stats = line_cache.stats()
+    for stat in ("size", "hits", "misses", "evictions"):
+        metrics.LINE_CACHE.set(stats[stat], stat)
+    if persistent_cache is not None:
+        persistent_stats = persistent_cache.stats()
+        for stat in ("hits", "misses", "errors"):
+            metrics.PERSISTENT_CACHE.set(persistent_stats[stat], stat)
+    admission_stats = admission.stats()
+    for stat in ("active", "waiting"):
+        metrics.ADMISSION.set(admission_stats[stat], stat)
+    for status, count in job_manager.store.counts().items():
+        metrics.JOBS.set(count, status)
+    return PlainTextResponse(metrics.REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+
 @app.get("/api/health")
 async def health_check():
     """헬스 체크"""
     return {"status": "ok"}
 
 
+@app.get("/api/ready")
+async def readiness_check():
+    """
+    준비 상태 확인 (예열이 끝나기 전에는 503)
+    시작 단계별 소요 시간(밀리초)을 함께 반환
+    """
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"ready": ready, "startup": startup_timings},
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+콜드 스타트 벤치마크
+uvicorn 서버 프로세스를 새로 띄워서 첫 /api/convert 응답까지 걸린 시간과
+첫 요청/두 번째 요청의 지연 시간을 예열 방식(WARMUP)별로 측정
+
+사용법: python benchmarks/bench_cold_start.py [--runs N] [--backend thread|process]
+"""
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TEXT = "心が僕らには最高で\n燃えていて歌っている\n息を繋ぐ僕らの声は何を望む"
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def request(url, body=None):
+    """(상태 코드, 응답 시간(초), 응답 JSON) - 연결 실패 시 상태 코드 None"""
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req, timeout=30) as response:
+            payload = json.loads(response.read())
+            return response.status, time.perf_counter() - start, payload
+    except urllib.error.HTTPError as error:
+        return error.code, time.perf_counter() - start, json.loads(error.read() or b"null")
+    except OSError:
+        return None, time.perf_counter() - start, None
+
+
+def measure(warmup, backend):
+    """서버를 한 번 띄워서 시간 측정"""
+    port = free_port()
+    env = dict(os.environ, WARMUP=warmup, ANALYSIS_BACKEND=backend, LINE_CACHE_SIZE="0")
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT, env=env,
+    )
+    base = f"http://127.0.0.1:{port}"
+    try:
+        # 서버가 연결을 받을 때까지 대기
+        while request(f"{base}/api/health")[0] is None:
+            if server.poll() is not None:
+                raise RuntimeError("서버 시작 실패")
+            time.sleep(0.01)
+        listening = time.perf_counter() - started
+
+        # 준비 완료까지 대기 (background 예열이면 연결 후에도 잠시 503)
+        while True:
+            status, _, ready_info = request(f"{base}/api/ready")
+            if status == 200:
+                break
+            time.sleep(0.01)
+        ready = time.perf_counter() - started
+
+        _, first, _ = request(f"{base}/api/convert", {"text": TEXT})
+        _, second, _ = request(f"{base}/api/convert", {"text": TEXT})
+        return listening, ready, first, second, ready_info["startup"]
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="콜드 스타트 벤치마크")
+    parser.add_argument("--runs", type=int, default=3, help="예열 방식별 반복 횟수 (기본 3)")
+    parser.add_argument("--backend", default="thread", help="ANALYSIS_BACKEND (기본 thread)")
+    args = parser.parse_args()
+
+    print(f"{'예열':<11} {'연결 가능(ms)':>13} {'준비(ms)':>9} {'첫 요청(ms)':>11} {'두 번째(ms)':>11}  시작 단계")
+    for warmup in ("off", "background", "blocking"):
+        for _ in range(args.runs):
+            listening, ready, first, second, phases = measure(warmup, args.backend)
+            print(f"{warmup:<11} {listening * 1000:>13.1f} {ready * 1000:>9.1f} "
+                  f"{first * 1000:>11.1f} {second * 1000:>11.1f}  {phases}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+/api/convert 응답 형식 벤치마크: 기존 JSON vs 압축(문자열 테이블) 형식
+응답 크기(원본/gzip)와 직렬화 시간을 비교
+
+사용법: python benchmarks/bench_compact_format.py [가사 파일]
+"""
+
+import gzip
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from japanese_pron import JapanesePronunciationExtractor  # noqa: E402
+from compact_format import encode_compact, decode_compact, dumps, orjson  # noqa: E402
+
+
+DEFAULT_LINES = [
+    "心が僕らには最高で",
+    "燃えていて歌っている",
+    "息を繋ぐ僕らの声は何を望む",
+    "深い海の底で響く鼓動",
+    "",
+    "一人きりで泣いていた日々を忘れない",
+    "遠い空の向こうに行きたいんだ",
+    "心が僕らには最高で",
+    "燃えていて歌っている",
+]
+
+
+def measure(func, repeat=50):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return result, (time.perf_counter() - start) / repeat
+
+
+def main():
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], encoding="utf-8") as f:
+            lines = f.read().strip().split("\n")
+    else:
+        lines = DEFAULT_LINES * 10
+
+    extractor = JapanesePronunciationExtractor()
+    results = [
+        extractor.analyze_sentence(line.strip()) if line.strip()
+        else {"original_text": line, "word_count": 0, "words": []}
+        for line in lines
+    ]
+    payload = {"lines": results, "detail_mode": False}
+
+    plain, plain_time = measure(lambda: json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+    compact, compact_time = measure(lambda: dumps(encode_compact(results, detail_mode=False)))
+    assert decode_compact(json.loads(compact)) == payload
+
+    text_size = len("\n".join(lines).encode("utf-8"))
+    print(f"입력: {len(lines)}줄, {text_size} bytes (JSON 인코더: {'orjson' if orjson else 'json'})")
+    print(f"{'형식':8} {'크기':>10} {'gzip':>8} {'입력 대비':>8} {'직렬화(ms)':>10}")
+    for name, body, elapsed in (("json", plain, plain_time), ("compact", compact, compact_time)):
+        print(f"{name:8} {len(body):>10} {len(gzip.compress(body)):>8} "
+              f"{len(body) / text_size:>7.1f}x {elapsed * 1000:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+분석 결과 데이터 모델 벤치마크
+줄당 처리 시간, 분석 중 최대 메모리, 결과를 들고 있을 때의 메모리 블록 수/크기를 측정
+(내부 표현 Token/Candidate와 API 경계의 딕셔너리 표현을 각각 측정)
+
+사용법: python benchmarks/bench_data_model.py [가사 파일]
+"""
+
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from japanese_pron import JapanesePronunciationExtractor, AnalysisOptions  # noqa: E402
+
+
+DEFAULT_LINES = [
+    "心が僕らには最高で",
+    "燃えていて歌っている",
+    "息を繋ぐ僕らの声は何を望む",
+    "深い海の底で響く鼓動",
+    "一人きりで泣いていた日々を忘れない",
+    "遠い空の向こうに行きたいんだ",
+    "東京タワーから見下ろした街並み",
+    "彼女は静かに窓の外を見つめていた",
+    "春夏秋冬、繰り返す季節の中で",
+    "ずっとずっといっしょにいたいよ",
+    "Oh yeah, come on! Let's go!",
+    "どうしようもないくらい好きなんです",
+]
+
+
+def measure_time(func, lines, repeat):
+    """줄당 평균 처리 시간(초)"""
+    func(lines[0])  # 예열
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for line in lines:
+            func(line)
+    return (time.perf_counter() - start) / (repeat * len(lines))
+
+
+def measure_memory(func, lines):
+    """(분석 중 최대 메모리, 유지 중인 결과의 블록 수, 크기) - 모두 줄당 값"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    results = [func(line) for line in lines]
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in stats)
+    size = sum(stat.size_diff for stat in stats)
+    del results
+    count = len(lines)
+    return peak / count, blocks / count, size / count
+
+
+def main():
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], encoding="utf-8") as f:
+            lines = [line.strip() for line in f if line.strip()]
+    else:
+        lines = DEFAULT_LINES
+
+    extractor = JapanesePronunciationExtractor()
+    options = AnalysisOptions(nbest=1)
+
+    targets = [("analyze_sentence (dict)", lambda line: extractor.analyze_sentence(line, options))]
+    if hasattr(extractor, "analyze_tokens"):
+        targets.append(("analyze_tokens (Token)", lambda line: extractor.analyze_tokens(line, options)))
+
+    print(f"{'대상':<24} {'줄당(ms)':>9} {'최대 메모리(KB)':>15} {'유지 블록':>9} {'유지 크기(KB)':>13}")
+    for name, func in targets:
+        elapsed = measure_time(func, lines, repeat=50)
+        # 파싱 캐시 등 처음 한 번만 할당되는 메모리는 제외
+        for line in lines:
+            func(line)
+        peak, blocks, size = measure_memory(func, lines)
+        print(f"{name:<24} {elapsed * 1000:>9.3f} {peak / 1024:>15.1f} {blocks:>9.0f} {size / 1024:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
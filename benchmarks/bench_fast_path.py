@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+한자 없는 단어 빠른 경로 벤치마크
+문자 구성별(가나 위주, 한자 위주, 혼합, 라틴/기호) 줄당 처리 시간을
+빠른 경로 사용/미사용으로 비교하고 두 결과가 같은지 확인
+
+사용법: python benchmarks/bench_fast_path.py [--nbest N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from japanese_pron import JapanesePronunciationExtractor, AnalysisOptions  # noqa: E402
+
+
+CORPORA = {
+    "가나 위주": [
+        "ずっとずっといっしょにいたいよ",
+        "キラキラひかるおほしさま",
+        "ねえ、きいてよ、きょうはね",
+        "ラララ、ルルル、どこまでも",
+        "あいしてる、あいしてるって",
+        "ドキドキがとまらないの",
+        "さよならなんていわないで",
+        "もういちど、もういちどだけ",
+    ],
+    "한자 위주": [
+        "春夏秋冬、繰り返す季節の中で",
+        "心臓の鼓動が響く夜明け前",
+        "永遠の約束を交わした日",
+        "東京湾岸線を走り抜ける",
+        "一期一会の出会いに感謝",
+        "運命論者の憂鬱な午後",
+        "満天の星空に願いを込めて",
+        "愛情表現不足の恋人達",
+    ],
+    "혼합": [
+        "心が僕らには最高で",
+        "燃えていて歌っている",
+        "息を繋ぐ僕らの声は何を望む",
+        "一人きりで泣いていた日々を忘れない",
+        "遠い空の向こうに行きたいんだ",
+        "どうしようもないくらい好きなんです",
+        "きっと明日はいい天気になるでしょう",
+        "君のことを思い出すたびに",
+    ],
+    "라틴/기호": [
+        "Oh yeah, come on! Let's go!",
+        "I love you baby (I love you)",
+        "♪ La la la ♪ ~ Na na na ~",
+        "Hey! Hey! Ho! 1, 2, 3, 4!",
+        "Don't stop the music, baby",
+        "ABCDEFG... & more!!",
+        "Shining star, shine on me ☆",
+        "Yeah yeah yeah — woo!",
+    ],
+}
+
+
+def measure(extractor, lines, options, repeat):
+    """줄당 평균 처리 시간(초)과 마지막 결과"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        results = [extractor.analyze_sentence(line, options) for line in lines]
+    return (time.perf_counter() - start) / (repeat * len(lines)), results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="한자 없는 단어 빠른 경로 벤치마크")
+    parser.add_argument("--nbest", type=int, default=1, help="N-best 경로 수 (기본 1)")
+    parser.add_argument("--repeat", type=int, default=50, help="반복 횟수 (기본 50)")
+    args = parser.parse_args()
+
+    extractor = JapanesePronunciationExtractor()
+    options = AnalysisOptions(nbest=args.nbest)
+    mismatches = 0
+
+    print(f"{'구성':<10} {'전체 탐색(ms)':>13} {'빠른 경로(ms)':>13} {'향상':>7}")
+    for name, lines in CORPORA.items():
+        extractor.kana_fast_path = False
+        measure(extractor, lines, options, 1)  # 예열
+        full_time, full_results = measure(extractor, lines, options, args.repeat)
+
+        extractor.kana_fast_path = True
+        fast_time, fast_results = measure(extractor, lines, options, args.repeat)
+
+        if fast_results != full_results:
+            mismatches += 1
+            print(f"{name}: 결과 불일치")
+
+        print(f"{name:<10} {full_time * 1000:>13.3f} {fast_time * 1000:>13.3f} {full_time / fast_time:>6.2f}x")
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+후보 필드 지정(AnalysisOptions.fields) 벤치마크
+필드 조합마다 analyze_sentence 시간(줄당 us)과 /api/convert 응답 크기(JSON 원본/gzip, compact 형식)를 비교
+
+- full: 기존 응답 (후보마다 히라가나/카타카나 변환 4개, 한글 변환 2개, 품사 3개)
+- 필드를 지정하면 지정한 필드만 계산하고 직렬화
+- 분석 시간에는 MeCab 파싱과 lattice 탐색이 포함되므로 줄어드는 것은 후보 생성과 딕셔너리 변환 부분
+
+사용법: python benchmarks/bench_fields.py [--nbest N] [--repeat N] [가사 파일]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("METRICS", "0")
+
+from japanese_pron import AnalysisOptions, JapanesePronunciationExtractor, normalize_fields  # noqa: E402
+from compact_format import CANDIDATE_FIELDS, dumps, encode_compact  # noqa: E402
+
+CORPUS_PATH = os.path.join(ROOT, "benchmarks", "corpus", "long.txt")
+
+# (이름, fields에 넘길 필드/프로필)
+FIELD_SETS = (
+    ("full", []),
+    ("kana", ["kana"]),
+    ("hangul", ["hangul"]),
+    ("hangul_pron,pos1", ["hangul_pron", "pos1"]),
+    ("hangul_pron", ["hangul_pron"]),
+)
+
+
+def measure(extractor, lines, options, repeat):
+    """(줄당 평균 시간 초, 마지막 결과 리스트)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        results = [extractor.analyze_sentence(line, options) for line in lines]
+    return (time.perf_counter() - start) / repeat / len(lines), results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="후보 필드 지정 벤치마크")
+    parser.add_argument("path", nargs="?", default=CORPUS_PATH, help="가사 파일 (기본 benchmarks/corpus/long.txt)")
+    parser.add_argument("--nbest", type=int, default=1, help="N-best 경로 수 (기본 1)")
+    parser.add_argument("--repeat", type=int, default=20, help="반복 횟수 (기본 20)")
+    args = parser.parse_args()
+
+    with open(args.path, encoding="utf-8") as f:
+        lines = [line.strip() for line in f if line.strip()]
+
+    extractor = JapanesePronunciationExtractor()
+    # 사전 페이지와 변환 테이블을 미리 읽어 둠
+    for line in lines:
+        extractor.analyze_sentence(line, AnalysisOptions(nbest=args.nbest))
+
+    print(f"{len(lines)}줄, nbest={args.nbest}, 반복 {args.repeat}회")
+    print(f"{'필드':<18} {'us/줄':>8} {'비율':>6} | {'JSON KB':>8} {'gzip KB':>8} {'compact KB':>10} {'gzip KB':>8}")
+    baseline = None
+    for name, names in FIELD_SETS:
+        options = AnalysisOptions(nbest=args.nbest, fields=normalize_fields(names))
+        seconds, results = measure(extractor, lines, options, args.repeat)
+        baseline = baseline or seconds
+        plain = json.dumps({"lines": results, "detail_mode": False}, ensure_ascii=False).encode("utf-8")
+        compact = dumps(encode_compact(results, options.fields or CANDIDATE_FIELDS, detail_mode=False))
+        print(f"{name:<18} {seconds * 1e6:>8.1f} {seconds / baseline:>6.2f} | "
+              f"{len(plain) / 1024:>8.1f} {len(gzip.compress(plain)) / 1024:>8.1f} "
+              f"{len(compact) / 1024:>10.1f} {len(gzip.compress(compact)) / 1024:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+HTTP 응답 캐시 벤치마크
+같은 문서를 POST /api/convert(캐시 없음), GET /api/result(줄 캐시 적중),
+조건부 GET(If-None-Match → 304)으로 받을 때의 요청당 시간과 gzip 전/후 응답 크기 비교
+
+사용법: python benchmarks/bench_http_cache.py [--lines 줄 수] [--repeat 반복 횟수]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("WARMUP", "blocking")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import app  # noqa: E402
+
+CORPUS_PATH = os.path.join(ROOT, "benchmarks", "corpus", "long.txt")
+
+
+def timed(repeat, call):
+    """call을 repeat번 실행한 요청당 평균 시간 (초)와 마지막 응답"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        response = call()
+    return (time.perf_counter() - start) / repeat, response
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP 응답 캐시 벤치마크")
+    parser.add_argument("--lines", type=int, default=40, help="문서 줄 수 (기본 40)")
+    parser.add_argument("--repeat", type=int, default=20, help="반복 횟수 (기본 20)")
+    args = parser.parse_args()
+
+    with open(CORPUS_PATH, encoding="utf-8") as f:
+        corpus = [line.strip() for line in f if line.strip()]
+    text = "\n".join((corpus * (args.lines // len(corpus) + 1))[:args.lines])
+
+    with TestClient(app.app) as client:
+        for output_format in ("json", "compact"):
+            body = {"text": text, "format": output_format}
+
+            def post():
+                app.line_cache.clear()
+                return client.post("/api/convert", json=body, headers={"Accept-Encoding": "identity"})
+
+            post_time, response = timed(args.repeat, post)
+            location = response.headers["content-location"]
+            identity_size = len(response.content)
+
+            get_time, response = timed(args.repeat, lambda: client.get(location, headers={"Accept-Encoding": "gzip"}))
+            gzip_size = response.num_bytes_downloaded
+            etag = response.headers["etag"]
+
+            not_modified_time, response = timed(
+                args.repeat, lambda: client.get(location, headers={"If-None-Match": etag}))
+            assert response.status_code == 304
+
+            print(f"{output_format:<8} POST(캐시 없음) {post_time * 1000:7.2f} ms, "
+                  f"GET(줄 캐시) {get_time * 1000:6.2f} ms, 304 {not_modified_time * 1000:5.2f} ms | "
+                  f"크기 {identity_size}B → gzip {gzip_size}B ({identity_size / gzip_size:.1f}배)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+증분 변환 벤치마크: 문서 일부를 고친 뒤 다시 변환할 때
+/api/convert(전체 원문 전송)와 /api/convert_incremental(해시 + 바뀐 줄만 전송)의
+요청 크기와 지연 시간 비교 (서버 결과 저장소는 첫 변환으로 채워 둔 상태)
+
+사용법: python benchmarks/bench_incremental.py
+"""
+
+import json
+import os
+import sys
+import time
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+warnings.simplefilter("ignore")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import app as app_module  # noqa: E402
+from line_cache import line_hash  # noqa: E402
+
+
+BASE_LINES = [
+    "心が僕らには最高で",
+    "燃えていて歌っている",
+    "息を繋ぐ僕らの声は何を望む",
+    "深い海の底で響く鼓動",
+    "一人きりで泣いていた日々を忘れない",
+    "東京タワーから見下ろした街並み",
+    "彼女は静かに窓の外を見つめていた",
+    "春夏秋冬、繰り返す季節の中で",
+]
+NUMBERS = "一二三四五六七八九十"
+
+
+def make_document(size, tag=""):
+    """줄마다 내용이 다른 문서 (숫자를 붙여 서로 다른 줄로 만듦)"""
+    return [
+        f"{BASE_LINES[i % len(BASE_LINES)]}{NUMBERS[i % 10]}{NUMBERS[i // 10 % 10]}{NUMBERS[i // 100 % 10]}{tag}"
+        for i in range(size)
+    ]
+
+
+def timed_post(client, url, body):
+    payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+    start = time.perf_counter()
+    response = client.post(url, content=payload, headers={"Content-Type": "application/json"})
+    elapsed = time.perf_counter() - start
+    assert response.status_code == 200, response.text
+    return elapsed, len(payload)
+
+
+def main():
+    with TestClient(app_module.app) as client:
+        run(client)
+
+
+def run(client):
+    print(f"{'줄 수':>6} {'수정':>5} {'전체(ms)':>9} {'전체(KB)':>9} {'증분(ms)':>9} {'증분(KB)':>9}")
+    for size in (100, 1000):
+        for edited in (1, 10, 100):
+            if edited > size:
+                continue
+            app_module.line_cache.clear()
+            lines = make_document(size)
+            hashes = [line_hash(line) for line in lines]
+            # 첫 변환: 모든 줄을 원문과 함께 전송
+            timed_post(client, "/api/convert_incremental",
+                       {"hashes": hashes, "texts": dict(zip(hashes, lines))})
+
+            # 앞쪽 edited줄을 고친 문서
+            new_lines = make_document(edited, tag="よ") + lines[edited:]
+            new_hashes = [line_hash(line) for line in new_lines]
+            changed = {h: line for h, line in zip(new_hashes[:edited], new_lines[:edited])}
+
+            incremental_time, incremental_size = timed_post(
+                client, "/api/convert_incremental", {"hashes": new_hashes, "texts": changed, "format": "compact"})
+
+            # 같은 수정을 전체 변환으로 (캐시를 다시 채운 뒤 고친 줄만 새로 분석하게 함)
+            app_module.line_cache.clear()
+            timed_post(client, "/api/convert", {"text": "\n".join(lines)})
+            full_time, full_size = timed_post(
+                client, "/api/convert", {"text": "\n".join(new_lines), "format": "compact"})
+
+            print(f"{size:>6} {edited:>5} {full_time * 1000:>9.1f} {full_size / 1024:>9.1f} "
+                  f"{incremental_time * 1000:>9.1f} {incremental_size / 1024:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
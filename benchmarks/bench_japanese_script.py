@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+japanese_script 변환/판별 함수 벤치마크 (기존 ord/chr 루프, 제너레이터 검사와 비교)
+
+사용법: python benchmarks/bench_japanese_script.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from japanese_script import (  # noqa: E402
+    to_hiragana,
+    to_katakana,
+    has_kanji,
+)
+
+
+def legacy_to_hiragana(text):
+    """기존 to_hiragana (문자별 ord/chr 루프)"""
+    result = []
+    for ch in text:
+        code = ord(ch)
+        if 0x30A0 <= code <= 0x30FA:
+            result.append(chr(code - 0x60))
+        else:
+            result.append(ch)
+    return ''.join(result)
+
+
+def legacy_to_katakana(text):
+    """기존 to_katakana (문자별 ord/chr 루프)"""
+    result = []
+    for ch in text:
+        code = ord(ch)
+        if 0x3040 <= code <= 0x309F:
+            result.append(chr(code + 0x60))
+        else:
+            result.append(ch)
+    return ''.join(result)
+
+
+def legacy_has_kanji(text):
+    """기존 한자 검사 (U+4E00 ~ U+9FFF만 확인)"""
+    return any('一' <= c <= '鿿' for c in text)
+
+
+SAMPLES = ["サイコウ", "こころ", "ボクラ", "ありがとう", "ヴァイオリン", "心", "最高", "Hello", "、", "人々"]
+
+
+def bench(name, func, number=50000):
+    elapsed = timeit.timeit(lambda: [func(s) for s in SAMPLES], number=number)
+    print(f"{name:24} {elapsed / (number * len(SAMPLES)) * 1e9:8.1f} ns/call")
+
+
+def main():
+    # 변환 결과 일치 확인 (가나 영역 전체 + 샘플)
+    chars = ''.join(chr(c) for c in range(0x3000, 0x3100))
+    assert to_hiragana(chars) == legacy_to_hiragana(chars)
+    assert to_katakana(chars) == legacy_to_katakana(chars)
+
+    bench("legacy to_hiragana", legacy_to_hiragana)
+    bench("translate to_hiragana", to_hiragana)
+    bench("legacy to_katakana", legacy_to_katakana)
+    bench("translate to_katakana", to_katakana)
+    bench("legacy has_kanji", legacy_has_kanji)
+    bench("regex has_kanji", has_kanji)
+
+
+if __name__ == "__main__":
+    main()
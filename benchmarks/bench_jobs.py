@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+비동기 작업 벤치마크
+1) 큰 작업(앨범/가사 모음 크기) 하나의 처리량 (줄/초), 결과를 묶음마다 저장하는 비용 포함
+2) 작업이 실행 중일 때와 아닐 때 일반 /api/convert 요청의 지연 시간 비교
+   (작업은 묶음 단위로 분석하므로 일반 요청이 묶음 사이에 끼어서 처리되어야 함)
+
+사용법: python benchmarks/bench_jobs.py [--lines 작업 줄 수] [--store memory|sqlite] [--chunk-lines N] [--requests N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+CORPUS_PATH = os.path.join(ROOT, "benchmarks", "corpus", "long.txt")
+
+
+def percentile(values, ratio):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * ratio))]
+
+
+def convert_latencies(client, body, count):
+    """캐시를 비우면서 /api/convert를 count번 보내고 요청별 시간 (초)"""
+    import app
+
+    latencies = []
+    for _ in range(count):
+        app.line_cache.clear()
+        start = time.perf_counter()
+        client.post("/api/convert", json=body)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="비동기 작업 벤치마크")
+    parser.add_argument("--lines", type=int, default=3000, help="작업 줄 수 (기본 3000)")
+    parser.add_argument("--store", choices=("memory", "sqlite"), default="memory", help="작업 저장소 (기본 memory)")
+    parser.add_argument("--chunk-lines", type=int, default=16, help="작업 묶음 줄 수 (기본 16)")
+    parser.add_argument("--requests", type=int, default=20, help="지연 시간 측정 요청 수 (기본 20)")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    os.environ.update(WARMUP="blocking", LINE_CACHE_SIZE="0", JOB_CHUNK_LINES=str(args.chunk_lines))
+    if args.store == "sqlite":
+        os.environ["JOB_STORE"] = os.path.join(directory, "jobs.sqlite")
+
+    from fastapi.testclient import TestClient
+    import app
+
+    with open(CORPUS_PATH, encoding="utf-8") as f:
+        corpus = [line.strip() for line in f if line.strip()]
+    # 줄마다 다른 텍스트 (캐시 적중 없이 모두 분석)
+    job_text = "\n".join(f"{corpus[i % len(corpus)]}{i}" for i in range(args.lines))
+    body = {"text": "\n".join(corpus)}
+
+    with TestClient(app.app) as client:
+        idle = convert_latencies(client, body, args.requests)
+
+        start = time.perf_counter()
+        job_id = client.post("/api/jobs", json={"text": job_text}).json()["id"]
+        busy = convert_latencies(client, body, args.requests)
+        while client.get(f"/api/jobs/{job_id}").json()["status"] != "done":
+            time.sleep(0.01)
+        elapsed = time.perf_counter() - start
+        results = client.get(f"/api/jobs/{job_id}/result").json()["documents"][0]["lines"]
+        assert len(results) == args.lines
+
+    print(f"작업 {args.lines}줄 ({args.store}, 묶음 {args.chunk_lines}줄): {elapsed:.2f}초, "
+          f"{args.lines / elapsed:.0f}줄/초 (측정 요청 {args.requests}개와 동시 실행)")
+    for name, latencies in (("작업 없음", idle), ("작업 실행 중", busy)):
+        print(f"/api/convert {name:<8} p50 {percentile(latencies, 0.5) * 1000:6.1f} ms, "
+              f"p99 {percentile(latencies, 0.99) * 1000:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+kana_to_hangul 마이크로 벤치마크 및 기존 구현과의 결과 일치 검사
+
+사용법: python benchmarks/bench_kana_to_hangul.py
+"""
+
+import itertools
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hangul_helper import (  # noqa: E402
+    KANA_DICT,
+    EXTENDED_KANA_DICT,
+    add_jongseong,
+    convert_hyphen_to_longsound,
+    kana_to_hangul,
+)
+
+
+def legacy_kana_to_hangul(text, use_hyphen=True):
+    """테이블 방식 도입 이전의 kana_to_hangul (비교 기준)"""
+    result = []
+    i = 0
+
+    while i < len(text):
+        if i < len(text) - 1:
+            two_char = text[i:i+2]
+            if two_char in EXTENDED_KANA_DICT:
+                result.append(EXTENDED_KANA_DICT[two_char])
+                i += 2
+                continue
+
+        char = text[i]
+        if char in KANA_DICT:
+            result.append(KANA_DICT[char])
+        elif char == "ー":
+            result.append("-")
+        else:
+            result.append(char)
+
+        i += 1
+
+    i = 0
+    while i < len(result):
+        current = result[i]
+
+        if current in ['っ', 'ッ']:
+            if i == 0 or len(result) <= 1:
+                result[i] = 'ㅅ'
+            else:
+                prev_char = result[i - 1]
+                if 0xAC00 <= ord(prev_char) <= 0xD7A3:
+                    result[i - 1] = add_jongseong(prev_char, 19)
+                    result.pop(i)
+                    i -= 1
+                else:
+                    result[i] = 'ㅅ'
+
+        elif current in ['ん', 'ン']:
+            if i == 0 or len(result) <= 1:
+                result[i] = 'ㄴ'
+            else:
+                prev_char = result[i - 1]
+                if 0xAC00 <= ord(prev_char) <= 0xD7A3:
+                    result[i - 1] = add_jongseong(prev_char, 4)
+                    result.pop(i)
+                    i -= 1
+                else:
+                    result[i] = 'ㄴ'
+
+        i += 1
+
+    result_str = ''.join(result)
+
+    if not use_hyphen:
+        result_str = convert_hyphen_to_longsound(result_str)
+
+    return result_str
+
+
+def build_corpus(seed=0):
+    """
+    일치 검사용 코퍼스 생성
+
+    가나 전체 + 특수 문자로 만들 수 있는 모든 2글자 조합,
+    촉음/ん/장음 위주의 모든 3글자 조합, 긴 무작위 문자열
+    """
+    alphabet = sorted(set(KANA_DICT) | set(''.join(EXTENDED_KANA_DICT)))
+    alphabet += ['っ', 'ッ', 'ん', 'ン', 'ー', 'ゔ', '漢', 'a', ' ', '-', 'ㅅ', '가', '각']
+
+    corpus = list(alphabet)
+    corpus += [''.join(p) for p in itertools.product(alphabet, repeat=2)]
+
+    small = ['か', 'キ', 'ゃ', 'ャ', 'っ', 'ッ', 'ん', 'ン', 'ー', 'ヴ', 'ァ', 'a', '가']
+    corpus += [''.join(p) for p in itertools.product(small, repeat=3)]
+
+    rng = random.Random(seed)
+    for _ in range(2000):
+        corpus.append(''.join(rng.choice(alphabet) for _ in range(rng.randint(4, 30))))
+
+    return corpus
+
+
+def check_parity(corpus):
+    """기존 구현과 출력이 완전히 같은지 확인"""
+    mismatches = 0
+    for text in corpus:
+        for use_hyphen in (True, False):
+            expected = legacy_kana_to_hangul(text, use_hyphen)
+            actual = kana_to_hangul(text, use_hyphen)
+            if expected != actual:
+                mismatches += 1
+                if mismatches <= 10:
+                    print(f"불일치: {text!r} use_hyphen={use_hyphen}: {expected!r} != {actual!r}")
+    return mismatches
+
+
+def main():
+    corpus = build_corpus()
+    mismatches = check_parity(corpus)
+    print(f"일치 검사: {len(corpus) * 2}건 중 불일치 {mismatches}건")
+
+    words = ["がっこう", "せんせい", "こんにちは", "キョウ", "サイコー", "ヴァイオリン",
+             "ありがとう", "トゥモロー", "ずっと", "しんじて"]
+    number = 20000
+    for name, func in (("legacy", legacy_kana_to_hangul), ("table", kana_to_hangul)):
+        elapsed = timeit.timeit(lambda: [func(w) for w in words], number=number)
+        per_call = elapsed / (number * len(words)) * 1e6
+        print(f"{name:8} {per_call:.3f} us/call")
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
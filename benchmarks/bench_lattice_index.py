@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+대체 노드 수집 벤치마크: 토큰마다 재귀 탐색(get_all_replace_nodes) vs LatticeIndex
+줄 길이에 따른 처리 시간 변화를 비교하고 두 방식의 결과가 같은지 확인
+
+사용법: python benchmarks/bench_lattice_index.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from japanese_pron import JapanesePronunciationExtractor  # noqa: E402
+from lattice_index import LatticeIndex  # noqa: E402
+
+
+SEED_TEXT = (
+    "息を繋ぐ僕らの声は何を望む深い海の底で響く鼓動"
+    "遠い空の向こうに行きたいんだ風に吹かれて花びらが舞う"
+    "夜明け前の一番暗い時間雨上がりの虹を追いかけて"
+)
+
+
+def make_line(length):
+    """SEED_TEXT를 반복해서 지정한 길이의 줄 생성"""
+    repeat = length // len(SEED_TEXT) + 1
+    return (SEED_TEXT * repeat)[:length]
+
+
+def recursive_alternatives(extractor, tagger, text):
+    """기존 방식: parseToNode 후 토큰마다 재귀 탐색"""
+    tagger.parse('')
+    node = tagger.parseToNode(text)
+    result = []
+    while node:
+        if node.surface:
+            alt_nodes = extractor.get_all_replace_nodes(node, node.length)
+            result.append([(n.surface, n.feature) for n in alt_nodes])
+        node = node.next
+    return result
+
+
+def indexed_alternatives(tagger, text):
+    """LatticeIndex: lattice를 한 번 인덱싱한 뒤 토큰마다 인덱스 탐색"""
+    index = LatticeIndex.build(tagger, text)
+    return [
+        [(n.surface, n.feature) for n in index.replace_nodes(i)]
+        for i in range(len(index.tokens))
+    ]
+
+
+def measure(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    extractor = JapanesePronunciationExtractor()
+    tagger = extractor.tagger
+
+    print(f"{'길이':>6} {'재귀(ms)':>10} {'인덱스(ms)':>11} {'배율':>6}")
+    for length in (10, 50, 100, 500, 1000, 2000):
+        text = make_line(length)
+        expected = recursive_alternatives(extractor, tagger, text)
+        actual = indexed_alternatives(tagger, text)
+        if expected != actual:
+            print(f"결과 불일치: 길이 {length}")
+            sys.exit(1)
+
+        repeat = max(3, 2000 // length)
+        old = measure(lambda: recursive_alternatives(extractor, tagger, text), repeat)
+        new = measure(lambda: indexed_alternatives(tagger, text), repeat)
+        print(f"{length:>6} {old * 1000:>10.2f} {new * 1000:>11.2f} {old / new:>5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
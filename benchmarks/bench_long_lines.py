@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+긴 줄 벤치마크 (줄바꿈 없이 붙여 넣은 문단)
+10자 ~ 10,000자 줄을 통째로 분석할 때와 문장/구절 경계에서 나눠서 분석할 때
+(JapanesePronunciationExtractor.segment_chars) 비교
+
+- 시간: 줄당 ms, 글자당 us (길이에 비례하면 글자당 시간이 일정)
+- 시간 제한(--time-limit-ms)을 주면 통째로 분석한 긴 줄은 제한을 넘긴 뒤의 단어가 모두 1-best 발음만 남지만
+  나눠서 분석하면 조각마다 제한이 적용되므로 대체 발음이 있는 단어 수를 함께 비교
+- 경계 문자가 없는 텍스트(--no-punctuation)는 문자 종류가 바뀌는 곳에서 나눔
+
+사용법: python benchmarks/bench_long_lines.py [--nbest N] [--time-limit-ms MS] [--no-punctuation] [--repeat N]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("METRICS", "0")
+
+from japanese_pron import AnalysisOptions, JapanesePronunciationExtractor  # noqa: E402
+from japanese_script import split_long_line  # noqa: E402
+
+LENGTHS = (10, 100, 300, 1000, 3000, 10000)
+
+
+def load_paragraph(no_punctuation):
+    """코퍼스의 모든 줄을 '、'로 이은 긴 문단 (no_punctuation이면 경계 문자 없이 이어 붙임)"""
+    lines = []
+    for path in [os.path.join(ROOT, "data", "warmup_lyrics.txt")] + sorted(
+            os.path.join(ROOT, "benchmarks", "corpus", name)
+            for name in os.listdir(os.path.join(ROOT, "benchmarks", "corpus"))):
+        with open(path, encoding="utf-8") as f:
+            lines.extend(line.strip() for line in f if line.strip())
+    if no_punctuation:
+        return re.sub(r"[。．！？!?、，, 　]", "", "".join(lines))
+    return "、".join(lines)
+
+
+def measure(extractor, text, options, repeat):
+    """(평균 시간 초, 대체 발음이 있는 단어 수, truncated 여부)"""
+    extractor.analyze_sentence(text[:50], options)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = extractor.analyze_sentence(text, options)
+    elapsed = (time.perf_counter() - start) / repeat
+    alternatives = sum(1 for word in result["words"] if len(word["alternative_pronunciations"]) > 1)
+    return elapsed, alternatives, bool(result.get("truncated"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="긴 줄 벤치마크")
+    parser.add_argument("--nbest", type=int, default=1, help="N-best 경로 수 (기본 1)")
+    parser.add_argument("--time-limit-ms", type=int, default=0, help="줄(조각)당 시간 제한 (밀리초, 기본 0 = 없음)")
+    parser.add_argument("--no-punctuation", action="store_true", help="경계 문자 없는 텍스트로 측정")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (기본 3)")
+    args = parser.parse_args()
+
+    extractor = JapanesePronunciationExtractor()
+    options = AnalysisOptions(nbest=args.nbest, time_limit=args.time_limit_ms / 1000)
+    paragraph = load_paragraph(args.no_punctuation)
+    paragraph = paragraph * (max(LENGTHS) // len(paragraph) + 1)
+    segment_chars = extractor.segment_chars
+
+    print(f"nbest={args.nbest}, 시간 제한 {args.time_limit_ms}ms, 조각 {segment_chars}자"
+          f"{', 경계 문자 없음' if args.no_punctuation else ''}")
+    print(f"{'글자 수':>7} | {'통째로 ms':>9} {'us/자':>6} {'대체 발음':>8} | "
+          f"{'나눠서 ms':>9} {'us/자':>6} {'대체 발음':>8} {'조각':>5}")
+    for length in LENGTHS:
+        text = paragraph[:length]
+        extractor.segment_chars = 0
+        whole, whole_alternatives, whole_truncated = measure(extractor, text, options, args.repeat)
+        extractor.segment_chars = segment_chars
+        split, split_alternatives, split_truncated = measure(extractor, text, options, args.repeat)
+        segments = len(split_long_line(text, segment_chars))
+        print(f"{length:>7} | {whole * 1000:>9.1f} {whole / length * 1e6:>6.1f} "
+              f"{whole_alternatives:>7}{'*' if whole_truncated else ' '} | "
+              f"{split * 1000:>9.1f} {split / length * 1e6:>6.1f} "
+              f"{split_alternatives:>7}{'*' if split_truncated else ' '} {segments:>5}")
+    print("* 시간 제한으로 일부 단어의 대체 발음 탐색을 생략 (truncated)")
+
+
+if __name__ == "__main__":
+    main()
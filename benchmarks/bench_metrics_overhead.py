@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+단계별 지표 기록 비용 벤치마크
+같은 프로세스에서 metrics.ENABLED를 번갈아 바꾸며 analyze_sentence 줄당 시간을 비교
+(측정 순서에 따른 차이를 줄이기 위해 켜기/끄기를 여러 번 교대로 측정하고 가장 빠른 값 사용)
+
+사용법: python benchmarks/bench_metrics_overhead.py [가사 파일] [--rounds N]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import metrics  # noqa: E402
+from japanese_pron import JapanesePronunciationExtractor  # noqa: E402
+
+
+def load_lines(path):
+    paths = [path] if path else sorted(glob.glob(os.path.join(ROOT, "benchmarks", "corpus", "*.txt")))
+    lines = []
+    for corpus_path in paths:
+        with open(corpus_path, encoding="utf-8") as f:
+            lines.extend(line.strip() for line in f if line.strip())
+    return lines
+
+
+def per_line(extractor, lines, enabled, repeat=3):
+    """줄당 처리 시간 (초, 프로세스 CPU 시간)"""
+    metrics.ENABLED = enabled
+    start = time.process_time()
+    for _ in range(repeat):
+        for line in lines:
+            extractor.analyze_sentence(line)
+    return (time.process_time() - start) / (repeat * len(lines))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="지표 기록 비용 벤치마크")
+    parser.add_argument("path", nargs="?", help="가사 파일 (기본 benchmarks/corpus 전체)")
+    parser.add_argument("--rounds", type=int, default=7, help="켜기/끄기 교대 측정 횟수 (기본 7)")
+    args = parser.parse_args()
+
+    lines = load_lines(args.path)
+    extractor = JapanesePronunciationExtractor()
+    per_line(extractor, lines, True, repeat=1)  # 예열
+
+    best = {True: None, False: None}
+    for _ in range(args.rounds):
+        for enabled in (False, True):
+            elapsed = per_line(extractor, lines, enabled)
+            best[enabled] = elapsed if best[enabled] is None else min(best[enabled], elapsed)
+
+    off, on = best[False], best[True]
+    print(f"줄 수: {len(lines)}")
+    print(f"지표 끔:  {off * 1e6:8.1f} us/줄")
+    print(f"지표 켬:  {on * 1e6:8.1f} us/줄")
+    print(f"추가 비용: {(on - off) * 1e6:+8.1f} us/줄 ({on / off - 1:+.1%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+N-best 값에 따른 품질/지연 시간 벤치마크
+N마다 줄당 처리 시간과 한자 단어당 평균 발음 후보 수를 측정
+
+사용법: python benchmarks/bench_nbest.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from japanese_pron import JapanesePronunciationExtractor, AnalysisOptions  # noqa: E402
+from japanese_script import has_kanji  # noqa: E402
+
+
+LINES = [
+    "心が僕らには最高で",
+    "燃えていて歌っている",
+    "息を繋ぐ僕らの声は何を望む",
+    "深い海の底で響く鼓動",
+    "一人きりで泣いていた日々を忘れない",
+    "東京タワーから見下ろした街並み",
+    "彼女は静かに窓の外を見つめていた",
+    "春夏秋冬、繰り返す季節の中で",
+    "生まれてきた意味を探している",
+    "行こう！走ろう！跳ぼう！",
+]
+
+
+def main():
+    extractor = JapanesePronunciationExtractor()
+    repeat = 20
+
+    print(f"{'N':>4} {'줄당(ms)':>9} {'한자 단어당 후보':>16}")
+    for nbest in (1, 2, 5, 10, 20, 50):
+        options = AnalysisOptions(nbest=nbest)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            results = [extractor.analyze_sentence(line, options) for line in LINES]
+        elapsed = (time.perf_counter() - start) / (repeat * len(LINES))
+
+        counts = [
+            len(word["alternative_pronunciations"])
+            for result in results
+            for word in result["words"]
+            if has_kanji(word["surface"])
+        ]
+        print(f"{nbest:>4} {elapsed * 1000:>9.3f} {sum(counts) / len(counts):>16.2f}")
+
+    # 시간 제한 효과 (N=50)
+    for limit_ms in (0.5, 2):
+        options = AnalysisOptions(nbest=50, time_limit=limit_ms / 1000)
+        start = time.perf_counter()
+        results = [extractor.analyze_sentence(line, options) for line in LINES * repeat]
+        elapsed = (time.perf_counter() - start) / (repeat * len(LINES))
+        truncated = sum(1 for result in results if result.get("truncated"))
+        print(f"N=50, 제한 {limit_ms}ms: 줄당 {elapsed * 1000:.3f}ms, 탐색 중단 {truncated}/{len(results)}줄")
+
+
+if __name__ == "__main__":
+    main()
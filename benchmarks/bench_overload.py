@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+과부하 부하 테스트
+uvicorn 서버를 띄우고 처리량보다 많은 /api/convert 요청을 일정한 간격으로 보내서
+(응답을 기다리지 않고 계속 보내는 open-loop 방식) 상태 코드별 개수와 지연 시간 분포를 측정
+수락 제어/마감 시간을 끈 서버와 켠 서버를 비교
+
+사용법: python benchmarks/bench_overload.py [--rate 요청/초] [--duration 초] [--lines 줄 수]
+"""
+
+import argparse
+import asyncio
+import collections
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORPUS_PATH = os.path.join(ROOT, "benchmarks", "corpus", "long.txt")
+
+# 비교할 서버 설정
+CONFIGS = {
+    "unlimited": {"MAX_ACTIVE_REQUESTS": "0", "REQUEST_TIMEOUT_MS": "0"},
+    "limited": {"MAX_ACTIVE_REQUESTS": "2", "MAX_QUEUED_REQUESTS": "4",
+                "QUEUE_TIMEOUT_MS": "500", "REQUEST_TIMEOUT_MS": "2000"},
+}
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def percentile(values, ratio):
+    if not values:
+        return float("nan")
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * ratio))]
+
+
+def server_total(response):
+    """Server-Timing 헤더의 total 값 (초, 없으면 None)"""
+    for item in response.headers.get("server-timing", "").split(","):
+        name, _, duration = item.strip().partition(";dur=")
+        if name == "total":
+            return float(duration) / 1000
+    return None
+
+
+async def fire(client, body, results):
+    """
+    요청 하나를 보내고 (상태 코드, 클라이언트 지연 시간, 서버 처리 시간) 기록
+    (연결 실패/클라이언트 시간 초과는 상태 코드 None)
+    """
+    start = time.perf_counter()
+    server = None
+    try:
+        response = await client.post("/api/convert", json=body)
+        status = response.status_code
+        server = server_total(response)
+    except httpx.HTTPError:
+        status = None
+    results.append((status, time.perf_counter() - start, server))
+
+
+async def load(base, body, rate, duration):
+    """duration초 동안 초당 rate개 요청을 일정한 간격으로 보내기"""
+    results = []
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    async with httpx.AsyncClient(base_url=base, timeout=60, limits=limits) as client:
+        tasks = []
+        interval = 1 / rate
+        started = time.perf_counter()
+        for i in range(int(rate * duration)):
+            delay = started + i * interval - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.ensure_future(fire(client, body, results)))
+        await asyncio.gather(*tasks)
+    return results
+
+
+def run_server(extra_env):
+    port = free_port()
+    env = dict(os.environ, WARMUP="blocking", LINE_CACHE_SIZE="0", **extra_env)
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT, env=env,
+    )
+    base = f"http://127.0.0.1:{port}"
+    while True:
+        if server.poll() is not None:
+            raise RuntimeError("서버 시작 실패")
+        try:
+            if httpx.get(f"{base}/api/ready").status_code == 200:
+                return server, base
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.05)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="과부하 부하 테스트")
+    parser.add_argument("--rate", type=float, default=0, help="초당 요청 수 (기본: 측정한 처리량의 2배)")
+    parser.add_argument("--duration", type=float, default=10, help="부하 시간 (초, 기본 10)")
+    parser.add_argument("--lines", type=int, default=20, help="요청당 줄 수 (기본 20)")
+    args = parser.parse_args()
+
+    with open(CORPUS_PATH, encoding="utf-8") as f:
+        corpus = [line.strip() for line in f if line.strip()]
+    body = {"text": "\n".join((corpus * (args.lines // len(corpus) + 1))[:args.lines])}
+
+    # 클라이언트 지연 시간에는 서버 앞에서 기다린 시간(연결 수락, 본문 파싱)과 부하 생성기 자신의 지연이 포함됨
+    # 서버 p99는 핸들러 안(수락 대기 + 분석 + 직렬화) 시간으로 Server-Timing total 값
+    print(f"{'설정':<10} {'요청/초':>7} {'상태 코드별 개수':<32} {'200 p50(ms)':>11} {'200 p99(ms)':>11} "
+          f"{'전체 p99(ms)':>12} {'서버 p99(ms)':>12}")
+    rate = args.rate
+    for name, extra_env in CONFIGS.items():
+        server, base = run_server(extra_env)
+        try:
+            if not rate:
+                # 요청 하나의 처리 시간으로 처리량을 추정하고 그 2배로 부하
+                with httpx.Client(base_url=base, timeout=60) as client:
+                    start = time.perf_counter()
+                    for _ in range(5):
+                        client.post("/api/convert", json=body)
+                    rate = 2 * 5 / (time.perf_counter() - start)
+            results = asyncio.run(load(base, body, rate, args.duration))
+        finally:
+            server.terminate()
+            server.wait()
+
+        counts = collections.Counter(status for status, _, _ in results)
+        ok = [elapsed for status, elapsed, _ in results if status == 200]
+        every = [elapsed for _, elapsed, _ in results]
+        server = [elapsed for _, _, elapsed in results if elapsed is not None]
+        count_text = ", ".join(f"{status}: {count}" for status, count in sorted(counts.items(), key=str))
+        print(f"{name:<10} {rate:>7.1f} {count_text:<32} {percentile(ok, 0.5) * 1000:>11.1f} "
+              f"{percentile(ok, 0.99) * 1000:>11.1f} {percentile(every, 0.99) * 1000:>12.1f} "
+              f"{percentile(server, 0.99) * 1000:>12.1f}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+hangul_render와 static/output.js의 렌더링 결과 비교
+가사 분석 결과(선택 후보를 바꿔 가며)와 무작위로 만든 단어 리스트를
+출력 옵션 조합 전체(16가지)로 렌더링해서 Node.js 결과와 한 글자라도 다르면 실패
+
+사용법: python benchmarks/check_render_parity.py [가사 파일] [--random N]
+(Node.js가 PATH에 있어야 함)
+"""
+
+import argparse
+import itertools
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from japanese_pron import JapanesePronunciationExtractor  # noqa: E402
+from hangul_render import RenderOptions, render_line  # noqa: E402
+
+
+DEFAULT_LINES = [
+    "心が僕らには最高で",
+    "燃えていて歌っている",
+    "息を繋ぐ僕らの声は何を望む",
+    "一人きりで泣いていた日々を忘れない",
+    "遠い空の向こうに行きたいんだ",
+    "さっきの話、ちょっと待ってください",
+    "ずっと一緒にいたいんだ",
+    "新宿駅から三百メートル先の本屋さん",
+    "二十五人の子供たちが走っていく",
+    "Love song を歌おう 君のために",
+    "ラーメンとコーヒーとケーキ",
+    "東京タワーの灯りがキラキラ",
+    "どうしようもないくらい好きなんです",
+    "月が綺麗ですね",
+    "きっと明日はいい天気になるでしょう",
+]
+
+# output.js를 브라우저 객체 없이 불러와서 표준 입력의 케이스를 렌더링하는 Node 스크립트
+NODE_SCRIPT = r"""
+const fs = require('fs');
+const vm = require('vm');
+const stub = { addEventListener() {}, getElementById() { return null; }, querySelectorAll() { return []; } };
+const context = { window: stub, document: stub, sessionStorage: { getItem() { return null; } }, console };
+vm.createContext(context);
+vm.runInContext(fs.readFileSync(process.argv[1], 'utf8'), context);
+const cases = JSON.parse(fs.readFileSync(0, 'utf8'));
+const output = cases.map(([words, options]) =>
+    context.getLineTextWithOptions(words, options[0], options[1], options[2], options[3]));
+process.stdout.write(JSON.stringify(output));
+"""
+
+# 무작위 단어에 쓸 조각 (받침 유무, 단독 ㅅ/ㄴ, 장음 하이픈, 공백, 비한글 포함)
+RANDOM_PIECES = [
+    "가", "아", "키", "타", "파", "라", "마", "바", "나", "하", "사", "쟈",
+    "칸", "앙", "맘", "삿", "닥", "팝", "랄", "캇", "ㅅ", "ㄴ", "-", " ",
+    "。", "、", "A", "k", "1",
+]
+RANDOM_POS = [
+    ("名詞", "普通名詞", "一般"), ("名詞", "固有名詞", "人名"), ("名詞", "数詞", ""),
+    ("名詞", "普通名詞", "助数詞可能"), ("動詞", "一般", ""), ("動詞", "非自立可能", ""),
+    ("助詞", "格助詞", ""), ("助詞", "接続助詞", ""), ("助動詞", "", ""),
+    ("接尾辞", "名詞的", "一般"), ("接頭辞", "", ""), ("形容詞", "非自立可能", ""),
+    ("補助記号", "句点", ""), ("名詞", "非自立", ""),
+]
+
+
+def option_combinations():
+    """use_hyphen, add_space, clarify_nn, clarify_xts 조합 전체"""
+    return [RenderOptions(*flags) for flags in itertools.product((True, False), repeat=4)]
+
+
+def corpus_cases(lines):
+    """분석 결과 단어 리스트 (선택 후보를 첫 후보, 마지막 후보로 바꾼 경우 포함)"""
+    extractor = JapanesePronunciationExtractor()
+    cases = []
+    for text in lines:
+        if not text.strip():
+            continue
+        words = extractor.analyze_sentence(text.strip())["words"]
+        cases.append(words)
+        last = [dict(word, selected_id=max(0, len(word["alternative_pronunciations"]) - 1)) for word in words]
+        if last != words:
+            cases.append(last)
+    return cases
+
+
+def random_word(rng):
+    """무작위 단어 (후보 없음, 빈 발음, 범위 밖 selected_id 포함)"""
+    surface = "".join(rng.choice("漢字かなカナab ") for _ in range(rng.randint(1, 3)))
+    alternatives = []
+    for _ in range(rng.choice((0, 1, 1, 1, 2))):
+        pos1, pos2, pos3 = rng.choice(RANDOM_POS)
+        pron = "".join(rng.choice(RANDOM_PIECES) for _ in range(rng.randint(0, 4)))
+        kana = "".join(rng.choice(RANDOM_PIECES) for _ in range(rng.randint(0, 4)))
+        alternatives.append({
+            "hangul_pron": pron, "hangul_kana": kana,
+            "pos1": pos1, "pos2": pos2, "pos3": pos3,
+        })
+    return {
+        "surface": surface,
+        "selected_id": rng.choice((0, 0, 0, 1, 5)),
+        "alternative_pronunciations": alternatives,
+    }
+
+
+def random_cases(count, seed=0):
+    rng = random.Random(seed)
+    return [[random_word(rng) for _ in range(rng.randint(0, 8))] for _ in range(count)]
+
+
+def run_node(cases):
+    """Node.js로 output.js의 getLineTextWithOptions 실행"""
+    payload = json.dumps([[words, list(options[:4])] for words, options in cases], ensure_ascii=False)
+    completed = subprocess.run(
+        ["node", "-e", NODE_SCRIPT, os.path.join(ROOT, "static", "output.js")],
+        input=payload.encode("utf-8"), stdout=subprocess.PIPE, check=True,
+    )
+    return json.loads(completed.stdout.decode("utf-8"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="hangul_render / output.js 렌더링 결과 비교")
+    parser.add_argument("path", nargs="?", help="가사 파일 (생략하면 내장 문장)")
+    parser.add_argument("--random", type=int, default=3000, help="무작위 단어 리스트 수 (기본 3000)")
+    args = parser.parse_args()
+
+    if shutil.which("node") is None:
+        print("node를 찾을 수 없습니다")
+        sys.exit(2)
+
+    if args.path:
+        with open(args.path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    else:
+        lines = DEFAULT_LINES
+
+    word_lists = corpus_cases(lines) + random_cases(args.random)
+    cases = [(words, options) for words in word_lists for options in option_combinations()]
+
+    start = time.perf_counter()
+    python_output = [render_line(words, options) for words, options in cases]
+    python_time = time.perf_counter() - start
+
+    node_output = run_node(cases)
+
+    mismatches = [
+        (words, options, expected, actual)
+        for (words, options), expected, actual in zip(cases, node_output, python_output)
+        if expected != actual
+    ]
+
+    print(f"케이스: {len(cases)} (단어 리스트 {len(word_lists)} x 옵션 {len(option_combinations())})")
+    print(f"Python 렌더링: {python_time * 1000:.1f} ms")
+    print(f"불일치: {len(mismatches)}")
+    for words, options, expected, actual in mismatches[:5]:
+        print(json.dumps({"words": words, "options": options._asdict(),
+                          "js": expected, "python": actual}, ensure_ascii=False))
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
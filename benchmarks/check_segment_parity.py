@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+긴 줄 분할 결과 비교
+줄바꿈 없이 붙여 넣은 긴 줄(전각 공백, 、, 。 경계 포함)을 서버(/api/convert, 조각 단위 캐시/분석 후 합침)와
+JapanesePronunciationExtractor.analyze_sentence(나누지 않은 줄 전체 분석, 기본 분할)로 분석해서
+단어 하나라도 다르면 실패
+
+사용법: python benchmarks/check_segment_parity.py [--backend inline|thread|process]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def load_lines():
+    """예열 가사와 벤치마크 코퍼스의 모든 줄"""
+    lines = []
+    for path in [os.path.join(ROOT, "data", "warmup_lyrics.txt")] + sorted(
+            os.path.join(ROOT, "benchmarks", "corpus", name)
+            for name in os.listdir(os.path.join(ROOT, "benchmarks", "corpus"))):
+        with open(path, encoding="utf-8") as f:
+            lines.extend(line.strip() for line in f if line.strip())
+    return lines
+
+
+def long_lines(lines):
+    """경계 문자별로 코퍼스 줄을 이어 붙인 긴 줄 (전각 공백은 조각 끝에 공백 토큰이 남는 경우)"""
+    return {
+        "전각 공백": "　".join(lines),
+        "전각 공백 연속": "　　".join(lines),
+        "、": "、".join(lines),
+        "。+ 전각 공백": "。　".join(lines),
+        "경계 없음": "".join(lines),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="긴 줄 분할 결과 비교")
+    parser.add_argument("--backend", choices=("inline", "thread", "process"), default="thread",
+                        help="서버 분석 백엔드 (기본 thread)")
+    args = parser.parse_args()
+    os.environ.update(WARMUP="off", LINE_CACHE_SIZE="0", ANALYSIS_BACKEND=args.backend, REQUEST_TIMEOUT_MS="0")
+
+    from fastapi.testclient import TestClient
+    import app
+    from japanese_pron import JapanesePronunciationExtractor
+
+    whole = JapanesePronunciationExtractor(segment_chars=0)
+    segmented = JapanesePronunciationExtractor()
+    mismatches = 0
+    with TestClient(app.app) as client:
+        for name, text in long_lines(load_lines()).items():
+            expected = whole.analyze_sentence(text)
+            outputs = {
+                "서버": client.post("/api/convert", json={"text": text}).json()["lines"][0],
+                "analyze_sentence (분할)": segmented.analyze_sentence(text),
+            }
+            for source, actual in outputs.items():
+                same = actual == expected
+                mismatches += not same
+                print(f"{name:<12} {len(text):>6}자 {source:<24} 단어 {actual['word_count']:>5} / "
+                      f"{expected['word_count']:>5} {'일치' if same else '불일치'}")
+                if not same:
+                    first = next((i for i, (a, b) in enumerate(zip(actual["words"], expected["words"])) if a != b),
+                                 min(len(actual["words"]), len(expected["words"])))
+                    print(json.dumps({"index": first,
+                                      "actual": [w["surface"] for w in actual["words"][first:first + 5]],
+                                      "expected": [w["surface"] for w in expected["words"][first:first + 5]]},
+                                     ensure_ascii=False))
+
+    print(f"불일치: {mismatches}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+다중 워커 메모리 측정
+지금 Dockerfile의 실행 방식(uvicorn app:app, 워커 여러 개면 --workers N)과
+server.py(사전을 미리 로드한 뒤 fork)를 같은 워커 수로 띄우고 요청을 보낸 뒤
+프로세스별 RSS, PSS(공유 페이지를 나눠서 계산), USS(그 프로세스에만 있는 페이지)를 비교
+
+- RSS는 공유 페이지를 프로세스마다 다시 세므로 합계가 실제 사용량보다 큼, 실제 사용량은 PSS 합계
+- MeCab 사전 파일(sys.dic, matrix.bin)은 mmap이라서 두 방식 모두 페이지 캐시로 공유됨
+  fork 방식이 추가로 공유하는 것은 import한 모듈, extractor 객체 등 파이썬 힙
+
+사용법: python benchmarks/measure_rss.py [--workers N] [--requests N]
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORPUS_PATH = os.path.join(ROOT, "benchmarks", "corpus", "long.txt")
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def commands(workers, port):
+    """비교할 실행 방식 이름 → 명령"""
+    uvicorn = [sys.executable, "-m", "uvicorn", "app:app", "--port", str(port), "--log-level", "warning"]
+    if workers > 1:
+        uvicorn += ["--workers", str(workers)]
+    return {
+        "uvicorn": uvicorn,
+        "prefork": [sys.executable, "server.py", "--port", str(port), "--workers", str(workers),
+                    "--log-level", "warning"],
+    }
+
+
+def descendants(pid):
+    """pid와 모든 자손 프로세스 pid 리스트"""
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # comm에 공백/괄호가 있을 수 있으므로 마지막 ')' 뒤에서 ppid를 읽음
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    result = []
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        result.append(current)
+        stack.extend(children.get(current, []))
+    return result
+
+
+def memory(pid):
+    """(RSS, PSS, USS) KB (/proc/pid/smaps_rollup)"""
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[0].endswith(":") and parts[1].isdigit():
+                values[parts[0][:-1]] = int(parts[1])
+    return values["Rss"], values["Pss"], values["Private_Clean"] + values["Private_Dirty"]
+
+
+def measure(name, command, port, workers, body, requests):
+    env = dict(os.environ, WARMUP="blocking")
+    started = time.perf_counter()
+    server = subprocess.Popen(command, cwd=ROOT, env=env)
+    base = f"http://127.0.0.1:{port}"
+    try:
+        # 워커마다 준비가 끝나야 하므로 연속으로 여러 번 200이 나올 때까지 확인
+        ready_count = 0
+        while ready_count < workers * 4:
+            if server.poll() is not None:
+                raise RuntimeError(f"{name} 서버 시작 실패")
+            try:
+                ready = httpx.get(f"{base}/api/ready").status_code == 200
+            except httpx.HTTPError:
+                ready = False
+            ready_count = ready_count + 1 if ready else 0
+            if not ready:
+                time.sleep(0.05)
+        ready_seconds = time.perf_counter() - started
+
+        with httpx.Client(base_url=base, timeout=60) as client:
+            for _ in range(requests):
+                client.post("/api/convert", json=body)
+        time.sleep(0.5)
+
+        rows = []
+        for pid in descendants(server.pid):
+            try:
+                rows.append((pid, *memory(pid)))
+            except (OSError, KeyError):
+                pass
+    finally:
+        server.terminate()
+        server.wait()
+    return ready_seconds, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="다중 워커 메모리 측정")
+    parser.add_argument("--workers", type=int, default=4, help="워커 수 (기본 4)")
+    parser.add_argument("--requests", type=int, default=100, help="측정 전에 보낼 요청 수 (기본 100)")
+    args = parser.parse_args()
+
+    with open(CORPUS_PATH, encoding="utf-8") as f:
+        body = {"text": f.read()}
+
+    print(f"워커 {args.workers}개, 요청 {args.requests}개 후 측정 (MB)")
+    print(f"{'방식':<8} {'준비(초)':>8} {'프로세스':>8} {'RSS 합계':>9} {'PSS 합계':>9} "
+          f"{'워커 PSS':>9} {'워커 USS':>9}")
+    for name, command in commands(args.workers, free_port()).items():
+        port = int(command[command.index("--port") + 1])
+        ready_seconds, rows = measure(name, command, port, args.workers, body, args.requests)
+        # 워커 = 가장 큰 프로세스 workers개 (감독 프로세스, multiprocessing 보조 프로세스 제외)
+        worker_rows = sorted(rows, key=lambda row: row[2], reverse=True)[:args.workers]
+        rss = sum(row[1] for row in rows) / 1024
+        pss = sum(row[2] for row in rows) / 1024
+        worker_pss = sum(row[2] for row in worker_rows) / len(worker_rows) / 1024
+        worker_uss = sum(row[3] for row in worker_rows) / len(worker_rows) / 1024
+        print(f"{name:<8} {ready_seconds:>8.2f} {len(rows):>8} {rss:>9.1f} {pss:>9.1f} "
+              f"{worker_pss:>9.1f} {worker_uss:>9.1f}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+벤치마크 모음
+benchmarks/corpus의 가사(짧은 줄, 긴 줄, 한자 위주, 가나 위주, 라틴 혼합)로
+단계별 처리량(ops/s)과 최대 메모리를 측정
+
+단계:
+    kana_to_hangul          가타카나 발음 → 한글 (ops = 발음 문자열 1개)
+    get_all_replace_nodes   parseToNode 노드의 대체 노드 수집 (ops = 줄)
+    lattice_index           LatticeIndex 생성 + 토큰별 replace_nodes (ops = 줄)
+    extract_pronunciations  (ops = 줄)
+    analyze_sentence        (ops = 줄)
+    api_convert             ASGI TestClient로 /api/convert 호출, 줄 캐시 비움 (ops = 요청 1개 = 코퍼스 전체)
+
+사용법:
+    python benchmarks/run_suite.py                        # 결과 출력
+    python benchmarks/run_suite.py --save baseline.json   # 기준값 저장
+    python benchmarks/run_suite.py --compare baseline.json --threshold 0.15
+        # 기준값보다 처리량이 15% 넘게 줄거나 메모리가 15%(그리고 16KB) 넘게 늘면 종료 코드 1
+(기준값은 측정한 기계에서만 의미가 있으므로 같은 환경에서 저장/비교할 것)
+"""
+
+import argparse
+import gc
+import glob
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORPUS_DIR = os.path.join(ROOT, "benchmarks", "corpus")
+sys.path.insert(0, ROOT)
+
+from hangul_helper import kana_to_hangul  # noqa: E402
+from lattice_index import LatticeIndex  # noqa: E402
+
+
+# 메모리 회귀로 보지 않는 절대 증가량 (KB)
+MEMORY_SLACK_KB = 16
+
+
+def load_corpus(selected=None):
+    """카테고리 이름 → 줄 리스트"""
+    corpus = {}
+    for path in sorted(glob.glob(os.path.join(CORPUS_DIR, "*.txt"))):
+        name = os.path.splitext(os.path.basename(path))[0]
+        if selected and name not in selected:
+            continue
+        with open(path, encoding="utf-8") as f:
+            corpus[name] = [line.strip() for line in f if line.strip()]
+    return corpus
+
+
+def time_ops(func, ops, rounds, min_time):
+    """
+    func를 min_time초 이상 반복하는 측정을 rounds번 하고 가장 빠른 값으로 ops/s 계산
+    (가상 머신에서 다른 작업에 CPU를 뺏긴 시간이 섞이지 않도록 프로세스 CPU 시간으로 측정)
+
+    Args:
+        func: 한 번 호출에 ops개를 처리하는 함수
+        ops: 호출 한 번의 처리 개수
+        rounds: 측정 횟수
+        min_time: 측정 한 번의 최소 시간 (초)
+    """
+    func()  # 예열
+    best = None
+    for _ in range(rounds):
+        calls = 0
+        start = time.process_time()
+        while True:
+            func()
+            calls += 1
+            elapsed = time.process_time() - start
+            if elapsed >= min_time:
+                break
+        per_call = elapsed / calls
+        best = per_call if best is None else min(best, per_call)
+    return ops / best
+
+
+def peak_memory(func):
+    """func 한 번 호출 중 새로 할당된 최대 메모리 (바이트)"""
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def build_stages(extractor, client, app_module):
+    """단계 이름 → (카테고리 줄 리스트 → (함수, ops)) 생성기"""
+
+    def kana_stage(lines):
+        prons = [
+            (candidate["katakana_pron"], candidate["katakana_kana"])
+            for line in lines
+            for word in extractor.extract_pronunciations(line)
+            for candidate in word["alternative_pronunciations"]
+        ]
+
+        def run():
+            for pron, kana in prons:
+                kana_to_hangul(pron, use_hyphen=True)
+                kana_to_hangul(kana, use_hyphen=False)
+        return run, len(prons) * 2
+
+    def replace_nodes_stage(lines):
+        tagger = extractor.tagger
+
+        def run():
+            for line in lines:
+                node = tagger.parseToNode(line)
+                while node:
+                    if node.surface:
+                        extractor.get_all_replace_nodes(node, node.length)
+                    node = node.next
+        return run, len(lines)
+
+    def lattice_stage(lines):
+        tagger = extractor.tagger
+
+        def run():
+            for line in lines:
+                index = LatticeIndex.build(tagger, line)
+                for token_index in range(len(index.tokens)):
+                    index.replace_nodes(token_index)
+        return run, len(lines)
+
+    def extract_stage(lines):
+        def run():
+            for line in lines:
+                extractor.extract_pronunciations(line)
+        return run, len(lines)
+
+    def analyze_stage(lines):
+        def run():
+            for line in lines:
+                extractor.analyze_sentence(line)
+        return run, len(lines)
+
+    def api_stage(lines):
+        body = {"text": "\n".join(lines)}
+
+        def run():
+            app_module.line_cache.clear()
+            response = client.post("/api/convert", json=body)
+            assert response.status_code == 200, response.text
+        return run, 1
+
+    return {
+        "kana_to_hangul": kana_stage,
+        "get_all_replace_nodes": replace_nodes_stage,
+        "lattice_index": lattice_stage,
+        "extract_pronunciations": extract_stage,
+        "analyze_sentence": analyze_stage,
+        "api_convert": api_stage,
+    }
+
+
+def run_suite(corpus, stage_names, rounds, min_time, only=None):
+    """
+    Args:
+        corpus: 카테고리 이름 → 줄 리스트
+        stage_names: 실행할 단계 이름 리스트
+        rounds: 측정 횟수
+        min_time: 측정 한 번의 최소 시간 (초)
+        only: 이 "단계/카테고리" 항목만 실행 (None이면 전체)
+
+    Returns:
+        {"environment": {...}, "results": {"단계/카테고리": {"ops_per_sec", "peak_kb"}}}
+    """
+    warnings.simplefilter("ignore")
+    from fastapi.testclient import TestClient
+    import app as app_module
+
+    results = {}
+    with TestClient(app_module.app) as client:
+        extractor = app_module.extractor
+        stages = build_stages(extractor, client, app_module)
+        for stage_name in stage_names:
+            for category, lines in corpus.items():
+                key = f"{stage_name}/{category}"
+                if only is not None and key not in only:
+                    continue
+                func, ops = stages[stage_name](lines)
+                ops_per_sec = time_ops(func, ops, rounds, min_time)
+                peak = peak_memory(func)
+                results[key] = {
+                    "ops_per_sec": round(ops_per_sec, 1),
+                    "peak_kb": round(peak / 1024, 1),
+                }
+                print(f"{stage_name:<24} {category:<7} {ops_per_sec:>12.1f} ops/s {peak / 1024:>10.1f} KB",
+                      flush=True)
+
+        environment = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "dictionary": extractor.dictionary_id,
+        }
+
+    return {"environment": environment, "results": results}
+
+
+def compare(current, baseline, threshold):
+    """
+    기준값과 비교해서 회귀 항목 리스트 반환
+
+    Args:
+        current: run_suite 결과
+        baseline: 저장된 기준값
+        threshold: 허용 비율 (0.15 = 15%)
+    """
+    if current["environment"] != baseline.get("environment"):
+        print("주의: 기준값과 측정 환경이 다릅니다")
+        print(f"  기준: {baseline.get('environment')}")
+        print(f"  현재: {current['environment']}")
+
+    regressions = []
+    print(f"\n{'항목':<32} {'기준 ops/s':>12} {'현재 ops/s':>12} {'변화':>8} {'메모리 변화':>10}")
+    for key, result in current["results"].items():
+        base = baseline["results"].get(key)
+        if base is None:
+            continue
+        speed = result["ops_per_sec"] / base["ops_per_sec"] - 1
+        memory = result["peak_kb"] / base["peak_kb"] - 1 if base["peak_kb"] else 0.0
+        # 작은 할당량은 몇 KB만 달라져도 비율이 크게 변하므로 절대 증가량도 함께 확인
+        memory_regressed = memory > threshold and result["peak_kb"] - base["peak_kb"] > MEMORY_SLACK_KB
+        flag = ""
+        if speed < -threshold or memory_regressed:
+            regressions.append(key)
+            flag = "  ← 회귀"
+        print(f"{key:<32} {base['ops_per_sec']:>12.1f} {result['ops_per_sec']:>12.1f} "
+              f"{speed:>+8.1%} {memory:>+10.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="단계별 벤치마크 모음")
+    parser.add_argument("--stage", action="append", help="실행할 단계 (여러 번 지정 가능, 기본 전체)")
+    parser.add_argument("--category", action="append", help="사용할 코퍼스 카테고리 (기본 전체)")
+    parser.add_argument("--rounds", type=int, default=5, help="측정 횟수, 가장 빠른 값 사용 (기본 5)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="측정 한 번의 최소 시간 (초, 기본 0.2)")
+    parser.add_argument("--save", metavar="PATH", help="결과를 JSON 기준값으로 저장")
+    parser.add_argument("--compare", metavar="PATH", help="JSON 기준값과 비교")
+    parser.add_argument("--threshold", type=float, default=0.15, help="회귀 허용 비율 (기본 0.15)")
+    args = parser.parse_args()
+
+    all_stages = ["kana_to_hangul", "get_all_replace_nodes", "lattice_index",
+                  "extract_pronunciations", "analyze_sentence", "api_convert"]
+    stage_names = args.stage or all_stages
+    unknown = set(stage_names) - set(all_stages)
+    if unknown:
+        parser.error(f"알 수 없는 단계: {', '.join(sorted(unknown))}")
+
+    corpus = load_corpus(args.category)
+    if not corpus:
+        parser.error("코퍼스가 없습니다")
+
+    current = run_suite(corpus, stage_names, args.rounds, args.min_time)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+        print(f"\n기준값 저장: {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            # 순간적인 부하로 느려진 경우를 거르기 위해 회귀 항목만 다시 측정
+            print(f"\n회귀 {len(regressions)}건 재측정")
+            retry = run_suite(corpus, stage_names, args.rounds, args.min_time, only=set(regressions))
+            regressions = compare(retry, baseline, args.threshold)
+        if regressions:
+            print(f"\n회귀 {len(regressions)}건 (허용 {args.threshold:.0%})")
+            sys.exit(1)
+        print("\n회귀 없음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+디스크 캐시(PersistentCache) 스트레스 테스트 / 벤치마크
+1) 줄당 조회 시간(적중)과 새로 분석하는 시간 비교
+2) 여러 프로세스가 같은 데이터베이스에 동시에 읽고 쓰면서 항목 수 상한을 넘겨도
+   오류 없이 동작하고 항목 수가 상한 근처로 유지되는지 확인
+
+사용법: python benchmarks/stress_persistent_cache.py [--processes N] [--max-entries N] [--seconds S]
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from japanese_pron import JapanesePronunciationExtractor  # noqa: E402
+from persistent_cache import PersistentCache  # noqa: E402
+
+
+DICTIONARY = "stress"
+OPTIONS = (1, 0, 0.0)
+
+
+def load_lines():
+    lines = []
+    corpus_dir = os.path.join(ROOT, "benchmarks", "corpus")
+    for name in sorted(os.listdir(corpus_dir)):
+        with open(os.path.join(corpus_dir, name), encoding="utf-8") as f:
+            lines.extend(line.strip() for line in f if line.strip())
+    return list(dict.fromkeys(lines))
+
+
+def measure_lookup(path, lines):
+    """(줄당 분석 시간, 줄당 디스크 캐시 조회 시간) 초"""
+    extractor = JapanesePronunciationExtractor()
+    cache = PersistentCache(path)
+
+    start = time.perf_counter()
+    results = [(line, extractor.analyze_sentence(line)) for line in lines]
+    analyze = (time.perf_counter() - start) / len(lines)
+
+    cache.put_many(DICTIONARY, OPTIONS, results)
+    cache.get_texts(DICTIONARY, OPTIONS, lines)  # 예열
+    repeat = 20
+    start = time.perf_counter()
+    for _ in range(repeat):
+        found = cache.get_texts(DICTIONARY, OPTIONS, lines)
+    lookup = (time.perf_counter() - start) / (repeat * len(lines))
+    assert len(found) == len(lines)
+    return analyze, lookup
+
+
+def worker(path, max_entries, seconds, seed, template, queue):
+    """임의의 줄을 계속 조회/저장하고 (조회 수, 저장 수, 오류 수) 보고"""
+    cache = PersistentCache(path, max_entries=max_entries, touch_interval=0)
+    rng = random.Random(seed)
+    gets = puts = 0
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        texts = [f"行{rng.randrange(max_entries * 3)}" for _ in range(20)]
+        found = cache.get_texts(DICTIONARY, OPTIONS, texts)
+        gets += len(texts)
+        for text, result in found.items():
+            assert result["original_text"] == text, "다른 줄의 결과"
+        missing = [(text, dict(template, original_text=text)) for text in texts if text not in found]
+        cache.put_many(DICTIONARY, OPTIONS, missing)
+        puts += len(missing)
+    queue.put((gets, puts, cache.errors))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="디스크 캐시 스트레스 테스트")
+    parser.add_argument("--processes", type=int, default=4, help="동시에 쓰는 프로세스 수 (기본 4)")
+    parser.add_argument("--max-entries", type=int, default=2000, help="캐시 최대 항목 수 (기본 2000)")
+    parser.add_argument("--seconds", type=float, default=5, help="스트레스 시간 (초, 기본 5)")
+    args = parser.parse_args()
+
+    lines = load_lines()
+    with tempfile.TemporaryDirectory() as directory:
+        analyze, lookup = measure_lookup(os.path.join(directory, "lookup.sqlite"), lines)
+        print(f"줄 {len(lines)}개: 분석 {analyze * 1e6:.1f} us/줄, 디스크 캐시 조회 {lookup * 1e6:.1f} us/줄 "
+              f"({analyze / lookup:.1f}배)")
+
+        path = os.path.join(directory, "stress.sqlite")
+        template = JapanesePronunciationExtractor().analyze_sentence(lines[0])
+        queue = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(target=worker,
+                                    args=(path, args.max_entries, args.seconds, seed, template, queue))
+            for seed in range(args.processes)
+        ]
+        for process in processes:
+            process.start()
+        reports = [queue.get() for _ in processes]
+        for process in processes:
+            process.join()
+
+        gets = sum(report[0] for report in reports)
+        puts = sum(report[1] for report in reports)
+        errors = sum(report[2] for report in reports)
+        size = len(PersistentCache(path))
+        print(f"프로세스 {args.processes}개, {args.seconds:.0f}초: 조회 {gets}줄, 저장 {puts}줄, 오류 {errors}건, "
+              f"최종 항목 {size}개 (상한 {args.max_entries})")
+        if errors or size > args.max_entries * 1.2:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
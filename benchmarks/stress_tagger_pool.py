@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+TaggerPool 스트레스 검사
+여러 스레드에서 하나의 extractor를 동시에 호출하고, 결과를 단일 스레드 결과와 비교
+
+사용법: python benchmarks/stress_tagger_pool.py [스레드 수] [반복 횟수]
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from japanese_pron import JapanesePronunciationExtractor  # noqa: E402
+
+
+LINES = [
+    "心が僕らには最高で",
+    "燃えていて歌っている",
+    "息を繋ぐ僕らの声は何を望む",
+    "深い海の底で響く鼓動",
+    "人々の夢は今日も明日も続く",
+    "東京タワーから見下ろした街並み",
+    "彼女は静かに窓の外を見つめていた",
+    "Hello, world! 君と一緒にdance",
+]
+
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    extractor = JapanesePronunciationExtractor(pool_size=threads)
+    reference = {line: extractor.analyze_sentence(line) for line in LINES}
+
+    def worker(seed):
+        mismatches = 0
+        for i in range(rounds):
+            line = LINES[(seed + i) % len(LINES)]
+            if extractor.analyze_sentence(line) != reference[line]:
+                mismatches += 1
+        return mismatches
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        mismatches = sum(pool.map(worker, range(threads)))
+    elapsed = time.perf_counter() - start
+
+    total = threads * rounds
+    print(f"스레드 {threads}개 x {rounds}회: {total}줄, {elapsed:.2f}초, "
+          f"Tagger {extractor.taggers.size}개, 불일치 {mismatches}건")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+/api/convert 압축 응답 형식
+반복되는 문자열(품사, 발음 등)을 문자열 테이블 하나에 모으고
+단어/후보는 테이블 인덱스(정수) 배열로 표현
+
+형식:
+    {
+        "format": "compact",
+        "fields": [후보 필드 이름 (기본 9개, 분석할 때 필드를 지정하면 그 필드만)],
+        "strings": [문자열 테이블],
+        "lines": [[원문 인덱스, [단어...], truncated(0/1)], ...]
+    }
+    단어: [surface 인덱스, selected_id, [후보1 필드 인덱스 (fields 순서), 후보2 ..., ...]] (후보는 평탄화)
+"""
+
+import json
+from typing import Any, Dict, List, Sequence
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 사용
+    orjson = None
+
+
+# 후보 하나의 필드 순서
+CANDIDATE_FIELDS = (
+    "hiragana_pron", "hiragana_kana",
+    "katakana_pron", "katakana_kana",
+    "hangul_pron", "hangul_kana",
+    "pos1", "pos2", "pos3",
+)
+
+
+class StringTable:
+    """문자열 → 인덱스 테이블 (처음 나온 순서대로 번호 부여)"""
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def add(self, text: str) -> int:
+        index = self._index.get(text)
+        if index is None:
+            index = len(self.strings)
+            self._index[text] = index
+            self.strings.append(text)
+        return index
+
+
+def encode_compact(lines: List[Dict[str, Any]], fields: Sequence[str] = CANDIDATE_FIELDS,
+                   **extra: Any) -> Dict[str, Any]:
+    """
+    줄별 분석 결과를 압축 형식으로 변환
+
+    Args:
+        lines: analyze_sentence 결과 리스트
+        fields: 후보에 있는 필드 (AnalysisOptions.fields로 분석한 결과이면 그 필드)
+        extra: 응답에 그대로 넣을 추가 키 (detail_mode 등)
+
+    Returns:
+        압축 형식 딕셔너리
+    """
+    table = StringTable()
+    add = table.add
+    encoded_lines = []
+
+    for line in lines:
+        words = []
+        for word in line["words"]:
+            candidates = []
+            for alt in word["alternative_pronunciations"]:
+                candidates.extend(add(alt[field]) for field in fields)
+            words.append([add(word["surface"]), word["selected_id"], candidates])
+        encoded_lines.append([add(line["original_text"]), words, 1 if line.get("truncated") else 0])
+
+    payload = {
+        "format": "compact",
+        "fields": list(fields),
+        "strings": table.strings,
+        "lines": encoded_lines,
+    }
+    payload.update(extra)
+    return payload
+
+
+def decode_compact(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    압축 형식을 기존 응답 형식으로 복원
+
+    Args:
+        payload: encode_compact 결과
+
+    Returns:
+        {"lines": [...], 그 외 추가 키} 딕셔너리
+    """
+    strings = payload["strings"]
+    fields = payload["fields"]
+    field_count = len(fields)
+    lines = []
+
+    for original_index, words, truncated in payload["lines"]:
+        decoded_words = []
+        for surface_index, selected_id, candidates in words:
+            alternatives = [
+                {field: strings[candidates[i + j]] for j, field in enumerate(fields)}
+                for i in range(0, len(candidates), field_count)
+            ]
+            decoded_words.append({
+                "surface": strings[surface_index],
+                "selected_id": selected_id,
+                "alternative_pronunciations": alternatives,
+            })
+        line = {
+            "original_text": strings[original_index],
+            "word_count": len(decoded_words),
+            "words": decoded_words,
+        }
+        if truncated:
+            line["truncated"] = True
+        lines.append(line)
+
+    result = {key: value for key, value in payload.items()
+              if key not in ("format", "fields", "strings", "lines")}
+    result["lines"] = lines
+    return result
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    JSON 직렬화 (orjson이 있으면 orjson 사용)
+
+    Args:
+        obj: 직렬화할 객체
+
+    Returns:
+        UTF-8 JSON 바이트
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: bytes) -> Any:
+    """
+    dumps의 역변환 (orjson이 있으면 orjson 사용)
+
+    Args:
+        data: UTF-8 JSON 바이트
+
+    Returns:
+        역직렬화한 객체
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -5,48 +5,8 @@ C# RomajiConverter.Core의 KanaHelper.cs를 Python으로 포팅
 """
 
 
-def to_hiragana(text):
-    """
-    가타카나를 히라가나로 변환
-    
-    Args:
-        text: 변환할 문자열
-    
-    Returns:
-        히라가나로 변환된 문자열
-    """
-    result = []
-    for ch in text:
-        code = ord(ch)
-        # 가타카나 범위 (U+30A0 ~ U+30FA)
-        if 0x30A0 <= code <= 0x30FA:
-            # 히라가나로 변환 (0x60 빼기)
-            result.append(chr(code - 0x60))
-        else:
-            result.append(ch)
-    return ''.join(result)
-
-
-def to_katakana(text):
-    """
-    히라가나를 가타카나로 변환
-    
-    Args:
-        text: 변환할 문자열
-    
-    Returns:
-        가타카나로 변환된 문자열
-    """
-    result = []
-    for ch in text:
-        code = ord(ch)
-        # 히라가나 범위 (U+3040 ~ U+309F)
-        if 0x3040 <= code <= 0x309F:
-            # 가타카나로 변환 (0x60 더하기)
-            result.append(chr(code + 0x60))
-        else:
-            result.append(ch)
-    return ''.join(result)
+# 히라가나/카타카나 변환은 japanese_script 모듈의 테이블 방식 사용 (기존 import 경로 유지)
+from japanese_script import to_hiragana, to_katakana  # noqa: F401
 
 
 # 기본 가나 → 한글 변환 사전
@@ -164,11 +124,57 @@ def add_jongseong(char, jongseong_index):
     return chr(new_char)
 
 
+# 촉음/ん → 종성 인덱스 (ㅅ: 19, ㄴ: 4)
+BATCHIM_KANA = {"っ": 19, "ッ": 19, "ん": 4, "ン": 4}
+
+# 앞 글자에 붙일 수 없을 때 사용하는 단독 자모
+STANDALONE_JAMO = {19: "ㅅ", 4: "ㄴ"}
+
+
+def _build_conversion_tables():
+    """
+    kana_to_hangul에서 사용하는 변환 테이블을 미리 생성
+
+    Returns:
+        (1글자 변환 테이블, 2글자 변환 테이블, 종성 추가 테이블) 튜플
+    """
+    # 1글자: 기본 가나 + 장음 기호
+    single = dict(KANA_DICT)
+    single["ー"] = "-"
+
+    # 2글자: 첫 글자 → {둘째 글자: 한글}
+    # (1글자 키는 2글자 비교에서 일치할 수 없으므로 제외 - 기존 동작과 동일)
+    digraphs = {}
+    for kana, hangul in EXTENDED_KANA_DICT.items():
+        if len(kana) == 2:
+            digraphs.setdefault(kana[0], {})[kana[1]] = hangul
+
+    # 변환 결과로 나올 수 있는 음절에 대해 받침 추가 결과를 미리 계산
+    syllables = set(single.values()) | set(EXTENDED_KANA_DICT.values())
+    syllables = {ch for ch in syllables if 0xAC00 <= ord(ch) <= 0xD7A3}
+    with_jongseong = {}
+    for jongseong_index in BATCHIM_KANA.values():
+        table = {}
+        for syllable in syllables:
+            base = add_jongseong(syllable, 0)
+            for variant in (base, add_jongseong(base, 4), add_jongseong(base, 19)):
+                table[variant] = add_jongseong(variant, jongseong_index)
+        with_jongseong[jongseong_index] = table
+
+    return single, digraphs, with_jongseong
+
+
+_SINGLE_TABLE, _DIGRAPH_TABLE, _JONGSEONG_TABLE = _build_conversion_tables()
+
+
 def kana_to_hangul(text, use_hyphen=True):
     """
     가나를 한글로 변환
     C# KanaHelper.KatakanaToRomaji의 한글 버전
     
+    미리 생성한 테이블로 한 번에 훑으면서 요음(2글자)을 먼저 찾고,
+    촉음(っ)과 ん은 그 자리에서 바로 앞 음절의 받침으로 붙인다.
+    
     Args:
         text: 변환할 가나 문자열
         use_hyphen: 장음을 하이픈(-)으로 표시할지 여부
@@ -177,62 +183,42 @@ def kana_to_hangul(text, use_hyphen=True):
         한글로 변환된 문자열
     """
     result = []
+    append = result.append
+    single_get = _SINGLE_TABLE.get
+    digraph_get = _DIGRAPH_TABLE.get
+    batchim_get = BATCHIM_KANA.get
+    length = len(text)
     i = 0
     
-    while i < len(text):
-        # 2글자 확장 가나 체크
-        if i < len(text) - 1:
-            two_char = text[i:i+2]
-            if two_char in EXTENDED_KANA_DICT:
-                result.append(EXTENDED_KANA_DICT[two_char])
-                i += 2
-                continue
-        
-        # 1글자 가나 체크
+    while i < length:
         char = text[i]
-        if char in KANA_DICT:
-            result.append(KANA_DICT[char])
-        elif char == "ー":
-            # 장음 처리
-            result.append("-")
-        else:
-            # 변환 불가능한 문자는 그대로 유지
-            result.append(char)
-        
-        i += 1
-    
-    # 촉음(っ, ッ)과 ん(ン) 처리
-    i = 0
-    while i < len(result):
-        current = result[i]
         
-        # 촉음 처리
-        if current in ['っ', 'ッ']:
-            if i == 0 or len(result) <= 1:
-                result[i] = 'ㅅ'  # 기본값
-            else:
-                # 이전 문자에 ㅅ 받침 추가
-                prev_char = result[i - 1]
-                if 0xAC00 <= ord(prev_char) <= 0xD7A3:
-                    result[i - 1] = add_jongseong(prev_char, 19)  # ㅅ
-                    result.pop(i)
-                    i -= 1
-                else:
-                    result[i] = 'ㅅ'
+        # 2글자 확장 가나 체크
+        if i + 1 < length:
+            followers = digraph_get(char)
+            if followers is not None:
+                hangul = followers.get(text[i + 1])
+                if hangul is not None:
+                    append(hangul)
+                    i += 2
+                    continue
         
-        # ん(ン) 처리
-        elif current in ['ん', 'ン']:
-            if i == 0 or len(result) <= 1:
-                result[i] = 'ㄴ'  # 기본값
-            else:
-                # 이전 문자에 ㄴ 받침 추가
-                prev_char = result[i - 1]
-                if 0xAC00 <= ord(prev_char) <= 0xD7A3:
-                    result[i - 1] = add_jongseong(prev_char, 4)  # ㄴ
-                    result.pop(i)
-                    i -= 1
-                else:
-                    result[i] = 'ㄴ'
+        # 촉음(っ, ッ)과 ん(ン): 앞 음절에 받침 추가
+        jongseong_index = batchim_get(char)
+        if jongseong_index is not None:
+            if result:
+                prev_char = result[-1]
+                folded = _JONGSEONG_TABLE[jongseong_index].get(prev_char)
+                if folded is None and 0xAC00 <= ord(prev_char) <= 0xD7A3:
+                    folded = add_jongseong(prev_char, jongseong_index)
+                if folded is not None:
+                    result[-1] = folded
+                    i += 1
+                    continue
+            append(STANDALONE_JAMO[jongseong_index])
+        else:
+            # 1글자 가나 (변환 불가능한 문자는 그대로 유지)
+            append(single_get(char, char))
         
         i += 1
     
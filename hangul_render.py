@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+분석 결과를 최종 한글 텍스트로 만드는 렌더링 모듈
+static/output.js의 getLineTextWithOptions와 같은 규칙(공백 추가, 응/촉음 세분화,
+단독 ㅅ/ㄴ 받침 처리, 장음 하이픈)을 Python으로 옮긴 것
+"""
+
+from typing import Any, Dict, List, NamedTuple, Optional
+
+
+# 종성 인덱스
+JONG_NIEUN = 4     # ㄴ
+JONG_MIEUM = 16    # ㅁ
+JONG_IEUNG = 21    # ㅇ
+JONG_SIOT = 19     # ㅅ
+JONG_GIYEOK = 1    # ㄱ
+JONG_DIGEUT = 7    # ㄷ
+JONG_BIEUP = 17    # ㅂ
+JONG_RIEUL = 8     # ㄹ
+
+NN_JONGSEONG = (JONG_NIEUN, JONG_IEUNG, JONG_MIEUM)
+XTS_JONGSEONG = (JONG_SIOT, JONG_GIYEOK, JONG_DIGEUT, JONG_BIEUP, JONG_RIEUL)
+
+# 단독 자모 → 받침으로 붙일 종성
+SINGLE_JAMO_JONGSEONG = {'ㅅ': JONG_SIOT, 'ㄴ': JONG_NIEUN}
+
+
+class RenderOptions(NamedTuple):
+    """출력 옵션 (output.html 체크박스와 같은 기본값)"""
+    use_hyphen: bool = True
+    add_space: bool = False
+    clarify_nn: bool = False
+    clarify_xts: bool = False
+    show_original: bool = False
+
+
+def decompose_hangul(char: Optional[str]):
+    """
+    한글 음절을 (초성, 중성, 종성) 인덱스로 분해
+
+    Args:
+        char: 분해할 문자
+
+    Returns:
+        (초성, 중성, 종성) 튜플, 한글 음절이 아니면 None
+    """
+    if not char:
+        return None
+    code = ord(char[0])
+    if code < 0xAC00 or code > 0xD7A3:
+        return None
+    index = code - 0xAC00
+    return index // (21 * 28), (index % (21 * 28)) // 28, index % 28
+
+
+def compose_hangul(choseong: int, jungseong: int, jongseong: int) -> str:
+    """초성, 중성, 종성 인덱스로 한글 음절 조합"""
+    return chr(0xAC00 + (choseong * 21 * 28) + (jungseong * 28) + jongseong)
+
+
+def clarify_nn(char: str, next_char: Optional[str]) -> str:
+    """
+    응(ㄴ) 세분화: ㄴ, ㅇ, ㅁ 받침을 다음 글자에 따라 변환
+
+    Args:
+        char: 받침을 바꿀 글자
+        next_char: 다음 글자 (None이면 문장 끝)
+
+    Returns:
+        변환된 글자
+    """
+    decomposed = decompose_hangul(char)
+    if decomposed is None:
+        return char
+
+    choseong, jungseong, jongseong = decomposed
+
+    # 종성이 ㄴ, ㅇ, ㅁ인 경우만 처리
+    if jongseong not in NN_JONGSEONG:
+        return char
+
+    if next_char == ' ' or next_char == '아' or next_char is None:
+        # 공백이거나 문장 끝인 경우 ㅇ으로
+        jongseong = JONG_IEUNG
+    else:
+        next_decomposed = decompose_hangul(next_char)
+        if next_decomposed is not None:
+            next_choseong = next_decomposed[0]
+            if next_choseong in (0, 15, 11):
+                # ㄱ, ㅋ, ㅇ → ㅇ으로
+                jongseong = JONG_IEUNG
+            elif next_choseong in (6, 7, 17):
+                # ㅁ, ㅂ, ㅍ → ㅁ으로
+                jongseong = JONG_MIEUM
+            else:
+                # 그 외 → ㄴ으로
+                jongseong = JONG_NIEUN
+
+    return compose_hangul(choseong, jungseong, jongseong)
+
+
+def clarify_xts(char: str, next_char: Optional[str]) -> str:
+    """
+    촉음(ㅅ) 세분화: ㅅ, ㄱ, ㄷ, ㅂ, ㄹ 받침을 다음 글자에 따라 변환
+
+    Args:
+        char: 받침을 바꿀 글자
+        next_char: 다음 글자 (None이면 문장 끝)
+
+    Returns:
+        변환된 글자
+    """
+    decomposed = decompose_hangul(char)
+    if decomposed is None:
+        return char
+
+    choseong, jungseong, jongseong = decomposed
+
+    # 종성이 ㅅ, ㄱ, ㄷ, ㅂ, ㄹ인 경우만 처리
+    if jongseong not in XTS_JONGSEONG:
+        return char
+
+    if next_char == ' ' or next_char is None:
+        # 공백이거나 문장 끝인 경우 변환 안 함
+        return char
+
+    next_decomposed = decompose_hangul(next_char)
+    if next_decomposed is not None:
+        next_choseong = next_decomposed[0]
+        if next_choseong == 15:
+            # ㅋ → ㄱ으로
+            jongseong = JONG_GIYEOK
+        elif next_choseong == 16:
+            # ㅌ → ㄷ으로
+            jongseong = JONG_DIGEUT
+        elif next_choseong == 17:
+            # ㅍ → ㅂ로
+            jongseong = JONG_BIEUP
+        elif next_choseong == 5:
+            # ㄹ → ㄹ로
+            jongseong = JONG_RIEUL
+        else:
+            # 그 외 → ㅅ으로
+            jongseong = JONG_SIOT
+
+    return compose_hangul(choseong, jungseong, jongseong)
+
+
+def attach_jongseong(text: str, clarify_nn_flag: bool, clarify_xts_flag: bool) -> str:
+    """
+    단독 ㅅ, ㄴ을 앞 글자에 받침으로 추가
+
+    Args:
+        text: 줄 텍스트
+        clarify_nn_flag: 응(ㄴ) 세분화 여부
+        clarify_xts_flag: 촉음(ㅅ) 세분화 여부
+
+    Returns:
+        받침을 붙인 텍스트
+    """
+    if len(text) <= 1:
+        return text
+
+    result = ''
+    last = len(text) - 1
+
+    for i, current in enumerate(text):
+        # ㅅ 또는 ㄴ이 단독으로 존재하고, 앞 글자가 있는 경우
+        if i > 0 and current in SINGLE_JAMO_JONGSEONG:
+            previous_char = text[i - 1]
+            previous_index = i - 1
+
+            # 앞 글자가 공백인 경우 건너뛰기
+            if previous_char == ' ' and i > 1:
+                previous_char = text[i - 2]
+                previous_index = i - 2
+                result = result[:-1]  # 공백 제거
+
+            # 장음 하이픈 예외 처리
+            is_hyphen = previous_char == '-'
+            if is_hyphen and previous_index > 0:
+                previous_char = text[previous_index - 1]
+
+            decomposed = decompose_hangul(previous_char)
+            if decomposed is not None:
+                choseong, jungseong, _ = decomposed
+
+                # 장음이면 초성 ㅇ으로
+                if is_hyphen:
+                    choseong = 11
+
+                new_char = compose_hangul(choseong, jungseong, SINGLE_JAMO_JONGSEONG[current])
+
+                # 다음 글자와 비교해 응, 촉음 발음 세분화
+                if i != last:
+                    if clarify_nn_flag:
+                        new_char = clarify_nn(new_char, text[i + 1])
+                    if clarify_xts_flag:
+                        new_char = clarify_xts(new_char, text[i + 1])
+
+                # 결과에 추가 (이전 글자는 제거, 새 글자 추가)
+                result = result[:-1] + new_char
+                continue
+
+        # 일반 문자는 그대로 추가
+        result += current
+
+    return result
+
+
+def process_word_internal(text: str, clarify_nn_flag: bool, clarify_xts_flag: bool) -> str:
+    """
+    단어 내부의 응/촉음 세분화 처리
+
+    Args:
+        text: 단어 한글 발음
+        clarify_nn_flag: 응(ㄴ) 세분화 여부
+        clarify_xts_flag: 촉음(ㅅ) 세분화 여부
+
+    Returns:
+        세분화된 단어
+    """
+    if len(text) <= 1:
+        return text
+
+    chars = []
+    last = len(text) - 1
+    for i, char in enumerate(text):
+        # 다음 글자가 있으면 세분화 적용
+        if i < last:
+            if clarify_nn_flag:
+                char = clarify_nn(char, text[i + 1])
+            if clarify_xts_flag:
+                char = clarify_xts(char, text[i + 1])
+        elif clarify_nn_flag:
+            # 마지막 글자는 '아'로 처리 (문장 끝)
+            char = clarify_nn(char, '아')
+        chars.append(char)
+
+    return ''.join(chars)
+
+
+def get_selected(word: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """단어에서 선택된 발음 후보 (없으면 None)"""
+    alternatives = word.get("alternative_pronunciations") or []
+    if not alternatives:
+        return None
+    selected_id = word.get("selected_id", 0)
+    if isinstance(selected_id, int) and 0 <= selected_id < len(alternatives):
+        return alternatives[selected_id]
+    return alternatives[0]
+
+
+def should_add_space(selected: Dict[str, Any], prev_selected: Dict[str, Any]) -> bool:
+    """
+    두 단어 사이에 공백을 넣을지 판단 (C# 코드의 공백 조건을 반대로 적용)
+
+    Args:
+        selected: 현재 단어의 선택된 발음
+        prev_selected: 이전 단어의 선택된 발음
+    """
+    pos1 = selected.get("pos1")
+    pos2 = selected.get("pos2")
+    pos3 = selected.get("pos3")
+    prev_pos1 = prev_selected.get("pos1")
+    prev_pos2 = prev_selected.get("pos2")
+
+    return not (
+        pos1 in ('助詞', '助動詞', '接尾辞') or
+        pos2 == '非自立' or
+        (prev_pos1 != '助詞' and pos2 == '非自立可能') or
+        (prev_pos2 == '接続助詞' and pos1 == '動詞') or  # 接続助詞 뒤의 動詞는 보조동사
+        prev_pos1 == '接頭辞' or
+        (prev_pos2 == '数詞' and (pos2 == '数詞' or pos3 == '助数詞可能'))
+    )
+
+
+def render_line(words: List[Dict[str, Any]], options: RenderOptions = RenderOptions()) -> str:
+    """
+    단어 리스트를 옵션에 맞춰 한 줄의 한글 텍스트로 렌더링
+
+    Args:
+        words: analyze_sentence 결과의 words
+        options: 출력 옵션
+
+    Returns:
+        렌더링된 한 줄
+    """
+    if not words:
+        return ''
+
+    result = ''
+    previous_word = None
+    pron_key = "hangul_pron" if options.use_hyphen else "hangul_kana"
+
+    for word in words:
+        selected = get_selected(word)
+
+        # alternative_pronunciations가 비어있으면 surface 사용
+        if selected is None:
+            result += word["surface"]
+            previous_word = word
+            continue
+
+        is_proper_noun = selected.get("pos2") == '固有名詞'
+
+        # 기본 텍스트 가져오기
+        word_text = selected.get(pron_key) or word["surface"]
+
+        # 단어 내부 세분화 처리 (고유명사 제외)
+        if not is_proper_noun:
+            word_text = process_word_internal(word_text, options.clarify_nn, options.clarify_xts)
+
+        # 공백 추가 조건 확인
+        add_space = False
+        if previous_word is not None and options.add_space:
+            prev_selected = get_selected(previous_word)
+            if prev_selected is not None:
+                add_space = should_add_space(selected, prev_selected)
+
+        if add_space and result and word_text:
+            # 공백이 추가될 경우, 이전 글자의 응 발음을 '아'(문장 끝)로 처리
+            if options.clarify_nn:
+                result = result[:-1] + clarify_nn(result[-1], '아')
+            result += ' '
+        elif previous_word is not None and result and word_text:
+            # 공백이 추가되지 않을 경우, 다음 글자와 비교해 세분화
+            clarified_char = result[-1]
+            if options.clarify_nn:
+                clarified_char = clarify_nn(clarified_char, word_text[0])
+            if options.clarify_xts:
+                clarified_char = clarify_xts(clarified_char, word_text[0])
+            result = result[:-1] + clarified_char
+
+        result += word_text
+        previous_word = word
+
+    # 라인의 첫 번째 문자가 공백이면 제거
+    if result.startswith(' '):
+        result = result.lstrip()
+
+    # 마지막으로 단독 ㅅ, ㄴ을 앞 글자에 받침으로 추가
+    return attach_jongseong(result, options.clarify_nn, options.clarify_xts)
+
+
+def render_lines(lines: List[Dict[str, Any]], options: RenderOptions = RenderOptions()) -> List[str]:
+    """
+    여러 줄 렌더링 (출력 페이지의 복사하기와 같은 형식)
+    빈 줄은 빈 문자열, show_original이면 원문 줄을 변환 줄 앞에 추가
+
+    Args:
+        lines: analyze_sentence 결과 리스트
+        options: 출력 옵션
+
+    Returns:
+        출력 줄 리스트
+    """
+    output = []
+    for line in lines:
+        if not line["words"]:
+            output.append('')
+            continue
+        if options.show_original:
+            output.append(line["original_text"])
+        output.append(render_line(line["words"], options))
+    return output
@@ -4,41 +4,201 @@
 """
 
 import MeCab
+import argparse
 import json
+import multiprocessing
+import os
 import sys
-from typing import List, Dict, Any
+import time
+from functools import lru_cache, partial
+from typing import List, Dict, Any, Iterable, Iterator, Optional, NamedTuple, Tuple
 from hangul_helper import kana_to_hangul
+from hangul_render import RenderOptions, render_lines
+from japanese_script import to_hiragana, to_katakana, has_kanji, split_long_line
+from tagger_pool import TaggerPool
+from lattice_index import LatticeIndex
+from mecab_features import FeatureParser, NodeFeatures
+import metrics
+
+
+# 시스템 패키지로 설치한 UniDic 경로 (사전 경로를 지정하지 않았을 때 우선 사용)
+SYSTEM_UNIDIC_DIR = '/usr/lib/x86_64-linux-gnu/mecab/dic/unidic'
+
+# N-best 경로 수 기본 상한 (CLI 검사, 서버는 MAX_NBEST 환경 변수로 변경 가능)
+MAX_NBEST = 50
+
+
+class AnalysisOptions(NamedTuple):
+    """
+    줄 하나를 분석할 때의 품질/지연 시간 설정
+    
+    nbest: 대체 발음을 모을 분할 경로 수 (1이면 1-best lattice 대체 노드만)
+    max_candidates: 단어당 최대 발음 후보 수 (0이면 제한 없음)
+    time_limit: 줄당 분석 시간 제한 (초, 0이면 제한 없음)
+        - 넘으면 N-best 탐색을 멈추고 남은 단어는 1-best 발음만 사용
+    fields: 후보에 계산해서 넣을 필드 (normalize_fields 결과, 빈 튜플이면 전체)
+    """
+    nbest: int = 1
+    max_candidates: int = 0
+    time_limit: float = 0.0
+    fields: Tuple[str, ...] = ()
+
+
+class Candidate(NamedTuple):
+    """발음 후보 하나 (필드 순서는 API 응답의 후보 딕셔너리와 동일)"""
+    hiragana_pron: str
+    hiragana_kana: str
+    katakana_pron: str
+    katakana_kana: str
+    hangul_pron: str
+    hangul_kana: str
+    pos1: str
+    pos2: str
+    pos3: str
+    
+    def to_dict(self, fields: Tuple[str, ...] = ()) -> Dict[str, str]:
+        """API 응답용 딕셔너리 (fields가 있으면 그 필드만)"""
+        if not fields:
+            return dict(zip(self._fields, self))
+        return {field: getattr(self, field) for field in fields}
+
+
+class Token(NamedTuple):
+    """단어 하나의 분석 결과 (후보는 첫 번째가 기본 선택)"""
+    surface: str
+    candidates: List[Candidate]
+    
+    def to_dict(self, fields: Tuple[str, ...] = ()) -> Dict[str, Any]:
+        """API 응답용 딕셔너리 (fields가 있으면 후보에 그 필드만)"""
+        return {
+            "surface": self.surface,  # 원문
+            "selected_id": 0,  # 기본 선택 (0-based 인덱스)
+            "alternative_pronunciations": [candidate.to_dict(fields) for candidate in self.candidates]  # 대체 발음들
+        }
+
+
+# 후보 필드별 계산 함수 (UniDic이 히라가나/카타카나를 혼합해서 반환할 수 있으므로 정규화)
+# (katakana_pron은 UniDic 값을 그대로 사용, 한글은 pron은 하이픈, kana는 모음 반복)
+CANDIDATE_BUILDERS = {
+    "hiragana_pron": lambda features: to_hiragana(features.pron),
+    "hiragana_kana": lambda features: to_hiragana(features.kana),
+    "katakana_pron": lambda features: features.pron,
+    "katakana_kana": lambda features: to_katakana(features.kana),
+    "hangul_pron": lambda features: kana_to_hangul(features.pron, use_hyphen=True),
+    "hangul_kana": lambda features: kana_to_hangul(features.kana, use_hyphen=False),
+    "pos1": lambda features: features.pos1,
+    "pos2": lambda features: features.pos2,
+    "pos3": lambda features: features.pos3,
+}
+
+# Candidate 필드 순서의 전체 계산 함수 (필드를 지정하지 않은 경우)
+ALL_CANDIDATE_BUILDERS = tuple(CANDIDATE_BUILDERS[field] for field in Candidate._fields)
+
+# fields에 필드 이름 대신 쓸 수 있는 출력 프로필
+FIELD_PROFILES = {
+    "full": Candidate._fields,
+    # 한글 렌더링(render_lines, 출력 페이지)에 필요한 필드
+    "hangul": ("hangul_pron", "hangul_kana", "pos1", "pos2", "pos3"),
+    "kana": ("hiragana_pron", "hiragana_kana", "katakana_pron", "katakana_kana", "pos1", "pos2", "pos3"),
+}
+
+
+def normalize_fields(names: Optional[Iterable[str]]) -> Tuple[str, ...]:
+    """
+    요청한 필드/프로필 이름을 AnalysisOptions.fields 값으로 정규화
+    같은 필드 집합이면 같은 값이 되도록 Candidate 필드 순서로 정렬 (캐시 키에 포함되므로)
+    
+    Args:
+        names: 필드 이름 또는 FIELD_PROFILES 이름 (None이나 빈 값이면 전체)
+        
+    Returns:
+        필드 이름 튜플 (전체 필드이면 빈 튜플)
+        
+    Raises:
+        ValueError: 알 수 없는 이름이 있는 경우
+    """
+    requested = set()
+    for name in names or ():
+        name = name.strip()
+        if name in FIELD_PROFILES:
+            requested.update(FIELD_PROFILES[name])
+        elif name in CANDIDATE_BUILDERS:
+            requested.add(name)
+        elif name:
+            raise ValueError(f"알 수 없는 필드: {name} "
+                             f"(필드: {', '.join(Candidate._fields)} / 프로필: {', '.join(FIELD_PROFILES)})")
+    if not requested or len(requested) == len(Candidate._fields):
+        return ()
+    return tuple(field for field in Candidate._fields if field in requested)
+
+
+@lru_cache(maxsize=None)
+def candidate_builders(fields: Tuple[str, ...]) -> Tuple[Any, ...]:
+    """Candidate 필드 순서의 계산 함수 튜플 (fields에 없는 필드는 None)"""
+    return tuple(CANDIDATE_BUILDERS[field] if field in fields else None for field in Candidate._fields)
 
 
 class JapanesePronunciationExtractor:
-    def __init__(self, dict_path=None, nbest=10):
+    # 한자가 없는 단어는 첫 후보만 쓰므로 1-best 노드의 발음만 읽는다
+    # (False면 모든 단어에 대체 노드 탐색 - 결과 비교/벤치마크용)
+    kana_fast_path = True
+    
+    # 이 글자 수보다 긴 줄(줄바꿈 없이 붙여 넣은 문단 등)은 문장/구절 경계에서 나눠서 분석한 뒤 합침
+    # (시간 제한은 조각마다 적용, 0이면 나누지 않음)
+    segment_chars = 200
+    
+    def __init__(self, dict_path=None, nbest=1, pool_size=None,
+                 max_candidates=0, time_limit=0.0, segment_chars=None):
         """
         MeCab 초기화
         
         Args:
-            dict_path: UniDic 사전 경로 (None이면 기본 사전 사용)
+            dict_path: UniDic 사전 경로 (None이면 시스템 UniDic, 없으면 기본 사전 사용)
             nbest: N-best 결과 개수 (여러 발음 가능성을 얻기 위해)
+            pool_size: 동시에 사용할 수 있는 Tagger 수 (None이면 CPU 코어 수)
+            max_candidates: 단어당 최대 발음 후보 수 기본값 (0이면 제한 없음)
+            time_limit: 줄당 분석 시간 제한 기본값 (초, 0이면 제한 없음)
+            segment_chars: 긴 줄을 나누는 글자 수 (None이면 클래스 기본값, 0이면 나누지 않음
+                - 호출하는 쪽에서 이미 나눈 경우)
         """
         self.nbest = nbest
+        if segment_chars is not None:
+            self.segment_chars = segment_chars
+        self.default_options = AnalysisOptions(nbest, max_candidates, time_limit)
         
         # lattice-level=1 옵션으로 lattice 정보 활성화
         lattice_option = '--lattice-level=1'
         
-        if dict_path:
-            self.tagger = MeCab.Tagger(f'-d {dict_path} {lattice_option}')
-        else:
-            # UniDic 사용 시도
-            try:
-                self.tagger = MeCab.Tagger(f'-d /usr/lib/x86_64-linux-gnu/mecab/dic/unidic {lattice_option}')
-            except:
-                # 기본 사전 사용
-                self.tagger = MeCab.Tagger(lattice_option)
+        if not dict_path and os.path.isdir(SYSTEM_UNIDIC_DIR):
+            # 시스템에 UniDic이 설치되어 있으면 사용 (없으면 MeCab 기본 사전)
+            dict_path = SYSTEM_UNIDIC_DIR
+        
+        self.tagger_args = f'-d {dict_path} {lattice_option}' if dict_path else lattice_option
+        self.tagger = MeCab.Tagger(self.tagger_args)
+        
+        # Tagger는 스레드 간 공유가 안전하지 않으므로 풀에서 빌려서 사용
+        # (self.tagger는 풀의 첫 번째 Tagger - 사전 정보 조회용으로만 사용)
+        self.taggers = TaggerPool(
+            lambda: MeCab.Tagger(self.tagger_args),
+            max_size=pool_size,
+            initial=self.tagger,
+        )
+        
+        # 캐시 키 등에 사용할 사전 식별자 (사전 파일 경로 + 버전)
+        dict_info = self.tagger.dictionary_info()
+        self.dictionary_id = f"{dict_info.filename}:{dict_info.version}"
+        
+        # 사전 형식(UniDic/IPAdic)은 여기서 한 번만 판별
+        self.features = FeatureParser.detect(self.tagger)
     
     def get_all_replace_nodes(self, node, length):
         """
         GetAllReplaceNode 함수의 파이썬 구현 (C# 원본 그대로)
         같은 길이를 가진 모든 대체 가능한 노드들을 재귀적으로 수집
         
+        extract_pronunciations는 LatticeIndex.replace_nodes를 사용하며,
+        이 함수는 parseToNode 노드를 직접 다룰 때와 비교용으로 남겨둔다.
+        
         Args:
             node: MeCab 노드
             length: 대상 길이
@@ -75,202 +235,435 @@ class JapanesePronunciationExtractor:
         collect_nodes(node)
         return result
     
-    def extract_pronunciations(self, text: str) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _make_candidate(features: NodeFeatures) -> Candidate:
+        """
+        발음 후보 생성 (모든 필드를 CANDIDATE_BUILDERS로 계산)
+        
+        Args:
+            features: 후보의 품사와 발음 (pron: 장음 하이픈, kana: 장음 모음 반복)
+            
+        Returns:
+            Candidate
+        """
+        return Candidate._make([build(features) for build in ALL_CANDIDATE_BUILDERS])
+    
+    @staticmethod
+    def _make_projected_candidate(features: NodeFeatures, builders: Tuple[Any, ...]) -> Candidate:
+        """
+        요청한 필드만 계산한 발음 후보 생성 (나머지 필드는 None)
+        
+        Args:
+            features: 후보의 품사와 발음
+            builders: candidate_builders(options.fields)
+            
+        Returns:
+            Candidate
+        """
+        return Candidate._make([build(features) if build else None for build in builders])
+    
+    def extract_pronunciations(self, text: str, options: Optional[AnalysisOptions] = None) -> List[Dict[str, Any]]:
         """
         입력 텍스트의 각 단어에 대한 품사와 발음 정보 추출
         
         Args:
             text: 분석할 일본어 텍스트
+            options: 분석 설정 (None이면 생성 시 지정한 기본값)
             
         Returns:
-            단어 정보 리스트
+            단어 정보 리스트 (options.fields가 있으면 후보에 그 필드만)
+        """
+        options = options or self.default_options
+        tokens, _ = self.analyze_tokens(text, options)
+        return [token.to_dict(options.fields) for token in tokens]
+    
+    def analyze_tokens(self, text: str, options: Optional[AnalysisOptions] = None) -> Tuple[List[Token], bool]:
         """
-        # 기본 파싱 (1-best)
-        self.tagger.parse('')  # 버그 방지
-        node = self.tagger.parseToNode(text)
+        extract_pronunciations의 내부 표현 버전 (딕셔너리 대신 Token/Candidate)
         
-        results = []
+        Args:
+            text: 분석할 일본어 텍스트
+            options: 분석 설정 (None이면 생성 시 지정한 기본값)
+            
+        Returns:
+            (Token 리스트, 시간 제한으로 탐색을 줄였는지 여부) 튜플
+            (options.fields가 있으면 후보의 나머지 필드는 계산하지 않고 None)
+        """
+        options = options or self.default_options
+        deadline = time.perf_counter() + options.time_limit if options.time_limit > 0 else None
         
-        while node:
-            # BOS(Begin of Sentence)와 EOS(End of Sentence) 노드는 건너뛰기
-            if node.surface:
-                features = node.feature.split(',')
-                
-                # UniDic 형식: 品詞,品詞細分類1,品詞細分類2,品詞細分類3,活用型,活用形,語彙素読み,語彙素,書字形出現形,発音形出現形,書字形基本形,発音形基本形,語種
-                pos1 = features[0] if len(features) > 0 else ""
-                pos2 = features[1] if len(features) > 1 else ""
-                pos3 = features[2] if len(features) > 2 else ""
-                
-                # 발음 정보 추출
-                pron = ""
-                kana = ""
-                
-                if len(features) >= 18:
-                    # UniDic 형식
-                    pron = features[9] if features[9] != '*' else features[0]  # 発音形出現形 (장음 하이픈)
-                    kana = features[17] if features[17] != '*' else pron  # 読みがな (장음 모음 반복)
-                    
-                    # C# GetKana 로직: 助詞는 kana도 pron 사용 (は→わ)
-                    pos1 = features[0] if len(features) > 0 else ""
-                    if pos1 == "助詞":
-                        kana = pron
+        # 노드 체인은 Tagger의 lattice를 참조하므로 순회가 끝날 때까지 Tagger를 빌려둔다
+        with self.taggers.checkout() as tagger:
+            return self._extract_with_tagger(tagger, text, options, deadline)
+    
+    def _extract_with_tagger(self, tagger, text: str, options: AnalysisOptions,
+                             deadline: Optional[float]) -> Tuple[List[Token], bool]:
+        """
+        빌려온 Tagger로 analyze_tokens 수행
+        
+        Args:
+            tagger: 현재 스레드가 독점 중인 MeCab.Tagger
+            text: 분석할 일본어 텍스트
+            options: 분석 설정
+            deadline: 분석을 줄이기 시작할 time.perf_counter() 시각
+            
+        Returns:
+            (Token 리스트, 시간 제한으로 탐색을 줄였는지 여부) 튜플
+        """
+        # 단계별 시간은 줄마다 누적해서 한 번만 기록 (METRICS=0이면 측정 안 함)
+        timing = metrics.ENABLED
+        perf_counter = time.perf_counter
+        started = perf_counter() if timing else 0.0
+        alternatives_seconds = candidates_seconds = 0.0
+        
+        # 파싱 후 lattice를 한 번만 읽어서 토큰별 대체 노드 후보를 인덱싱
+        # (1-best 경로의 BOS/EOS 노드는 인덱스에 포함되지 않음, 빠른 경로를 쓰는 토큰은 제외)
+        lattice_index = LatticeIndex.build(
+            tagger, text, options.nbest, deadline,
+            needs_alternatives=has_kanji if self.kana_fast_path else None,
+        )
+        truncated = lattice_index.truncated
+        parse = self.features.parse
+        # 필드를 지정하면 요청한 필드만 계산 (가나 변환과 한글 변환이 후보 생성 시간의 대부분)
+        if options.fields:
+            make_candidate = partial(self._make_projected_candidate, builders=candidate_builders(options.fields))
+        else:
+            make_candidate = self._make_candidate
+        if timing:
+            built = perf_counter()
+        
+        tokens = []
+        
+        for token_index, node in enumerate(lattice_index.tokens):
+            surface = node.surface
+            if not surface:
+                continue
+            
+            # 한자 여부 체크
+            surface_has_kanji = has_kanji(surface)
+            
+            if not surface_has_kanji and self.kana_fast_path:
+                # 히라가나/카타카나/특수문자는 첫 번째 발음만 사용하며, 첫 번째 대체 노드는
+                # 항상 1-best 노드 자신이므로 lattice 탐색 없이 바로 후보 생성
+                # (N-best 분할 후보는 대체 노드 뒤에 붙으므로 첫 후보가 될 수 없음)
+                # 결과가 시간 제한과 무관하므로 truncated로 표시하지 않음 (줄이 캐시되도록)
+                if timing:
+                    token_started = perf_counter()
+                    tokens.append(Token(surface, [make_candidate(parse(surface, node.feature))]))
+                    candidates_seconds += perf_counter() - token_started
                 else:
-                    # 기본 사전 형식 또는 features가 부족한 경우
-                    if len(features) >= 10:
-                        pron = features[9] if features[9] != '*' else features[0]
-                    elif len(features) >= 8:
-                        pron = features[7] if features[7] != '*' else node.surface
-                    else:
-                        pron = node.surface
-                    kana = pron
-                
-                word_info = {
-                    "surface": node.surface,  # 원문
-                    "selected_id": 0,  # 기본 선택 (0-based 인덱스)
-                    "alternative_pronunciations": []  # 대체 발음들
-                }
-                
-                # 대체 발음 수집 (C# GetReplaceData와 동일한 방식)
-                seen_prons = {}  # {pron: (kana, node)} 딕셔너리
+                    tokens.append(Token(surface, [make_candidate(parse(surface, node.feature))]))
+                continue
+            
+            if timing:
+                token_started = perf_counter()
+            
+            # 대체 발음 수집 (C# GetReplaceData와 동일한 방식)
+            readings = {}  # {pron: NodeFeatures} 딕셔너리 (발음별로 처음 나온 노드)
+            
+            # Lattice에서 같은 길이의 모든 노드 수집
+            try:
+                if deadline is not None and time.perf_counter() > deadline:
+                    # 시간 제한 초과: 1-best 노드만 사용
+                    # (한자가 없는 단어는 어차피 첫 후보만 쓰므로 결과가 같아서 truncated로 표시하지 않음)
+                    truncated = truncated or surface_has_kanji
+                    alt_nodes = [node]
+                    segmentations = []
+                else:
+                    alt_nodes = lattice_index.replace_nodes(token_index)
+                    segmentations = lattice_index.segmentations[token_index]
                 
-                # Lattice에서 같은 길이의 모든 노드 수집
-                try:
-                    alt_nodes = self.get_all_replace_nodes(node, node.length)
-                    
-                    # 발음별로 중복 제거
-                    for alt_node in alt_nodes:
-                        alt_features = alt_node.feature.split(',')
-                        
-                        # 발음과 표기 추출
-                        if len(alt_features) >= 18:
-                            # UniDic 형식
-                            alt_pron = alt_features[9] if alt_features[9] != '*' else alt_node.surface  # 発音形出現形
-                            alt_kana = alt_features[17] if alt_features[17] != '*' else alt_pron  # 読みがな
-                            
-                            # C# GetKana 로직: 助詞는 kana도 pron 사용
-                            alt_pos1 = alt_features[0] if len(alt_features) > 0 else ""
-                            if alt_pos1 == "助詞":
-                                alt_kana = alt_pron
-                        elif len(alt_features) >= 10:
-                            # UniDic이지만 features가 부족한 경우
-                            alt_pron = alt_features[9] if alt_features[9] != '*' else alt_node.surface
-                            alt_kana = alt_pron
-                        elif len(alt_features) >= 8:
-                            # 기본 사전
-                            alt_pron = alt_features[7] if alt_features[7] != '*' else alt_node.surface
-                            alt_kana = alt_pron
-                        else:
-                            alt_pron = alt_node.surface
-                            alt_kana = alt_node.surface
-                        if alt_pron not in seen_prons:
-                            seen_prons[alt_pron] = (alt_kana, alt_node)
-                except Exception as e:
-                    # lattice 접근 실패 시 기본 발음만
-                    seen_prons[pron] = (kana, node)
+                # 발음별로 중복 제거
+                for alt_node in alt_nodes:
+                    features = parse(alt_node.surface, alt_node.feature)
+                    if features.pron not in readings:
+                        readings[features.pron] = features
                 
-                # 한자 여부 체크
-                has_kanji = any('\u4e00' <= c <= '\u9fff' for c in node.surface)
+                # N-best 경로에서 같은 구간을 여러 단어로 나눈 경우: 발음을 이어 붙인 후보
+                # (품사는 첫 단어 기준)
+                for segment in segmentations:
+                    parts = [parse(segment_node.surface, segment_node.feature) for segment_node in segment]
+                    alt_pron = ''.join(part.pron for part in parts)
+                    if alt_pron not in readings:
+                        readings[alt_pron] = parts[0]._replace(
+                            pron=alt_pron, kana=''.join(part.kana for part in parts))
+            except Exception as e:
+                # lattice 접근 실패 시 기본 발음만
+                features = parse(surface, node.feature)
+                readings.setdefault(features.pron, features)
+            
+            if timing:
+                collected = perf_counter()
+                alternatives_seconds += collected - token_started
+            
+            # 모든 발음을 후보에 추가 (발음별로 하나씩, 한자가 그대로인 것 제외)
+            candidates = []
+            for alt_pron, features in readings.items():
+                # 한자가 그대로 있으면 제외
+                if alt_pron == surface and surface_has_kanji:
+                    continue
                 
-                # 히라가나/카타카나 여부 체크
-                is_kana = all(
-                    ('\u3040' <= c <= '\u309f') or  # 히라가나
-                    ('\u30a0' <= c <= '\u30ff')     # 카타카나
-                    for c in node.surface
-                )
+                candidates.append(make_candidate(features))
                 
-                # 모든 발음을 alternative_pronunciations에 추가 (중복 제거, 한자가 아닌 것 제외)
-                added_prons = set()  # (hiragana_pron, katakana_pron) 튜플로 중복 체크
-                for alt_pron, (alt_kana, alt_node) in seen_prons.items():
-                    # 한자가 그대로 있으면 제외
-                    if alt_pron == node.surface and any('\u4e00' <= c <= '\u9fff' for c in alt_pron):
-                        continue
-                    
-                    # 품사 정보 추출
-                    alt_features = alt_node.feature.split(',')
-                    alt_pos1 = alt_features[0] if len(alt_features) > 0 else ""
-                    
-                    # alt_kana는 이미 seen_prons에서 가져온 값 (UniDic의 kana 필드)
-                    # pron: 장음 하이픈 (サイコー), kana: 장음 모음 반복 (サイコウ)
-                    
-                    # 히라가나/카타카나로 정규화 (UniDic이 혼합해서 반환할 수 있음)
-                    from hangul_helper import to_hiragana, to_katakana
-                    alt_hiragana_pron = to_hiragana(alt_pron)
-                    alt_katakana_pron = to_katakana(alt_pron)
-                    alt_hiragana_kana = to_hiragana(alt_kana)
-                    alt_katakana_kana = to_katakana(alt_kana)
-                    
-                    # 중복 체크
-                    pron_key = (alt_hiragana_pron, alt_pron)
-                    if pron_key in added_prons:
-                        continue
-                    added_prons.add(pron_key)
-                    
-                    # 대체 노드의 품사 정보 추출
-                    alt_node_features = alt_node.feature.split(',')
-                    alt_pos1 = alt_node_features[0] if len(alt_node_features) > 0 else ""
-                    alt_pos2 = alt_node_features[1] if len(alt_node_features) > 1 else ""
-                    alt_pos3 = alt_node_features[2] if len(alt_node_features) > 2 else ""
-                    
-                    # pron은 하이픈 사용, kana는 모음 반복으로 표시
-                    alt_hangul_pron = kana_to_hangul(alt_pron, use_hyphen=True)
-                    alt_hangul_kana = kana_to_hangul(alt_kana, use_hyphen=False)
-                    word_info["alternative_pronunciations"].append({
-                        "hiragana_pron": alt_hiragana_pron,
-                        "hiragana_kana": alt_hiragana_kana,
-                        "katakana_pron": alt_pron,
-                        "katakana_kana": alt_katakana_kana,
-                        "hangul_pron": alt_hangul_pron,
-                        "hangul_kana": alt_hangul_kana,
-                        "pos1": alt_pos1,
-                        "pos2": alt_pos2,
-                        "pos3": alt_pos3
-                    })
-                    
-                    # 히라가나/카타카나/특수문자는 첫 번째 발음만 추가 (한자만 여러 발음 제공)
-                    if not has_kanji:
-                        break
+                # 히라가나/카타카나/특수문자는 첫 번째 발음만 추가 (한자만 여러 발음 제공)
+                if not surface_has_kanji:
+                    break
                 
-                results.append(word_info)
+                # 단어당 후보 수 제한
+                if options.max_candidates and len(candidates) >= options.max_candidates:
+                    break
             
-            node = node.next
+            tokens.append(Token(surface, candidates))
+            if timing:
+                candidates_seconds += perf_counter() - collected
         
-        return results
+        if timing:
+            metrics.record_line(
+                parse=lattice_index.parse_seconds,
+                lattice=built - started - lattice_index.parse_seconds + alternatives_seconds,
+                candidates=candidates_seconds,
+                token_count=len(tokens),
+                candidate_count=sum(len(token.candidates) for token in tokens),
+            )
+        
+        return tokens, truncated
     
-    def analyze_sentence(self, text: str) -> Dict[str, Any]:
+    def analyze_sentence(self, text: str, options: Optional[AnalysisOptions] = None) -> Dict[str, Any]:
         """
         문장 전체를 분석하여 JSON 형식으로 반환
         
         Args:
             text: 분석할 일본어 텍스트
+            options: 분석 설정 (None이면 생성 시 지정한 기본값)
             
         Returns:
-            분석 결과 딕셔너리
+            분석 결과 딕셔너리 (시간 제한으로 탐색을 줄인 경우 truncated: True 포함,
+            options.fields가 있으면 후보에 그 필드만)
         """
-        words = self.extract_pronunciations(text)
+        options = options or self.default_options
+        segments = split_long_line(text, self.segment_chars)
+        if len(segments) > 1:
+            return merge_segment_results(text, [self.analyze_sentence(segment, options) for segment in segments])
         
-        return {
+        tokens, truncated = self.analyze_tokens(text, options)
+        
+        started = time.perf_counter()
+        result = {
             "original_text": text,
-            "word_count": len(words),
-            "words": words
+            "word_count": len(tokens),
+            "words": [token.to_dict(options.fields) for token in tokens]
         }
+        if truncated:
+            result["truncated"] = True
+        if metrics.ENABLED:
+            metrics.record_to_dict(time.perf_counter() - started)
+        return result
+
+
+def merge_segment_results(text: str, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    긴 줄을 나눠서 분석한 조각별 analyze_sentence 결과를 줄 하나의 결과로 합치기
+    
+    Args:
+        text: 원래 줄
+        results: 조각 순서대로의 분석 결과 리스트
+        
+    Returns:
+        analyze_sentence와 같은 형식의 결과 (조각 하나라도 truncated이면 truncated: True)
+    """
+    words = [word for result in results for word in result["words"]]
+    merged = {
+        "original_text": text,
+        "word_count": len(words),
+        "words": words
+    }
+    if any(result.get("truncated") for result in results):
+        merged["truncated"] = True
+    return merged
+
+
+def iter_input_lines(paths: List[str]) -> Iterator[str]:
+    """
+    파일, 디렉터리(하위 .txt 파일 전체), 표준 입력('-')에서 줄 단위로 읽기
+    
+    Args:
+        paths: 입력 경로 리스트
+        
+    Yields:
+        개행 문자를 제거한 줄
+    """
+    for path in paths:
+        if path == '-':
+            for line in sys.stdin:
+                yield line.rstrip('\r\n')
+            continue
+        
+        if os.path.isdir(path):
+            files = sorted(
+                os.path.join(root, name)
+                for root, _, names in os.walk(path)
+                for name in names if name.endswith('.txt')
+            )
+        else:
+            files = [path]
+        
+        for file_path in files:
+            with open(file_path, encoding='utf-8') as f:
+                for line in f:
+                    yield line.rstrip('\r\n')
+
+
+def iter_chunks(lines: Iterable[str], size: int) -> Iterator[List[str]]:
+    """
+    줄 스트림을 size개씩 묶기 (정규화된 텍스트)
+    
+    Args:
+        lines: 줄 스트림
+        size: 묶음 크기
+        
+    Yields:
+        줄 리스트
+    """
+    chunk = []
+    for line in lines:
+        chunk.append(line.strip())
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def run_batch(paths: List[str], output_format: str = "jsonl", jobs: int = 1,
+              dict_path: Optional[str] = None, chunk_size: int = 64,
+              options: Optional[AnalysisOptions] = None,
+              render_options: Optional[RenderOptions] = None) -> None:
+    """
+    일괄 변환: 입력 줄을 순서대로 분석해서 표준 출력으로 스트리밍
+    jobs > 1이면 프로세스 풀을 사용 (프로세스마다 사전을 한 번만 로드)
+    
+    Args:
+        paths: 입력 경로 리스트 ('-'는 표준 입력)
+        output_format: jsonl (줄마다 분석 결과 JSON) 또는 hangul (렌더링된 한글 텍스트)
+        jobs: 워커 프로세스 수
+        dict_path: 사전 경로
+        chunk_size: 워커에 한 번에 넘길 줄 수
+        options: 분석 설정
+        render_options: hangul 형식의 출력 옵션 (None이면 기본값)
+    """
+    from analysis_pool import init_worker, analyze_texts
+    
+    analyze_chunk = partial(analyze_texts, options=options)
+    
+    chunks = iter_chunks(iter_input_lines(paths), chunk_size)
+    out = sys.stdout
+    render_options = render_options or RenderOptions()
+    
+    def write_results(results):
+        for line_result in results:
+            if output_format == "hangul":
+                for output_line in render_lines([line_result], render_options):
+                    out.write(output_line + "\n")
+            else:
+                out.write(json.dumps(line_result, ensure_ascii=False) + "\n")
+    
+    if jobs <= 1:
+        init_worker(dict_path)
+        for chunk in chunks:
+            write_results(analyze_chunk(chunk))
+        return
+    
+    # imap은 입력 순서대로 결과를 돌려주므로 출력 순서가 유지됨
+    with multiprocessing.Pool(jobs, initializer=init_worker, initargs=(dict_path,)) as pool:
+        for results in pool.imap(analyze_chunk, chunks):
+            write_results(results)
 
 
 def main():
     """메인 함수"""
-    if len(sys.argv) < 2:
-        print("사용법: python japanese_pron.py <일본어 텍스트>")
-        print("예시: python japanese_pron.py '日本語の文章'")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="일본어 문장의 품사와 한글 발음을 JSON으로 출력",
+        epilog="예시: python japanese_pron.py '日本語の文章' / "
+               "python japanese_pron.py --batch lyrics/ -f hangul --add-space -j 4",
+    )
+    parser.add_argument("text", nargs="?", help="분석할 일본어 텍스트")
+    parser.add_argument("dict_path", nargs="?", help="사전 경로 (생략하면 기본 사전)")
+    parser.add_argument("-b", "--batch", nargs="+", metavar="PATH",
+                        help="일괄 변환할 파일/디렉터리 ('-'는 표준 입력)")
+    parser.add_argument("-f", "--format", choices=["jsonl", "hangul"], default="jsonl",
+                        help="출력 형식: jsonl (분석 결과 JSON) 또는 hangul (렌더링된 한글, 기본 jsonl)")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="일괄 변환 워커 프로세스 수 (기본 1)")
+    parser.add_argument("-d", "--dict", dest="dict_option", metavar="PATH",
+                        help="사전 경로")
+    parser.add_argument("--chunk-size", type=int, default=64,
+                        help="워커에 한 번에 넘길 줄 수 (기본 64)")
+    parser.add_argument("--nbest", type=int, default=1,
+                        help=f"대체 발음을 모을 분할 경로 수 (1 ~ {MAX_NBEST}, 기본 1)")
+    parser.add_argument("--max-candidates", type=int, default=0,
+                        help="단어당 최대 발음 후보 수 (기본 0: 제한 없음)")
+    parser.add_argument("--time-limit-ms", type=int, default=0,
+                        help="줄당 분석 시간 제한 (밀리초, 기본 0: 제한 없음)")
+    parser.add_argument("--fields",
+                        help="jsonl 후보에 넣을 필드/프로필 (쉼표로 구분, 예: hangul_pron,pos1 또는 hangul, "
+                             f"프로필: {', '.join(FIELD_PROFILES)}, 기본: 전체, hangul 형식은 hangul 프로필)")
+    render_group = parser.add_argument_group("hangul 형식 출력 옵션")
+    render_group.add_argument("--no-hyphen", action="store_true",
+                              help="장음을 하이픈(-) 대신 모음으로 표기")
+    render_group.add_argument("--add-space", action="store_true",
+                              help="단어 사이 공백 추가")
+    render_group.add_argument("--clarify-nn", action="store_true",
+                              help="응(ん) 발음 세분화")
+    render_group.add_argument("--clarify-xts", action="store_true",
+                              help="촉음(っ) 발음 세분화")
+    render_group.add_argument("--show-original", action="store_true",
+                              help="원문 줄을 함께 출력")
+    args = parser.parse_args()
+    
+    # 서버 API(AnalysisSettings)와 같은 범위
+    if not 1 <= args.nbest <= MAX_NBEST:
+        parser.error(f"--nbest는 1 ~ {MAX_NBEST} 사이여야 합니다")
+    if args.max_candidates < 0:
+        parser.error("--max-candidates는 0 이상이어야 합니다")
+    if args.time_limit_ms < 0:
+        parser.error("--time-limit-ms는 0 이상이어야 합니다")
+    
+    field_names = args.fields.split(",") if args.fields else []
+    if args.format == "hangul":
+        # 렌더링에는 한글 발음과 품사만 필요
+        field_names.append("hangul")
+    try:
+        fields = normalize_fields(field_names)
+    except ValueError as e:
+        parser.error(str(e))
+    
+    options = AnalysisOptions(args.nbest, args.max_candidates, args.time_limit_ms / 1000, fields)
+    render_options = RenderOptions(
+        use_hyphen=not args.no_hyphen,
+        add_space=args.add_space,
+        clarify_nn=args.clarify_nn,
+        clarify_xts=args.clarify_xts,
+        show_original=args.show_original,
+    )
     
-    text = sys.argv[1]
+    if args.batch:
+        run_batch(args.batch, args.format, args.jobs, args.dict_option, args.chunk_size,
+                  options, render_options)
+        return
+    
+    if not args.text:
+        parser.print_usage()
+        sys.exit(1)
     
     # 사전 경로 지정 (필요시)
-    dict_path = None
-    if len(sys.argv) > 2:
-        dict_path = sys.argv[2]
+    dict_path = args.dict_option or args.dict_path
     
     extractor = JapanesePronunciationExtractor(dict_path)
-    result = extractor.analyze_sentence(text)
+    result = extractor.analyze_sentence(args.text, options)
+    
+    if args.format == "hangul":
+        print("\n".join(render_lines([result], render_options)))
+        return
     
     # JSON 출력
     print(json.dumps(result, ensure_ascii=False, indent=2))
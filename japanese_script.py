@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+일본어 문자(히라가나, 가타카나, 한자) 변환 및 판별 모듈
+변환 테이블과 문자 분류 패턴은 import 시점에 한 번만 생성
+"""
+
+import re
+from typing import List
+
+
+# 가타카나 → 히라가나 (U+30A0 ~ U+30FA, 0x60 빼기)
+KATAKANA_TO_HIRAGANA = {code: code - 0x60 for code in range(0x30A0, 0x30FA + 1)}
+
+# 히라가나 → 가타카나 (U+3040 ~ U+309F, 0x60 더하기)
+HIRAGANA_TO_KATAKANA = {code: code + 0x60 for code in range(0x3040, 0x309F + 1)}
+
+# 한자로 취급하는 코드 포인트 범위
+KANJI_RANGES = (
+    (0x3005, 0x3007),    # 々 〆 〇
+    (0x3400, 0x4DBF),    # CJK 통합 한자 확장 A
+    (0x4E00, 0x9FFF),    # CJK 통합 한자
+    (0xF900, 0xFAFF),    # CJK 호환 한자
+    (0x20000, 0x2FFFF),  # CJK 통합 한자 확장 B 이후
+)
+
+
+def _compile_char_class(ranges, pattern):
+    """코드 포인트 범위들로 정규식 문자 클래스 생성"""
+    char_class = ''.join(f'{chr(start)}-{chr(end)}' for start, end in ranges)
+    return re.compile(pattern.format(char_class))
+
+
+_KANJI_SEARCH = _compile_char_class(KANJI_RANGES, '[{}]').search
+
+
+def to_hiragana(text: str) -> str:
+    """
+    가타카나를 히라가나로 변환
+
+    Args:
+        text: 변환할 문자열
+
+    Returns:
+        히라가나로 변환된 문자열
+    """
+    return text.translate(KATAKANA_TO_HIRAGANA)
+
+
+def to_katakana(text: str) -> str:
+    """
+    히라가나를 가타카나로 변환
+
+    Args:
+        text: 변환할 문자열
+
+    Returns:
+        가타카나로 변환된 문자열
+    """
+    return text.translate(HIRAGANA_TO_KATAKANA)
+
+
+def has_kanji(text: str) -> bool:
+    """
+    한자(々, 확장 한자 포함)가 하나라도 있는지 확인
+
+    Args:
+        text: 확인할 문자열
+
+    Returns:
+        한자가 있으면 True
+    """
+    return _KANJI_SEARCH(text) is not None
+
+
+# 긴 줄을 나눌 경계 문자 (우선순위 순: 문장 끝, 구절 끝, 공백), 조각은 경계 문자를 끝에 포함
+SEGMENT_BOUNDARIES = ("。．！？!?", "、，,", " 　\t")
+
+# 경계 문자 바로 뒤의 닫는 괄호/따옴표는 앞 조각에 붙임 (「…。」)
+CLOSING_BRACKETS = "」』）)】〉》]”’\"'"
+
+
+def _script_break(text: str, index: int) -> bool:
+    """
+    index 앞에서 잘라도 단어가 나뉘지 않을 가능성이 높은지 (히라가나 다음에 한자/가타카나가 시작)
+    한자 → 히라가나(오쿠리가나)나 장음 기호 앞은 단어 중간일 수 있으므로 제외
+    """
+    previous = ord(text[index - 1])
+    current = text[index]
+    if not 0x3040 <= previous <= 0x309F or current == 'ー':
+        return False
+    return 0x30A0 <= ord(current) <= 0x30FF or _KANJI_SEARCH(current) is not None
+
+
+def _segment_end(text: str, start: int, end: int) -> int:
+    """text[start:end] 안에서 조각을 끝낼 위치 (start < 반환값 <= end)"""
+    # 조각 앞쪽 1/4 안에 있는 경계는 조각이 너무 짧아지므로 다음 순위 경계를 먼저 찾음
+    lower = start + max(1, (end - start) // 4)
+    fallback = start
+    for chars in SEGMENT_BOUNDARIES:
+        cut = max(text.rfind(char, start, end) for char in chars) + 1
+        if cut <= start:
+            continue
+        while cut < end and text[cut] in CLOSING_BRACKETS:
+            cut += 1
+        if cut >= lower:
+            return cut
+        fallback = max(fallback, cut)
+    # 경계 문자가 없는 긴 구간: 문자 종류가 바뀌는 곳에서 자름
+    for cut in range(end, lower - 1, -1):
+        if _script_break(text, cut):
+            return cut
+    return fallback if fallback > start else end
+
+
+def split_long_line(text: str, max_chars: int) -> List[str]:
+    """
+    긴 줄을 문장/구절 경계에서 max_chars자 이하 조각으로 나누기
+    경계 우선순위는 。！？ → 、 → 공백(전각 포함), 경계가 없으면 히라가나 다음에 한자/가타카나가
+    시작하는 곳, 그것도 없으면 max_chars자에서 자른다
+
+    Args:
+        text: 나눌 줄
+        max_chars: 조각 최대 글자 수 (0이면 나누지 않음)
+
+    Returns:
+        조각 리스트 (이어 붙이면 원래 줄, max_chars자 이하인 줄은 [text])
+    """
+    if max_chars <= 0 or len(text) <= max_chars:
+        return [text]
+
+    segments = []
+    start = 0
+    while len(text) - start > max_chars:
+        cut = _segment_end(text, start, start + max_chars)
+        segments.append(text[start:cut])
+        start = cut
+    segments.append(text[start:])
+    return segments
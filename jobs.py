@@ -0,0 +1,606 @@
+#!/usr/bin/env python3
+"""
+비동기 변환 작업 (앨범/가사 모음처럼 요청 시간 제한 안에 끝나지 않는 변환)
+
+- 텍스트나 문서 여러 개를 제출하면 작업 ID를 바로 돌려주고, 진행률(끝난 줄 / 전체 줄)과
+  지금까지의 결과를 조회할 수 있다
+- 정해진 수의 작업 워커가 우선순위가 높은 작업부터 CHUNK 줄씩 분석하고, 묶음마다 결과를 저장
+- 취소하면 대기 중인 작업은 바로, 실행 중인 작업은 지금 분석 중인 묶음이 끝나면 멈춘다
+- 끝난 작업(완료/실패/취소)은 TTL 동안 보관한 뒤 삭제
+- 저장소는 메모리(MemoryJobStore) 또는 SQLite 파일(SqliteJobStore), 외부 브로커는 사용하지 않음
+  SQLite 저장소는 여러 프로세스가 같은 파일을 작업 대기 줄로 공유하고, 재시작하면 멈춘 작업을 이어서 실행
+"""
+
+import asyncio
+import heapq
+import itertools
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from admission import Overloaded
+from compact_format import dumps, loads
+
+
+logger = logging.getLogger(__name__)
+
+# 작업 상태
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED = (DONE, FAILED, CANCELLED)
+
+# 줄 목록 → 줄별 분석 결과 (app.py의 analyze_lines)
+AnalyzeFunc = Callable[[List[str], Tuple[Any, ...]], Awaitable[List[Dict[str, Any]]]]
+
+
+class Job:
+    """
+    변환 작업 하나
+
+    lines는 모든 문서의 줄을 이어 붙인 리스트이고, documents는 (문서 ID, 줄 수) 리스트로 경계를 나타낸다
+    SQLite 저장소에서 상태만 조회한 작업은 lines가 None
+    """
+
+    def __init__(self, job_id: str, documents: List[Tuple[str, int]], lines: Optional[List[str]],
+                 options: Tuple[Any, ...], detail_mode: bool = False, priority: int = 0,
+                 status: str = QUEUED, lines_done: int = 0, error: Optional[str] = None,
+                 created_at: Optional[float] = None, started_at: Optional[float] = None,
+                 finished_at: Optional[float] = None):
+        self.id = job_id
+        self.documents = documents
+        self.lines = lines
+        self.options = tuple(options)
+        self.detail_mode = detail_mode
+        self.priority = priority
+        self.status = status
+        self.total_lines = sum(count for _, count in documents)
+        self.lines_done = lines_done
+        self.error = error
+        self.created_at = created_at if created_at is not None else time.time()
+        self.started_at = started_at
+        self.finished_at = finished_at
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED
+
+    def to_dict(self) -> Dict[str, Any]:
+        """상태 응답용 딕셔너리 (시각은 유닉스 시간, 초)"""
+        return {
+            "id": self.id,
+            "status": self.status,
+            "priority": self.priority,
+            "lines_done": self.lines_done,
+            "total_lines": self.total_lines,
+            "documents": [document_id for document_id, _ in self.documents],
+            "detail_mode": self.detail_mode,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class MemoryJobStore:
+    """
+    프로세스 메모리 작업 저장소 (우선순위 힙이 대기 줄, 재시작하면 작업이 사라짐)
+    이벤트 루프 스레드에서만 사용
+    """
+
+    # 호출이 바로 끝나므로 JobManager가 이벤트 루프에서 직접 호출
+    blocking = False
+
+    def __init__(self):
+        self._jobs: Dict[str, Job] = {}
+        self._results: Dict[str, List[Dict[str, Any]]] = {}
+        self._queue: List[Tuple[int, int, str]] = []  # (-우선순위, 제출 순서, 작업 ID)
+        self._order = itertools.count()
+
+    def add(self, job: Job) -> None:
+        self._jobs[job.id] = job
+        self._results[job.id] = []
+        heapq.heappush(self._queue, (-job.priority, next(self._order), job.id))
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def claim(self) -> Optional[Job]:
+        """우선순위가 가장 높은(같으면 먼저 제출한) 대기 작업을 실행 상태로 바꿔서 반환"""
+        while self._queue:
+            _, _, job_id = heapq.heappop(self._queue)
+            job = self._jobs.get(job_id)
+            if job is not None and job.status == QUEUED:
+                job.status = RUNNING
+                job.started_at = time.time()
+                return job
+        return None
+
+    def save_progress(self, job_id: str, start: int, results: List[Dict[str, Any]]) -> bool:
+        """
+        start번째 줄부터의 결과 저장
+
+        Returns:
+            작업이 아직 실행 중이면 True (취소되었으면 False, 결과는 버림)
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job.status != RUNNING:
+            return False
+        del self._results[job_id][start:]
+        self._results[job_id].extend(results)
+        job.lines_done = start + len(results)
+        return True
+
+    def release(self, job_id: str) -> None:
+        """실행 중인 작업을 끝난 줄 다음부터 다시 실행하도록 대기 줄에 되돌리기 (워커 종료 시)"""
+        job = self._jobs.get(job_id)
+        if job is not None and job.status == RUNNING:
+            job.status = QUEUED
+            heapq.heappush(self._queue, (-job.priority, next(self._order), job.id))
+
+    def finish(self, job_id: str, status: str, error: Optional[str] = None) -> None:
+        """실행 중인 작업을 완료/실패로 표시 (이미 취소된 작업은 그대로)"""
+        job = self._jobs.get(job_id)
+        if job is not None and job.status == RUNNING:
+            job.status = status
+            job.error = error
+            job.finished_at = time.time()
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """대기/실행 중인 작업 취소 (끝난 작업은 그대로), 없는 작업이면 None"""
+        job = self._jobs.get(job_id)
+        if job is not None and not job.finished:
+            job.status = CANCELLED
+            job.finished_at = time.time()
+        return job
+
+    def results(self, job_id: str, start: int = 0) -> List[Dict[str, Any]]:
+        """start번째 줄부터 지금까지 끝난 줄의 결과"""
+        return self._results.get(job_id, [])[start:]
+
+    def purge(self, finished_before: float) -> int:
+        """finished_before 이전에 끝난 작업 삭제, 삭제한 작업 수 반환"""
+        expired = [job_id for job_id, job in self._jobs.items()
+                   if job.finished and job.finished_at < finished_before]
+        for job_id in expired:
+            del self._jobs[job_id]
+            del self._results[job_id]
+        return len(expired)
+
+    def counts(self) -> Dict[str, int]:
+        """상태별 작업 수"""
+        counts = dict.fromkeys((QUEUED, RUNNING) + FINISHED, 0)
+        for job in self._jobs.values():
+            counts[job.status] += 1
+        return counts
+
+    def close(self) -> None:
+        pass
+
+
+JOB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    spec TEXT NOT NULL,
+    lines BLOB NOT NULL,
+    lines_done INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    heartbeat REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_queue ON jobs (status, priority DESC, created_at);
+CREATE TABLE IF NOT EXISTS job_results (
+    job_id TEXT NOT NULL,
+    line_index INTEGER NOT NULL,
+    result BLOB NOT NULL,
+    PRIMARY KEY (job_id, line_index)
+);
+"""
+
+# 상태 조회에서 읽는 열 (줄 원문은 작업을 실행할 때만 읽음)
+JOB_COLUMNS = "id, status, priority, spec, lines_done, error, created_at, started_at, finished_at"
+
+
+class SqliteJobStore:
+    """
+    SQLite 작업 저장소
+    jobs 테이블이 작업 대기 줄이라서 같은 파일을 쓰는 여러 프로세스가 작업을 나눠서 실행한다.
+    실행 중인 작업은 묶음을 저장할 때마다 heartbeat를 갱신하고, stale_after초 동안 갱신되지 않은 작업은
+    (프로세스가 죽거나 재시작한 것으로 보고) 다른 워커가 끝난 줄 다음부터 이어서 실행한다.
+    """
+
+    # 다른 프로세스의 쓰기 잠금을 기다릴 수 있으므로 JobManager가 저장소 전용 스레드에서 호출
+    blocking = True
+
+    def __init__(self, path: str, stale_after: float = 60.0, busy_timeout: float = 5.0):
+        """
+        Args:
+            path: 데이터베이스 파일 경로 (디렉터리가 없으면 생성)
+            stale_after: 실행 중인 작업을 멈춘 것으로 볼 heartbeat 간격 (초)
+            busy_timeout: 다른 프로세스가 쓰는 중일 때 기다릴 시간 (초)
+        """
+        self.path = path
+        self.stale_after = stale_after
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        """현재 프로세스/스레드의 연결 (처음 사용할 때 열고 스키마 생성)"""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None and self._local.pid == os.getpid():
+            return connection
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(JOB_SCHEMA)
+        self._local.connection = connection
+        self._local.pid = os.getpid()
+        return connection
+
+    @staticmethod
+    def _job(row: Sequence[Any], lines: Optional[List[str]] = None) -> Job:
+        job_id, status, priority, spec, lines_done, error, created_at, started_at, finished_at = row
+        spec = json.loads(spec)
+        return Job(job_id, [tuple(document) for document in spec["documents"]], lines, spec["options"],
+                   spec["detail_mode"], priority, status, lines_done, error, created_at, started_at, finished_at)
+
+    def add(self, job: Job) -> None:
+        spec = json.dumps({"documents": job.documents, "options": job.options, "detail_mode": job.detail_mode},
+                          ensure_ascii=False)
+        self._connection().execute(
+            "INSERT INTO jobs (id, status, priority, spec, lines, lines_done, created_at) VALUES (?, ?, ?, ?, ?, 0, ?)",
+            (job.id, job.status, job.priority, spec, dumps(job.lines), job.created_at),
+        )
+
+    def get(self, job_id: str) -> Optional[Job]:
+        row = self._connection().execute(f"SELECT {JOB_COLUMNS} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._job(row) if row is not None else None
+
+    def claim(self) -> Optional[Job]:
+        """
+        우선순위가 가장 높은(같으면 먼저 제출한) 대기 작업, 없으면 멈춘 실행 작업을 실행 상태로 바꿔서 반환
+        (BEGIN IMMEDIATE로 다른 프로세스와 같은 작업을 가져가지 않도록 함)
+        """
+        connection = self._connection()
+        now = time.time()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute(
+                f"SELECT {JOB_COLUMNS}, lines FROM jobs WHERE status = ? "
+                "ORDER BY priority DESC, created_at LIMIT 1",
+                (QUEUED,),
+            ).fetchone()
+            if row is None:
+                row = connection.execute(
+                    f"SELECT {JOB_COLUMNS}, lines FROM jobs WHERE status = ? AND heartbeat < ? "
+                    "ORDER BY priority DESC, created_at LIMIT 1",
+                    (RUNNING, now - self.stale_after),
+                ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE jobs SET status = ?, started_at = COALESCE(started_at, ?), heartbeat = ? WHERE id = ?",
+                (RUNNING, now, now, row[0]),
+            )
+        job = self._job(row[:-1], loads(row[-1]))
+        job.status = RUNNING
+        job.started_at = job.started_at or now
+        return job
+
+    def save_progress(self, job_id: str, start: int, results: List[Dict[str, Any]]) -> bool:
+        """
+        start번째 줄부터의 결과 저장
+
+        Returns:
+            작업이 아직 실행 중이면 True (취소되었으면 False, 결과는 버림)
+        """
+        connection = self._connection()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None or row[0] != RUNNING:
+                return False
+            connection.executemany(
+                "INSERT OR REPLACE INTO job_results (job_id, line_index, result) VALUES (?, ?, ?)",
+                [(job_id, start + offset, dumps(result)) for offset, result in enumerate(results)],
+            )
+            connection.execute(
+                "UPDATE jobs SET lines_done = ?, heartbeat = ? WHERE id = ?",
+                (start + len(results), time.time(), job_id),
+            )
+        return True
+
+    def release(self, job_id: str) -> None:
+        """실행 중인 작업을 끝난 줄 다음부터 다시 실행하도록 대기 줄에 되돌리기 (워커 종료 시)"""
+        self._connection().execute(
+            "UPDATE jobs SET status = ? WHERE id = ? AND status = ?", (QUEUED, job_id, RUNNING),
+        )
+
+    def finish(self, job_id: str, status: str, error: Optional[str] = None) -> None:
+        """실행 중인 작업을 완료/실패로 표시 (이미 취소된 작업은 그대로)"""
+        self._connection().execute(
+            "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ? AND status = ?",
+            (status, error, time.time(), job_id, RUNNING),
+        )
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """대기/실행 중인 작업 취소 (끝난 작업은 그대로), 없는 작업이면 None"""
+        self._connection().execute(
+            "UPDATE jobs SET status = ?, finished_at = ? WHERE id = ? AND status IN (?, ?)",
+            (CANCELLED, time.time(), job_id, QUEUED, RUNNING),
+        )
+        return self.get(job_id)
+
+    def results(self, job_id: str, start: int = 0) -> List[Dict[str, Any]]:
+        """start번째 줄부터 지금까지 끝난 줄의 결과"""
+        connection = self._connection()
+        row = connection.execute("SELECT lines_done FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return []
+        rows = connection.execute(
+            "SELECT result FROM job_results WHERE job_id = ? AND line_index >= ? AND line_index < ? "
+            "ORDER BY line_index",
+            (job_id, start, row[0]),
+        )
+        return [loads(result) for result, in rows]
+
+    def purge(self, finished_before: float) -> int:
+        """finished_before 이전에 끝난 작업 삭제, 삭제한 작업 수 반환"""
+        connection = self._connection()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                "DELETE FROM job_results WHERE job_id IN (SELECT id FROM jobs WHERE finished_at < ?)",
+                (finished_before,),
+            )
+            return connection.execute("DELETE FROM jobs WHERE finished_at < ?", (finished_before,)).rowcount
+
+    def counts(self) -> Dict[str, int]:
+        """상태별 작업 수"""
+        counts = dict.fromkeys((QUEUED, RUNNING) + FINISHED, 0)
+        for status, count in self._connection().execute("SELECT status, COUNT(*) FROM jobs GROUP BY status"):
+            counts[status] = count
+        return counts
+
+    def close(self) -> None:
+        """현재 스레드의 연결 닫기"""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None and self._local.pid == os.getpid():
+            connection.close()
+            self._local.connection = None
+
+
+class JobManager:
+    """
+    작업 제출/조회/취소와 작업 워커 실행
+
+    워커는 이벤트 루프의 태스크이고 실제 분석은 analyze(분석 백엔드)가 맡는다.
+    한 작업을 chunk_lines줄씩 나눠서 분석하므로 워커 수가 적어도 일반 요청이 묶음 사이에 끼어서 처리된다.
+    (묶음이 클수록 저장 횟수는 줄지만 작업 실행 중 일반 요청의 지연 시간이 묶음 분석 시간만큼 늘어남)
+    """
+
+    def __init__(self, store, analyze: AnalyzeFunc, workers: int = 1, chunk_lines: int = 16,
+                 ttl: float = 3600.0, max_queued: int = 100, poll_interval: float = 1.0):
+        """
+        Args:
+            store: MemoryJobStore 또는 SqliteJobStore
+            analyze: 줄 목록과 분석 설정을 받아 줄별 결과를 반환하는 코루틴 함수
+            workers: 이 프로세스에서 동시에 실행할 작업 수 (0이면 제출/조회만 하고 실행은 다른 프로세스가 맡음)
+            chunk_lines: 한 번에 분석하고 저장할 줄 수
+            ttl: 끝난 작업을 보관할 시간 (초)
+            max_queued: 대기 작업 수 상한 (0이면 제한 없음)
+            poll_interval: 대기 작업이 없을 때 저장소를 다시 확인하는 간격 (초, 다른 프로세스가 제출한 작업용)
+        """
+        self.store = store
+        self.analyze = analyze
+        self.workers = workers
+        self.chunk_lines = max(1, chunk_lines)
+        self.ttl = ttl
+        self.max_queued = max_queued
+        self.poll_interval = poll_interval
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None  # 이벤트 루프 안에서 생성
+        # 워커의 저장소 호출을 실행할 스레드 (store.blocking인 경우만, start()에서 생성)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def submit(self, documents: List[Tuple[str, List[str]]], options: Tuple[Any, ...],
+               detail_mode: bool = False, priority: int = 0) -> Job:
+        """
+        작업 제출
+
+        Args:
+            documents: (문서 ID, 줄 리스트) 리스트
+            options: 분석 설정 (AnalysisOptions)
+            detail_mode: 상세 모드 여부 (결과 응답에 그대로 전달)
+            priority: 우선순위 (클수록 먼저 실행)
+
+        Returns:
+            대기 상태의 Job
+
+        Raises:
+            Overloaded: 대기 작업 수가 상한에 도달한 경우 (429)
+        """
+        if self.max_queued and self.store.counts()[QUEUED] >= self.max_queued:
+            raise Overloaded(429, f"대기 중인 작업이 너무 많습니다 (최대 {self.max_queued}개). 잠시 후 다시 시도하세요.",
+                             retry_after=max(1, int(self.poll_interval * 5)))
+        job = Job(
+            uuid.uuid4().hex,
+            [(document_id, len(lines)) for document_id, lines in documents],
+            [line_text for _, lines in documents for line_text in lines],
+            options, detail_mode, priority,
+        )
+        self.store.add(job)
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self.store.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        return self.store.cancel(job_id)
+
+    def document_results(self, job: Job, start: int = 0) -> List[Dict[str, Any]]:
+        """
+        start번째 줄부터 지금까지 끝난 결과를 문서별로 나누기
+
+        Args:
+            job: 작업
+            start: 작업 전체(모든 문서를 이은 줄)에서의 시작 줄 번호
+
+        Returns:
+            [{"id": 문서 ID, "start": 문서 안에서 첫 결과의 줄 번호, "lines": [...], "complete": 문서 완료 여부}]
+            (start 이전에 끝나는 문서는 제외)
+        """
+        results = self.store.results(job.id, start)
+        done = start + len(results)
+        documents = []
+        offset = 0
+        for document_id, count in job.documents:
+            end = offset + count
+            if end > start:
+                first = max(offset, start)
+                documents.append({
+                    "id": document_id,
+                    "start": first - offset,
+                    "lines": results[first - start:max(first, min(end, done)) - start],
+                    "complete": done >= end,
+                })
+            offset = end
+        return documents
+
+    async def start(self) -> None:
+        """작업 워커와 만료 작업 정리 태스크 시작"""
+        self._wakeup = asyncio.Event()
+        if self.store.blocking:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="job-store")
+        self._tasks = [asyncio.ensure_future(self._worker()) for _ in range(self.workers)]
+        self._tasks.append(asyncio.ensure_future(self._janitor()))
+
+    async def stop(self) -> None:
+        """
+        워커 중지 (실행 중인 작업은 지금 묶음에서 멈추고 대기 줄로 돌아감)
+        SQLite 저장소의 작업은 다음에 시작한 워커가 끝난 줄 다음부터 이어서 실행
+        (프로세스가 강제로 종료되어 되돌리지 못한 작업은 heartbeat가 오래되면 다시 실행됨)
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._executor is not None:
+            # 저장소 스레드의 연결 닫기 (대기 중인 release 등을 마친 뒤)
+            self._executor.submit(self.store.close)
+            await asyncio.to_thread(self._executor.shutdown)
+            self._executor = None
+        self.store.close()
+
+    async def _store_call(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        워커의 저장소 호출
+        SQLite 저장소는 다른 프로세스와 잠금을 다투는 동안 이벤트 루프(일반 요청)가 멈추지 않도록 저장소 전용 스레드에서
+        실행 (스레드 하나이므로 호출 순서 유지), 메모리 저장소는 바로 실행
+        """
+        if self._executor is None:
+            return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, partial(func, *args))
+
+    async def _worker(self) -> None:
+        while True:
+            try:
+                job = await self._store_call(self.store.claim)
+            except sqlite3.Error:
+                logger.exception("작업 대기 줄 조회 실패")
+                job = None
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._run(job)
+
+    async def _run(self, job: Job) -> None:
+        """작업 하나를 묶음 단위로 분석 (취소되면 다음 묶음 전에 멈춤)"""
+        try:
+            for start in range(job.lines_done, job.total_lines, self.chunk_lines):
+                results = await self.analyze(job.lines[start:start + self.chunk_lines], job.options)
+                if not await self._store_call(self.store.save_progress, job.id, start, results):
+                    return
+                # 묶음 사이에 다른 태스크(일반 요청)에 차례를 넘김
+                await asyncio.sleep(0)
+            await self._store_call(self.store.finish, job.id, DONE)
+        except asyncio.CancelledError:
+            # 서버 종료: 다음에 시작한 워커(같은 저장소를 쓰는 다른 프로세스 포함)가 이어서 실행
+            await self._store_call(self.store.release, job.id)
+            raise
+        except Exception as error:
+            logger.exception("작업 실패: %s", job.id)
+            await self._store_call(self.store.finish, job.id, FAILED, f"{type(error).__name__}: {error}")
+
+    async def _janitor(self) -> None:
+        """TTL이 지난 끝난 작업 삭제"""
+        interval = max(1.0, min(self.ttl, 60.0))
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                removed = await self._store_call(self.store.purge, time.time() - self.ttl)
+            except sqlite3.Error:
+                logger.exception("만료 작업 삭제 실패")
+                continue
+            if removed:
+                logger.info("만료 작업 %d개 삭제", removed)
+
+    def stats(self) -> Dict[str, Any]:
+        """상태별 작업 수와 설정"""
+        return {
+            "jobs": self.store.counts(),
+            "workers": self.workers,
+            "chunk_lines": self.chunk_lines,
+            "ttl": self.ttl,
+            "max_queued": self.max_queued,
+        }
+
+
+def from_env(analyze: AnalyzeFunc) -> JobManager:
+    """
+    환경 변수로 작업 관리자 생성
+
+    - JOB_STORE: SQLite 파일 경로 (없으면 메모리 저장소)
+    - JOB_WORKERS: 이 프로세스의 작업 워커 수 (기본 1)
+    - JOB_CHUNK_LINES: 한 번에 분석하고 저장할 줄 수 (기본 16)
+    - JOB_TTL: 끝난 작업 보관 시간 (초, 기본 3600)
+    - JOB_MAX_QUEUED: 대기 작업 수 상한 (기본 100)
+
+    Args:
+        analyze: 줄 목록과 분석 설정을 받아 줄별 결과를 반환하는 코루틴 함수
+
+    Returns:
+        JobManager (start()는 호출하는 쪽에서)
+    """
+    path = os.environ.get("JOB_STORE")
+    store = SqliteJobStore(path) if path else MemoryJobStore()
+    return JobManager(
+        store,
+        analyze,
+        workers=int(os.environ.get("JOB_WORKERS", "1")),
+        chunk_lines=int(os.environ.get("JOB_CHUNK_LINES", "16")),
+        ttl=float(os.environ.get("JOB_TTL", "3600")),
+        max_queued=int(os.environ.get("JOB_MAX_QUEUED", "100")),
+    )
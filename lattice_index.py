@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+MeCab lattice 인덱스
+문장을 한 번 파싱한 lattice에서 1-best 토큰마다 (시작 위치, 길이)가 같은 노드들을
+한 번만 읽어 두고, 대체 노드 수집은 이 인덱스 위에서 반복문으로 처리
+"""
+
+import time
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import MeCab
+
+
+# MeCab 노드 상태 (mecab.h의 MECAB_EOS_NODE)
+EOS_NODE = 3
+
+# get_all_replace_nodes와 같은 탐색 깊이 제한
+MAX_DEPTH = 100
+
+
+class LatticeNode(NamedTuple):
+    """lattice 노드에서 필요한 값만 복사해 둔 레코드 (MeCab 노드와 같은 속성명 사용)"""
+    id: int
+    surface: str
+    feature: str
+    length: int
+    bnext: Optional[int]  # 같은 위치에서 시작하는 다음 노드 id
+    enext: Optional[int]  # 같은 위치에서 끝나는 다음 노드 id
+
+
+class LatticeIndex:
+    """
+    한 문장의 lattice 인덱스
+
+    tokens에는 1-best 경로의 노드가, groups에는 각 토큰의
+    (시작 바이트 위치, 길이)와 같은 노드들이 id → 레코드로 들어 있다.
+    segmentations에는 N-best 경로 중 토큰과 같은 구간을 여러 노드로 나눈 분할들이 들어 있다.
+    """
+
+    def __init__(self):
+        self.tokens: List[LatticeNode] = []
+        self.groups: Dict[Tuple[int, int], Dict[int, LatticeNode]] = {}
+        self.segmentations: List[List[List[LatticeNode]]] = []
+        self.truncated = False  # 시간 제한으로 N-best 탐색을 중단했는지 여부
+        self.parse_seconds = 0.0  # tagger.parse에 걸린 시간 (단계별 지표용)
+        self._token_keys: List[Tuple[int, int]] = []
+        self._token_spans: List[Optional[Tuple[int, int]]] = []  # 대체 노드를 수집하지 않는 토큰은 None
+
+    @classmethod
+    def build(cls, tagger: "MeCab.Tagger", text: str, nbest: int = 1,
+              deadline: Optional[float] = None,
+              needs_alternatives: Optional[Callable[[str], bool]] = None) -> "LatticeIndex":
+        """
+        문장을 파싱하고 1-best 경로를 따라가며 인덱스 생성
+
+        Args:
+            tagger: MeCab.Tagger (호출한 스레드가 독점 중이어야 함)
+            text: 분석할 텍스트
+            nbest: 탐색할 분할 경로 수 (1이면 1-best만)
+            deadline: N-best 탐색을 멈출 time.perf_counter() 시각 (None이면 제한 없음)
+            needs_alternatives: 표층형을 받아 대체 노드가 필요한지 판단하는 함수
+                (None이면 모든 토큰, False인 토큰은 replace_nodes를 호출할 수 없음)
+
+        Returns:
+            LatticeIndex
+        """
+        index = cls()
+        lattice = MeCab.Lattice()
+        if nbest > 1:
+            lattice.set_request_type(MeCab.MECAB_NBEST)
+        lattice.set_sentence(text)
+        parse_started = time.perf_counter()
+        tagger.parse(lattice)
+        index.parse_seconds = time.perf_counter() - parse_started
+
+        position = 0  # 바이트 단위 위치
+        node = lattice.bos_node().next
+        while node is not None and node.stat != EOS_NODE:
+            # begin_nodes는 앞 공백을 포함한 위치 기준 (rlength = 공백 + length)
+            length = node.length
+            if node.surface:
+                key = (position, length)
+                if needs_alternatives is None or needs_alternatives(node.surface):
+                    if key not in index.groups:
+                        index.groups[key] = _collect_group(lattice.begin_nodes(position), length)
+                    index._token_spans.append((position, position + node.rlength))
+                else:
+                    index._token_spans.append(None)
+                index.tokens.append(_to_record(node))
+                index._token_keys.append(key)
+            position += node.rlength
+            node = node.next
+
+        index.segmentations = [[] for _ in index.tokens]
+        if nbest > 1:
+            index._collect_segmentations(lattice, nbest, deadline)
+
+        return index
+
+    def _collect_segmentations(self, lattice: "MeCab.Lattice", nbest: int,
+                               deadline: Optional[float]) -> None:
+        """
+        2번째 이후 N-best 경로에서 1-best 토큰과 같은 구간을 여러 노드로 나눈 분할 수집
+
+        Args:
+            lattice: NBEST 요청으로 파싱한 lattice (현재 1-best 경로)
+            nbest: 탐색할 전체 경로 수
+            deadline: 탐색을 멈출 time.perf_counter() 시각
+        """
+        token_at = {span[0]: i for i, span in enumerate(self._token_spans) if span is not None}
+        seen = set()
+
+        for _ in range(nbest - 1):
+            if deadline is not None and time.perf_counter() > deadline:
+                self.truncated = True
+                break
+            if not lattice.next():
+                break
+
+            # 경로를 (시작, 끝, 노드)로 펼치기
+            path = []
+            position = 0
+            node = lattice.bos_node().next
+            while node is not None and node.stat != EOS_NODE:
+                path.append((position, position + node.rlength, node))
+                position += node.rlength
+                node = node.next
+
+            # 토큰 시작 위치에서 출발해 토큰 끝에 정확히 맞는 노드 묶음 찾기
+            for start, (begin, _, _) in enumerate(path):
+                token_index = token_at.get(begin)
+                if token_index is None:
+                    continue
+                token_end = self._token_spans[token_index][1]
+                stop = start
+                while stop < len(path) and path[stop][1] < token_end:
+                    stop += 1
+                if stop == start or stop >= len(path) or path[stop][1] != token_end:
+                    continue  # 한 노드로 된 경우는 groups에 이미 있음
+
+                nodes = [path_node for _, _, path_node in path[start:stop + 1]]
+                segment_key = (token_index,) + tuple((n.surface, n.feature) for n in nodes)
+                if segment_key in seen:
+                    continue
+                seen.add(segment_key)
+                self.segmentations[token_index].append([_to_record(n) for n in nodes])
+
+    def __iter__(self) -> Iterator[LatticeNode]:
+        return iter(self.tokens)
+
+    def replace_nodes(self, token_index: int) -> List[LatticeNode]:
+        """
+        토큰과 같은 길이의 대체 노드 수집
+        (get_all_replace_nodes와 같은 순서: 자기 자신 → BNext → ENext 깊이 우선,
+        (surface, feature)가 이미 나온 노드에서는 더 이상 탐색하지 않음)
+
+        Args:
+            token_index: tokens 내 토큰 인덱스
+
+        Returns:
+            대체 노드 레코드 리스트
+        """
+        group = self.groups[self._token_keys[token_index]]
+        result = []
+        visited = set()
+        stack = [(self.tokens[token_index].id, 0)]
+
+        while stack:
+            node_id, depth = stack.pop()
+            if depth > MAX_DEPTH:
+                continue
+            node = group.get(node_id)
+            if node is None or not node.surface:
+                continue
+
+            node_key = (node.surface, node.feature)
+            if node_key in visited:
+                continue
+            visited.add(node_key)
+            result.append(node)
+
+            # BNext를 먼저 탐색하도록 ENext부터 쌓기
+            if node.enext is not None:
+                stack.append((node.enext, depth + 1))
+            if node.bnext is not None:
+                stack.append((node.bnext, depth + 1))
+
+        return result
+
+
+def _to_record(node) -> LatticeNode:
+    """MeCab 노드를 LatticeNode 레코드로 복사"""
+    bnext = node.bnext
+    enext = node.enext
+    return LatticeNode(
+        node.id,
+        node.surface,
+        node.feature,
+        node.length,
+        bnext.id if bnext is not None else None,
+        enext.id if enext is not None else None,
+    )
+
+
+def _collect_group(node, length: int) -> Dict[int, LatticeNode]:
+    """시작 위치가 같은 노드 목록(BNext 체인)에서 길이가 같은 노드만 모으기"""
+    group = {}
+    while node is not None:
+        if node.length == length:
+            group[node.id] = _to_record(node)
+        node = node.bnext
+    return group
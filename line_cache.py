@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+줄 단위 분석 결과 캐시
+같은 가사 줄(후렴, 반복구 등)은 MeCab 분석을 한 번만 하도록 결과를 재사용
+줄 내용 해시(line_hash)를 키로 사용하므로 클라이언트가 해시만 보내서 결과를 조회할 수도 있다
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional
+
+
+# 줄 앞뒤에서 제거하는 공백 문자 (str.strip() 기본값과 같은 집합)
+# 클라이언트(static/api.js의 LINE_WHITESPACE)도 같은 집합으로 줄 해시를 계산해야 하므로 명시
+# (JS의 trim()은 U+FEFF를 제거하고 U+001C~U+001F, U+0085는 제거하지 않음)
+LINE_WHITESPACE = (
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680"
+    "\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+    "\u2028\u2029\u202f\u205f\u3000"
+)
+
+
+def normalize_line(text: str) -> str:
+    """
+    캐시 키로 사용할 줄 텍스트 정규화
+
+    analyze_sentence에 실제로 넘기는 값과 같아야 하므로 앞뒤 공백(LINE_WHITESPACE)만 제거한다.
+
+    Args:
+        text: 원본 줄 텍스트
+
+    Returns:
+        정규화된 줄 텍스트
+    """
+    return text.strip(LINE_WHITESPACE)
+
+
+# 줄 해시 길이 (16진수 자릿수)
+LINE_HASH_LENGTH = 16
+
+
+def line_hash(text: str) -> str:
+    """
+    정규화된 줄 텍스트의 내용 해시 (클라이언트와 같은 방식: UTF-8 SHA-256 앞 64비트의 16진수)
+    가사 한 줄보다 짧아야 해시만 보내는 의미가 있으므로 앞 16자리만 사용
+
+    Args:
+        text: 정규화된 줄 텍스트
+
+    Returns:
+        16자리 16진수 해시 문자열
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:LINE_HASH_LENGTH]
+
+
+# 빈 줄의 해시
+EMPTY_LINE_HASH = line_hash("")
+
+# 문서 해시 길이 (16진수 자릿수, 공개 URL 키로 쓰므로 줄 해시보다 길게)
+DOCUMENT_HASH_LENGTH = 32
+
+
+def normalize_document(lines: Iterable[str]) -> str:
+    """
+    여러 줄 입력을 문서 단위 키로 정규화
+    줄마다 normalize_line을 적용하고 앞뒤 빈 줄을 제거해서 개행으로 연결
+    (text.strip().split('\n')로 나눈 요청 줄과 분석 결과의 original_text 어느 쪽에서 만들어도 같음)
+
+    Args:
+        lines: 줄 리스트
+
+    Returns:
+        정규화된 문서 텍스트
+    """
+    normalized = [normalize_line(line) for line in lines]
+    start, end = 0, len(normalized)
+    while start < end and not normalized[start]:
+        start += 1
+    while end > start and not normalized[end - 1]:
+        end -= 1
+    return "\n".join(normalized[start:end])
+
+
+def document_hash(document: str) -> str:
+    """
+    정규화된 문서 텍스트의 내용 해시 (클라이언트와 같은 방식: UTF-8 SHA-256 앞 128비트의 16진수)
+
+    Args:
+        document: normalize_document 결과
+
+    Returns:
+        32자리 16진수 해시 문자열
+    """
+    return hashlib.sha256(document.encode("utf-8")).hexdigest()[:DOCUMENT_HASH_LENGTH]
+
+
+class LineCache:
+    """
+    LRU 방식의 줄 단위 분석 결과 캐시
+
+    키는 (사전 식별자, 분석 설정, 줄 해시) 튜플이며,
+    저장된 결과는 여러 요청이 공유하므로 읽기 전용으로 다뤄야 한다.
+    """
+
+    def __init__(self, max_size: int = 4096):
+        """
+        Args:
+            max_size: 최대 보관 줄 수 (0이면 캐시 비활성화)
+        """
+        self.max_size = max_size
+        self._data: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 결과 조회 (조회된 항목은 가장 최근 사용으로 이동)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            캐시된 분석 결과, 없으면 None
+        """
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Dict[str, Any]) -> None:
+        """
+        분석 결과 저장 (용량을 넘으면 가장 오래된 항목부터 제거)
+
+        Args:
+            key: 캐시 키
+            value: 분석 결과
+        """
+        if self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """캐시 비우기 (카운터는 유지)"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계
+
+        Returns:
+            크기, 적중/실패/제거 횟수, 적중률 딕셔너리
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+MeCab 노드 feature 문자열 파서
+사전 형식(UniDic / IPAdic)은 Tagger를 만들 때 한 번만 판별하고,
+같은 feature 문자열은 한 번만 나눠서 품사와 발음 필드를 재사용
+"""
+
+import csv
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+
+
+UNIDIC = "unidic"
+IPADIC = "ipadic"
+
+# 사전 형식 판별에 사용할 단어
+PROBE_TEXT = "東京"
+
+# 형식별로 필요한 앞쪽 필드 수
+# UniDic: 品詞,品詞細分類1,品詞細分類2,品詞細分類3,活用型,活用形,語彙素読み,語彙素,書字形出現形,
+#         発音形出現形(9),書字形基本形,発音形基本形,語種,語頭変化型,語頭変化形,語末変化型,語末変化形,仮名形出現形(17)
+# IPAdic: 品詞,品詞細分類1,品詞細分類2,品詞細分類3,活用型,活用形,原形,読み(7),発音
+FIELD_COUNTS = {UNIDIC: 18, IPADIC: 8}
+
+
+class NodeFeatures(NamedTuple):
+    """노드 하나의 품사와 발음 (발음이 없는 필드는 표층형으로 채움)"""
+    pos1: str
+    pos2: str
+    pos3: str
+    pron: str  # 발음 (장음 하이픈, 예: サイコー)
+    kana: str  # 읽기 (장음 모음 반복, 예: サイコウ)
+
+
+def split_fields(feature: str, count: int) -> Tuple[str, ...]:
+    """
+    feature 문자열의 앞쪽 count개 필드를 CSV 규칙으로 나누기
+
+    Args:
+        feature: MeCab 노드 feature
+        count: 필요한 필드 수
+
+    Returns:
+        필드 튜플 (필드가 모자라면 더 짧음)
+    """
+    if '"' not in feature:
+        return tuple(feature.split(',', count)[:count])
+    # 쉼표가 들어간 필드는 큰따옴표로 감싸져 있음
+    return tuple(next(csv.reader([feature]))[:count])
+
+
+def _parse_unidic(feature: str) -> Tuple[str, str, str, Optional[str], Optional[str]]:
+    """UniDic feature → (pos1, pos2, pos3, pron, kana), pron/kana가 None이면 각각 표층형/pron 사용"""
+    fields = split_fields(feature, FIELD_COUNTS[UNIDIC])
+    count = len(fields)
+    pos = fields[:3] + ("",) * (3 - min(count, 3))
+
+    pron = kana = None
+    if count >= 18:
+        pron = fields[9] if fields[9] != '*' else None  # 発音形出現形
+        kana = fields[17] if fields[17] != '*' else None  # 仮名形出現形
+        # C# GetKana 로직: 助詞는 kana도 pron 사용 (は→わ)
+        if fields[0] == "助詞":
+            kana = None
+    elif count >= 10:
+        # UniDic이지만 features가 부족한 경우
+        pron = fields[9] if fields[9] != '*' else None
+    return pos[0], pos[1], pos[2], pron, kana
+
+
+def _parse_ipadic(feature: str) -> Tuple[str, str, str, Optional[str], Optional[str]]:
+    """IPAdic feature → (pos1, pos2, pos3, pron, None), pron이 None이면 표층형 사용"""
+    fields = split_fields(feature, FIELD_COUNTS[IPADIC])
+    count = len(fields)
+    pos = fields[:3] + ("",) * (3 - min(count, 3))
+
+    pron = None
+    if count >= 8:
+        pron = fields[7] if fields[7] != '*' else None  # 読み
+    return pos[0], pos[1], pos[2], pron, None
+
+
+class FeatureParser:
+    """
+    사전 형식에 맞춘 feature 파서
+
+    feature 문자열별 파싱 결과를 캐시하므로 같은 단어가 반복되면 문자열을 다시 나누지 않는다.
+    """
+
+    def __init__(self, dictionary_format: str = UNIDIC, cache_size: int = 65536):
+        """
+        Args:
+            dictionary_format: UNIDIC 또는 IPADIC
+            cache_size: feature 문자열 파싱 결과 캐시 크기
+        """
+        if dictionary_format not in FIELD_COUNTS:
+            raise ValueError(f"지원하지 않는 사전 형식: {dictionary_format}")
+        self.dictionary_format = dictionary_format
+        parse_fields = _parse_unidic if dictionary_format == UNIDIC else _parse_ipadic
+        self._parse_fields = lru_cache(maxsize=cache_size)(parse_fields)
+
+    @classmethod
+    def detect(cls, tagger, cache_size: int = 65536) -> "FeatureParser":
+        """
+        Tagger로 판별용 단어를 분석해서 사전 형식을 판별
+
+        Args:
+            tagger: MeCab.Tagger
+            cache_size: feature 문자열 파싱 결과 캐시 크기
+
+        Returns:
+            FeatureParser
+        """
+        node = tagger.parseToNode(PROBE_TEXT)
+        while node is not None and not node.surface:
+            node = node.next
+        field_count = len(next(csv.reader([node.feature]))) if node is not None else 0
+        # IPAdic 계열은 9개, UniDic 계열은 발음형(9번)을 포함해 그보다 많음
+        dictionary_format = UNIDIC if field_count >= 10 else IPADIC
+        return cls(dictionary_format, cache_size)
+
+    def parse(self, surface: str, feature: str) -> NodeFeatures:
+        """
+        노드의 품사와 발음 추출
+
+        Args:
+            surface: 노드 표층형
+            feature: 노드 feature
+
+        Returns:
+            NodeFeatures
+        """
+        pos1, pos2, pos3, pron, kana = self._parse_fields(feature)
+        if pron is None:
+            pron = surface
+        if kana is None:
+            kana = pron
+        return NodeFeatures(pos1, pos2, pos3, pron, kana)
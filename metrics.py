@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+처리 단계별 시간/개수 지표
+히스토그램과 카운터를 프로세스 안에 모아 두고 Prometheus 텍스트 형식으로 출력
+(METRICS=0이면 기록하지 않음)
+
+프로세스 워커의 지표는 drain()으로 꺼내서 메인 프로세스에서 merge()로 합친다.
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+ENABLED = os.environ.get("METRICS", "1") != "0"
+
+# 시간 히스토그램 구간 (초)
+TIME_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# 개수 히스토그램 구간
+COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 5000)
+
+PREFIX = "japanese_hangul_"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{value}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Metric:
+    """라벨 값 조합별로 값을 보관하는 지표 기본 클래스"""
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = PREFIX + name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._series: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def _new_series(self) -> list:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+    def drain(self) -> Dict[Tuple[str, ...], list]:
+        """값을 꺼내고 비우기 (워커 → 메인 프로세스 전달용)"""
+        with self._lock:
+            series, self._series = self._series, {}
+        return series
+
+    def merge(self, series: Dict[Tuple[str, ...], list]) -> None:
+        """drain()으로 꺼낸 값을 더하기"""
+        with self._lock:
+            for labels, values in series.items():
+                current = self._series.get(labels)
+                if current is None:
+                    self._series[labels] = list(values)
+                else:
+                    for i, value in enumerate(values):
+                        current[i] += value
+
+
+class Counter(Metric):
+    """누적 카운터"""
+    kind = "counter"
+
+    def _new_series(self) -> list:
+        return [0.0]
+
+    def inc(self, amount: float = 1, *labels: str) -> None:
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = self._new_series()
+            series[0] += amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._series.items())
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(values[0])}"
+                for labels, values in items]
+
+
+class Gauge(Metric):
+    """현재 값 (출력 직전에 set으로 갱신, merge하지 않음)"""
+    kind = "gauge"
+
+    def _new_series(self) -> list:
+        return [0.0]
+
+    def set(self, value: float, *labels: str) -> None:
+        with self._lock:
+            self._series[labels] = [value]
+
+    def drain(self) -> Dict[Tuple[str, ...], list]:
+        return {}
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._series.items())
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(values[0])}"
+                for labels, values in items]
+
+
+class Histogram(Metric):
+    """
+    구간별 히스토그램
+    값 리스트 형식: [구간별 개수..., +Inf 구간 개수, 합계, 관측 수]
+    """
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = TIME_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def _new_series(self) -> list:
+        return [0] * (len(self.buckets) + 1) + [0.0, 0]
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = self._new_series()
+            series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((labels, list(values)) for labels, values in self._series.items())
+        lines = []
+        bounds = self.buckets + (float("inf"),)
+        for labels, values in items:
+            cumulative = 0
+            for bound, count in zip(bounds, values):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(values[-2])}")
+            lines.append(f"{self.name}_count{label_text} {values[-1]}")
+        return lines
+
+
+class Registry:
+    """지표 모음"""
+
+    def __init__(self):
+        self.metrics: List[Metric] = []
+        self.collect_hooks: List[Callable[[], None]] = []  # 값을 읽기 전에 호출 (버퍼 비우기)
+
+    def register(self, metric: Metric) -> Metric:
+        self.metrics.append(metric)
+        return metric
+
+    def collect(self) -> None:
+        for hook in self.collect_hooks:
+            hook()
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (text/plain; version=0.0.4)"""
+        self.collect()
+        lines = []
+        for metric in self.metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def drain(self) -> Dict[str, Dict[Tuple[str, ...], list]]:
+        """모든 지표 값을 꺼내고 비우기 (값이 있는 지표만)"""
+        self.collect()
+        delta = {}
+        for metric in self.metrics:
+            series = metric.drain()
+            if series:
+                delta[metric.name] = series
+        return delta
+
+    def merge(self, delta: Dict[str, Dict[Tuple[str, ...], list]]) -> None:
+        """다른 프로세스에서 drain()한 값을 더하기"""
+        for metric in self.metrics:
+            series = delta.get(metric.name)
+            if series:
+                metric.merge(series)
+
+
+REGISTRY = Registry()
+
+# 줄 단위 분석 (JapanesePronunciationExtractor)
+LINE_STAGE_SECONDS = REGISTRY.register(Histogram(
+    "line_stage_seconds",
+    "줄 하나의 분석 단계별 시간 (parse: MeCab 파싱, lattice: 대체 노드 수집, candidates: 발음/한글 변환, to_dict: 응답 딕셔너리 생성)",
+    ("stage",),
+))
+LINE_TOKENS = REGISTRY.register(Histogram(
+    "line_tokens", "줄당 단어 수", buckets=COUNT_BUCKETS,
+))
+LINE_CANDIDATES = REGISTRY.register(Histogram(
+    "line_candidates", "줄당 발음 후보 수 (모든 단어 합계)", buckets=COUNT_BUCKETS,
+))
+
+# 요청 단위 (app.py)
+REQUEST_STAGE_SECONDS = REGISTRY.register(Histogram(
+    "request_stage_seconds",
+    "요청 하나의 단계별 시간 (cache: 캐시 조회, analysis: 분석 대기, serialize: 응답 직렬화, total: 전체)",
+    ("endpoint", "stage"),
+))
+REQUEST_LINES = REGISTRY.register(Histogram(
+    "request_lines", "요청당 줄 수 (빈 줄 제외)", ("endpoint",), buckets=COUNT_BUCKETS,
+))
+LINES_ANALYZED = REGISTRY.register(Counter(
+    "lines_analyzed_total", "캐시에 없어서 새로 분석한 줄 수",
+))
+LINE_CACHE = REGISTRY.register(Gauge(
+    "line_cache", "줄 캐시 상태 (size, hits, misses, evictions)", ("stat",),
+))
+PERSISTENT_CACHE = REGISTRY.register(Gauge(
+    "persistent_cache", "디스크 캐시 조회 결과 (hits, misses, errors)", ("stat",),
+))
+ADMISSION = REGISTRY.register(Gauge(
+    "admission", "분석 요청 수락 제어 상태 (active: 실행 중, waiting: 대기 중)", ("stat",),
+))
+REQUESTS_REJECTED = REGISTRY.register(Counter(
+    "requests_rejected_total", "거절하거나 중단한 요청 수 (queue_full: 429, queue_timeout: 503, deadline: 504)", ("reason",),
+))
+JOBS = REGISTRY.register(Gauge(
+    "jobs", "상태별 비동기 변환 작업 수 (queued, running, done, failed, cancelled)", ("status",),
+))
+
+
+# 줄 단위 값은 리스트에 쌓아 두고 LINE_BUFFER_SIZE개마다(또는 읽을 때) 히스토그램에 반영
+# (줄마다 히스토그램 5개를 갱신하면 잠금/구간 탐색 비용이 분석 시간의 몇 %가 됨)
+LINE_BUFFER_SIZE = 256
+_pending_lines: List[Tuple[float, float, float, int, int]] = []
+_pending_to_dict: List[float] = []
+_flush_lock = threading.Lock()
+
+
+def record_line(parse: float, lattice: float, candidates: float,
+                token_count: int, candidate_count: int) -> None:
+    """줄 하나의 분석 단계별 시간과 개수 기록"""
+    _pending_lines.append((parse, lattice, candidates, token_count, candidate_count))
+    if len(_pending_lines) >= LINE_BUFFER_SIZE:
+        flush_lines()
+
+
+def record_to_dict(seconds: float) -> None:
+    """줄 하나의 응답 딕셔너리 생성 시간 기록"""
+    _pending_to_dict.append(seconds)
+    if len(_pending_to_dict) >= LINE_BUFFER_SIZE:
+        flush_lines()
+
+
+def _take(buffer: list) -> list:
+    # append는 끝에만 붙으므로 앞쪽 count개를 잘라내면 다른 스레드가 붙인 값을 잃지 않음
+    count = len(buffer)
+    items = buffer[:count]
+    del buffer[:count]
+    return items
+
+
+def flush_lines() -> None:
+    """쌓아 둔 줄 단위 값을 히스토그램에 반영"""
+    with _flush_lock:
+        lines = _take(_pending_lines)
+        to_dict = _take(_pending_to_dict)
+    for parse, lattice, candidates, token_count, candidate_count in lines:
+        LINE_STAGE_SECONDS.observe(parse, "parse")
+        LINE_STAGE_SECONDS.observe(lattice, "lattice")
+        LINE_STAGE_SECONDS.observe(candidates, "candidates")
+        LINE_TOKENS.observe(token_count)
+        LINE_CANDIDATES.observe(candidate_count)
+    for seconds in to_dict:
+        LINE_STAGE_SECONDS.observe(seconds, "to_dict")
+
+
+REGISTRY.collect_hooks.append(flush_lines)
+
+
+class StageTimer:
+    """
+    요청 하나의 단계별 시간 측정
+    측정한 값은 Server-Timing 헤더와 요청 단위 히스토그램에 사용
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.durations: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name: str, seconds: float) -> None:
+        self.durations[name] = self.durations.get(name, 0.0) + seconds
+
+    def finish(self, endpoint: str, line_count: Optional[int] = None) -> str:
+        """
+        전체 시간을 더하고 히스토그램에 기록
+
+        Args:
+            endpoint: 엔드포인트 이름 (라벨)
+            line_count: 요청 줄 수 (None이면 기록 안 함)
+
+        Returns:
+            Server-Timing 헤더 값 (예: "cache;dur=0.1, analysis;dur=12.3, total;dur=13.0")
+        """
+        self.durations["total"] = time.perf_counter() - self.started
+        if ENABLED:
+            for name, seconds in self.durations.items():
+                REQUEST_STAGE_SECONDS.observe(seconds, endpoint, name)
+            if line_count is not None:
+                REQUEST_LINES.observe(line_count, endpoint)
+        return ", ".join(f"{name};dur={seconds * 1000:.2f}" for name, seconds in self.durations.items())
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+디스크 기반 줄 단위 분석 결과 캐시 (SQLite)
+인스턴스 재시작, 여러 uvicorn 워커/분석 프로세스 사이에서 analyze_sentence 결과를 공유
+
+- 키: (사전 식별자, 분석 설정, 줄 해시), 정규화된 줄 텍스트도 함께 저장해서 텍스트로 조회할 때 확인
+- WAL 모드라서 여러 프로세스가 동시에 읽고, 쓰기는 짧은 트랜잭션으로 묶음
+- 최대 항목 수를 넘으면 오래 사용하지 않은 항목부터 제거
+- 캐시 오류(잠금 시간 초과, 디스크 문제 등)는 경고만 남기고 캐시 없음으로 처리
+
+미리 채우기 (컨테이너 이미지 빌드 시 등):
+    python persistent_cache.py prebuild --db data/analysis_cache.sqlite 가사.txt [가사 디렉터리 ...]
+"""
+
+import argparse
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from compact_format import dumps, loads
+from line_cache import line_hash, normalize_line
+
+
+logger = logging.getLogger(__name__)
+
+# 한 번의 IN (...) 조회에 넣을 해시 수 (SQLite 변수 개수 제한 이하)
+QUERY_CHUNK_SIZE = 500
+
+# 이 개수만큼 저장할 때마다 전체 항목 수를 확인하고 넘치면 제거
+EVICTION_CHECK_INTERVAL = 256
+
+# 용량을 넘으면 최대 항목 수의 이 비율까지 줄임 (매번 조금씩 지우지 않도록)
+EVICTION_TARGET_RATIO = 0.9
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS line_results (
+    dictionary TEXT NOT NULL,
+    options TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    text TEXT NOT NULL,
+    result BLOB NOT NULL,
+    last_used INTEGER NOT NULL,
+    PRIMARY KEY (dictionary, options, hash)
+);
+CREATE INDEX IF NOT EXISTS line_results_last_used ON line_results (last_used);
+"""
+
+
+def options_key(options: Sequence[Any]) -> str:
+    """
+    분석 설정(AnalysisOptions)을 저장용 문자열로 변환
+
+    Args:
+        options: AnalysisOptions (nbest, max_candidates, time_limit, fields)
+
+    Returns:
+        "1,0,0.0" 형식 문자열 (fields가 있으면 "1,0,0.0,hangul_pron+pos1", 없으면 기존 키와 동일)
+    """
+    values = [str(value) for value in options[:3]]
+    if len(options) > 3 and options[3]:
+        values.append("+".join(options[3]))
+    return ",".join(values)
+
+
+class PersistentCache:
+    """
+    SQLite 줄 캐시
+
+    연결은 프로세스/스레드마다 따로 열기 때문에 fork한 워커에서도 그대로 사용할 수 있다.
+    """
+
+    def __init__(self, path: str, max_entries: int = 50000, touch_interval: int = 3600,
+                 busy_timeout: float = 1.0):
+        """
+        Args:
+            path: 데이터베이스 파일 경로 (디렉터리가 없으면 생성)
+            max_entries: 최대 보관 줄 수
+            touch_interval: 조회된 항목의 마지막 사용 시각을 갱신하는 최소 간격 (초, 읽기마다 쓰지 않도록)
+            busy_timeout: 다른 프로세스가 쓰는 중일 때 기다릴 시간 (초)
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.touch_interval = touch_interval
+        self.busy_timeout = busy_timeout
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self._local = threading.local()
+        self._puts_since_check = EVICTION_CHECK_INTERVAL  # 처음 저장할 때 한 번 확인
+
+    def _connection(self) -> sqlite3.Connection:
+        """현재 프로세스/스레드의 연결 (처음 사용할 때 열고 스키마 생성)"""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None and self._local.pid == os.getpid():
+            return connection
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(SCHEMA)
+        self._local.connection = connection
+        self._local.pid = os.getpid()
+        return connection
+
+    def get_many(self, dictionary: str, options: Sequence[Any],
+                 hashes: Iterable[str]) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+        """
+        줄 해시 여러 개를 한 번에 조회
+
+        Args:
+            dictionary: 사전 식별자 (extractor.dictionary_id)
+            options: 분석 설정
+            hashes: 줄 해시 리스트
+
+        Returns:
+            줄 해시 → (정규화된 줄 텍스트, 분석 결과) 딕셔너리 (찾은 것만)
+        """
+        hashes = list(dict.fromkeys(hashes))
+        if not hashes:
+            return {}
+
+        key = options_key(options)
+        now = int(time.time())
+        found = {}
+        stale = []
+        try:
+            connection = self._connection()
+            for start in range(0, len(hashes), QUERY_CHUNK_SIZE):
+                chunk = hashes[start:start + QUERY_CHUNK_SIZE]
+                rows = connection.execute(
+                    "SELECT hash, text, result, last_used FROM line_results "
+                    f"WHERE dictionary = ? AND options = ? AND hash IN ({','.join('?' * len(chunk))})",
+                    [dictionary, key, *chunk],
+                )
+                for line_hash_value, text, result, last_used in rows:
+                    found[line_hash_value] = (text, loads(result))
+                    if now - last_used >= self.touch_interval:
+                        stale.append(line_hash_value)
+            if stale:
+                self._touch(connection, dictionary, key, stale, now)
+        except sqlite3.Error as error:
+            self.errors += 1
+            logger.warning("디스크 캐시 조회 실패: %s", error)
+            return {}
+
+        self.hits += len(found)
+        self.misses += len(hashes) - len(found)
+        return found
+
+    def get_texts(self, dictionary: str, options: Sequence[Any],
+                  texts: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        정규화된 줄 텍스트 여러 개를 한 번에 조회 (해시가 같아도 텍스트가 다르면 없는 것으로 처리)
+
+        Args:
+            dictionary: 사전 식별자
+            options: 분석 설정
+            texts: 정규화된 줄 텍스트 리스트
+
+        Returns:
+            줄 텍스트 → 분석 결과 딕셔너리 (찾은 것만)
+        """
+        by_hash = {line_hash(text): text for text in texts}
+        found = self.get_many(dictionary, options, by_hash)
+        return {
+            text: found[hash_value][1]
+            for hash_value, text in by_hash.items()
+            if hash_value in found and found[hash_value][0] == text
+        }
+
+    def _touch(self, connection: sqlite3.Connection, dictionary: str, key: str,
+               hashes: List[str], now: int) -> None:
+        """조회된 항목의 마지막 사용 시각 갱신 (다른 프로세스가 쓰는 중이면 건너뜀)"""
+        try:
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                connection.executemany(
+                    "UPDATE line_results SET last_used = ? WHERE dictionary = ? AND options = ? AND hash = ?",
+                    [(now, dictionary, key, hash_value) for hash_value in hashes],
+                )
+        except sqlite3.OperationalError:
+            pass
+
+    def put_many(self, dictionary: str, options: Sequence[Any],
+                 items: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """
+        분석 결과 여러 개를 한 트랜잭션으로 저장
+
+        Args:
+            dictionary: 사전 식별자
+            options: 분석 설정
+            items: (정규화된 줄 텍스트, 분석 결과) 리스트
+        """
+        key = options_key(options)
+        now = int(time.time())
+        rows = [(dictionary, key, line_hash(text), text, dumps(result), now) for text, result in items]
+        if not rows or self.max_entries <= 0:
+            return
+
+        try:
+            connection = self._connection()
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                connection.executemany(
+                    "INSERT OR REPLACE INTO line_results "
+                    "(dictionary, options, hash, text, result, last_used) VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+            self._puts_since_check += len(rows)
+            if self._puts_since_check >= EVICTION_CHECK_INTERVAL:
+                self._puts_since_check = 0
+                self._evict(connection)
+        except sqlite3.Error as error:
+            self.errors += 1
+            logger.warning("디스크 캐시 저장 실패: %s", error)
+
+    def _evict(self, connection: sqlite3.Connection) -> int:
+        """
+        최대 항목 수를 넘었으면 오래 사용하지 않은 항목부터 제거
+
+        Returns:
+            제거한 항목 수
+        """
+        count = connection.execute("SELECT COUNT(*) FROM line_results").fetchone()[0]
+        if count <= self.max_entries:
+            return 0
+        excess = count - int(self.max_entries * EVICTION_TARGET_RATIO)
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                "DELETE FROM line_results WHERE rowid IN "
+                "(SELECT rowid FROM line_results ORDER BY last_used LIMIT ?)",
+                (excess,),
+            )
+        return excess
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM line_results").fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 (이 프로세스의 조회 기준)
+
+        Returns:
+            경로, 최대 항목 수, 적중/실패/오류 횟수 딕셔너리
+        """
+        lookups = self.hits + self.misses
+        return {
+            "path": self.path,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        """현재 스레드의 연결 닫기"""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+def from_env() -> Optional[PersistentCache]:
+    """
+    환경 변수로 디스크 캐시 생성
+
+    - PERSISTENT_CACHE: 데이터베이스 파일 경로 (없으면 사용 안 함)
+    - PERSISTENT_CACHE_SIZE: 최대 보관 줄 수 (기본 50000, 줄당 3~4KB)
+
+    Returns:
+        PersistentCache, 사용하지 않으면 None
+    """
+    path = os.environ.get("PERSISTENT_CACHE")
+    if not path:
+        return None
+    return PersistentCache(path, max_entries=int(os.environ.get("PERSISTENT_CACHE_SIZE", "50000")))
+
+
+def prebuild(cache: PersistentCache, paths: List[str], dict_path: Optional[str] = None,
+             nbest: int = 1, max_candidates: int = 0, time_limit: float = 0.0,
+             batch_size: int = 500) -> Tuple[int, int]:
+    """
+    코퍼스 파일의 줄을 분석해서 디스크 캐시 미리 채우기 (이미 있는 줄은 건너뜀)
+    서버와 같은 사전, 같은 분석 설정(NBEST, MAX_CANDIDATES, LINE_TIME_LIMIT_MS)으로 만들어야 조회됨
+
+    Args:
+        cache: 채울 디스크 캐시
+        paths: 입력 파일/디렉터리 경로 리스트 ('-'는 표준 입력)
+        dict_path: 사전 경로 (None이면 기본 사전)
+        nbest: N-best 경로 수
+        max_candidates: 단어당 후보 수 상한
+        time_limit: 줄 하나의 분석 시간 제한 (초)
+        batch_size: 한 트랜잭션에 저장할 줄 수
+
+    Returns:
+        (고유한 줄 수, 새로 분석한 줄 수) 튜플
+    """
+    from japanese_pron import JapanesePronunciationExtractor, iter_input_lines
+
+    extractor = JapanesePronunciationExtractor(
+        dict_path, nbest=nbest, max_candidates=max_candidates, time_limit=time_limit)
+    options = extractor.default_options
+
+    texts = list(dict.fromkeys(
+        text for text in (normalize_line(line) for line in iter_input_lines(paths)) if text
+    ))
+
+    analyzed = 0
+    for start in range(0, len(texts), batch_size):
+        batch = texts[start:start + batch_size]
+        cached = cache.get_texts(extractor.dictionary_id, options, batch)
+        items = []
+        for text in batch:
+            if text in cached:
+                continue
+            result = extractor.analyze_sentence(text, options)
+            if not result.get("truncated"):
+                items.append((text, result))
+        cache.put_many(extractor.dictionary_id, options, items)
+        analyzed += len(items)
+        print(f"{min(start + batch_size, len(texts))}/{len(texts)}줄", file=sys.stderr)
+
+    return len(texts), analyzed
+
+
+def main():
+    """명령줄 진입점"""
+    parser = argparse.ArgumentParser(description="디스크 분석 결과 캐시 관리")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build = subparsers.add_parser("prebuild", help="코퍼스로 캐시 미리 채우기")
+    build.add_argument("paths", nargs="+", help="가사 파일 또는 디렉터리 ('-'는 표준 입력)")
+    build.add_argument("--db", default=os.environ.get("PERSISTENT_CACHE"),
+                       help="데이터베이스 파일 경로 (기본 PERSISTENT_CACHE)")
+    build.add_argument("--max-entries", type=int,
+                       default=int(os.environ.get("PERSISTENT_CACHE_SIZE", "50000")),
+                       help="최대 보관 줄 수 (기본 PERSISTENT_CACHE_SIZE 또는 50000)")
+    build.add_argument("--dicdir", default=os.environ.get("MECAB_DICDIR") or None,
+                       help="MeCab 사전 경로 (기본 MECAB_DICDIR)")
+    build.add_argument("--nbest", type=int, default=int(os.environ.get("NBEST", "1")),
+                       help="N-best 경로 수 (서버의 NBEST와 같아야 함)")
+    build.add_argument("--max-candidates", type=int, default=int(os.environ.get("MAX_CANDIDATES", "0")),
+                       help="단어당 후보 수 상한 (서버의 MAX_CANDIDATES와 같아야 함)")
+    build.add_argument("--time-limit-ms", type=int, default=int(os.environ.get("LINE_TIME_LIMIT_MS", "0")),
+                       help="줄 하나의 분석 시간 제한 (서버의 LINE_TIME_LIMIT_MS와 같아야 함)")
+
+    stats = subparsers.add_parser("stats", help="캐시 항목 수 출력")
+    stats.add_argument("--db", default=os.environ.get("PERSISTENT_CACHE"),
+                       help="데이터베이스 파일 경로 (기본 PERSISTENT_CACHE)")
+
+    args = parser.parse_args()
+    if not args.db:
+        parser.error("--db 또는 PERSISTENT_CACHE가 필요합니다")
+
+    if args.command == "stats":
+        print(f"{args.db}: {len(PersistentCache(args.db))}줄")
+        return
+
+    cache = PersistentCache(args.db, max_entries=args.max_entries)
+    total, analyzed = prebuild(
+        cache, args.paths, dict_path=args.dicdir, nbest=args.nbest,
+        max_candidates=args.max_candidates, time_limit=args.time_limit_ms / 1000,
+    )
+    print(f"{args.db}: 고유한 줄 {total}개 중 {analyzed}개 새로 저장 (전체 {len(cache)}줄)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
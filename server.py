@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+다중 워커 서버 (사전을 미리 로드한 뒤 fork)
+
+uvicorn --workers N은 워커마다 app.py를 새로 import하고 사전 로드와 예열을 따로 한다.
+이 모드는 부모 프로세스에서 모듈 import, 사전 로드, 예열을 한 번만 하고 워커를 fork하므로
+워커들이 그 메모리 페이지를 copy-on-write로 공유하고, 워커는 시작하자마자 요청을 받을 수 있다.
+
+- 리슨 소켓은 부모가 열고 워커들이 함께 accept
+- 미리 로드한 객체는 gc.freeze()로 GC 대상에서 빼서 워커의 GC가 공유 페이지를 건드리지 않도록 함
+- 워커가 비정상 종료하면 부모가 다시 fork (미리 로드한 상태에서 바로 시작)
+- SIGTERM/SIGINT를 받으면 워커들에 SIGTERM을 보내고 종료를 기다림
+- 줄 캐시, /metrics, 변환 문서 저장소(GET /api/result)는 워커마다 따로 있음
+  (워커 사이에서 결과를 공유하려면 PERSISTENT_CACHE 사용)
+- 비동기 작업은 어느 워커로 조회가 가도 보여야 하므로 JOB_STORE가 없으면 임시 SQLite 파일을 함께 사용
+
+실행:
+    python server.py --workers 4 --port 8080
+    (워커 수 기본값: WEB_WORKERS 또는 CPU 코어 수, 포트 기본값: PORT 또는 8000)
+"""
+
+import argparse
+import gc
+import logging
+import os
+import signal
+import sys
+import tempfile
+import time
+
+import uvicorn
+
+
+logger = logging.getLogger("uvicorn.error")
+
+# 워커가 시작 후 이 시간(초) 안에 죽으면 다시 fork하기 전에 기다림 (계속 죽는 경우 fork 반복 방지)
+RESTART_BACKOFF = 1.0
+
+
+def run_worker(config: uvicorn.Config, sock) -> None:
+    """fork한 워커 프로세스: 공유 소켓으로 uvicorn 서버 실행 후 종료"""
+    # 터미널의 Ctrl+C는 부모만 받고 부모가 워커에 SIGTERM을 한 번만 보내도록 프로세스 그룹 분리
+    # (uvicorn은 두 번째 종료 신호를 받으면 진행 중인 요청을 기다리지 않고 바로 종료함)
+    os.setpgid(0, 0)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    # 준비 완료 로그의 시작 시간 기준을 워커 시작 시각으로 (다시 fork한 워커 포함)
+    sys.modules["app"].MODULE_LOADED_AT = time.perf_counter()
+    code = 0
+    try:
+        uvicorn.Server(config).run(sockets=[sock])
+    except BaseException:
+        logger.exception("워커 %d 오류", os.getpid())
+        code = 1
+    finally:
+        logging.shutdown()
+        os._exit(code)
+
+
+def spawn(config: uvicorn.Config, sock) -> int:
+    """워커 하나를 fork하고 pid 반환"""
+    pid = os.fork()
+    if pid == 0:
+        run_worker(config, sock)
+    return pid
+
+
+def supervise(config: uvicorn.Config, sock, workers: int) -> None:
+    """
+    워커 workers개를 fork하고, 종료 신호를 받을 때까지 죽은 워커를 다시 fork
+
+    Args:
+        config: uvicorn 설정 (app은 미리 로드된 상태)
+        sock: 부모가 연 리슨 소켓
+        workers: 워커 수
+    """
+    started = {}
+    for _ in range(workers):
+        started[spawn(config, sock)] = time.monotonic()
+    logger.info("워커 %d개 시작 (pid %s)", workers, ", ".join(map(str, started)))
+
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        if stopping:
+            return
+        stopping = True
+        logger.info("종료 신호 (%s): 워커 종료 대기", signal.Signals(signum).name)
+        for pid in started:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    while started:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        spawned_at = started.pop(pid, None)
+        if spawned_at is None or stopping:
+            continue
+        logger.warning("워커 %d 종료 (wait 상태 %d), 다시 시작", pid, status)
+        if time.monotonic() - spawned_at < RESTART_BACKOFF:
+            time.sleep(RESTART_BACKOFF)
+        if not stopping:
+            started[spawn(config, sock)] = time.monotonic()
+
+
+def remove_files(path: str) -> None:
+    """SQLite 파일과 WAL/공유 메모리 파일 삭제"""
+    for suffix in ("", "-wal", "-shm"):
+        try:
+            os.remove(path + suffix)
+        except OSError:
+            pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="사전을 미리 로드한 뒤 fork하는 다중 워커 서버")
+    parser.add_argument("--host", default=os.environ.get("HOST", "0.0.0.0"), help="바인드 주소 (기본 0.0.0.0)")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", "8000")),
+                        help="포트 (기본: PORT 또는 8000)")
+    parser.add_argument("--workers", type=int, default=int(os.environ.get("WEB_WORKERS") or os.cpu_count() or 1),
+                        help="워커 프로세스 수 (기본: WEB_WORKERS 또는 CPU 코어 수)")
+    parser.add_argument("--log-level", default="info", help="uvicorn 로그 수준 (기본 info)")
+    args = parser.parse_args()
+
+    temporary_job_store = None
+    if args.workers > 1 and not os.environ.get("JOB_STORE"):
+        temporary_job_store = os.path.join(tempfile.gettempdir(), f"japanese_hangul_jobs_{os.getpid()}.sqlite")
+        os.environ["JOB_STORE"] = temporary_job_store
+
+    import app
+
+    config = uvicorn.Config(app.app, host=args.host, port=args.port, log_level=args.log_level)
+    sock = config.bind_socket()
+
+    app.preload()
+    # 미리 로드한 객체를 GC 추적에서 빼서 워커의 GC가 공유 페이지의 객체 헤더에 쓰지 않도록 함
+    gc.collect()
+    gc.freeze()
+    logger.info("사전 미리 로드: %s", ", ".join(f"{name} {ms}ms" for name, ms in app.startup_timings.items()))
+
+    try:
+        supervise(config, sock, max(1, args.workers))
+    finally:
+        sock.close()
+        if temporary_job_store is not None:
+            remove_files(temporary_job_store)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
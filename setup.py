@@ -16,7 +16,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/monoletP/RomajiConverter.WinUI",
-    py_modules=["japanese_pron", "hangul_helper", "app"],
+    py_modules=["japanese_pron", "hangul_helper", "hangul_render", "japanese_script", "lattice_index", "mecab_features", "line_cache", "compact_format", "tagger_pool", "analysis_pool", "persistent_cache", "admission", "metrics", "jobs", "app", "server"],
     classifiers=[
         "Programming Language :: Python :: 3",
         "Programming Language :: Python :: 3.7",
@@ -39,9 +39,14 @@ setup(
         "mecab-python3>=1.0.6",
         "unidic-lite>=1.0.8",
     ],
+    extras_require={
+        "fast": ["orjson>=3.8.0"],
+    },
     entry_points={
         "console_scripts": [
             "japanese-hangul=japanese_pron:main",
+            "japanese-hangul-cache=persistent_cache:main",
+            "japanese-hangul-server=server:main",
         ],
     },
 )
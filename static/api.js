@@ -0,0 +1,268 @@
+// 변환 API 공용 함수
+
+// /api/convert/stream 호출: 줄 분석 결과가 도착할 때마다 onLine(line, lineIndex) 호출
+async function streamConvert(text, onLine) {
+    const response = await fetch('/api/convert/stream', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({ text: text })
+    });
+
+    if (!response.ok) {
+        throw await requestError(response);
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let lineIndex = 0;
+
+    while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+
+        buffer += decoder.decode(value, { stream: true });
+
+        // 완성된 줄(개행으로 끝나는 부분)만 처리
+        let newlineIndex;
+        while ((newlineIndex = buffer.indexOf('\n')) >= 0) {
+            const jsonLine = buffer.slice(0, newlineIndex);
+            buffer = buffer.slice(newlineIndex + 1);
+            if (jsonLine.trim()) {
+                onLine(parseStreamLine(jsonLine), lineIndex++);
+            }
+        }
+    }
+
+    // 마지막 줄이 개행 없이 끝난 경우
+    buffer += decoder.decode();
+    if (buffer.trim()) {
+        onLine(parseStreamLine(buffer), lineIndex++);
+    }
+}
+
+// 실패 응답의 오류 (서버가 보낸 detail이 있으면 메시지로 사용: 입력 크기 초과, 서버 혼잡, 시간 초과 등)
+async function requestError(response) {
+    let detail = '';
+    try {
+        const data = await response.json();
+        detail = typeof data.detail === 'string' ? data.detail : '';
+    } catch (e) {
+        // JSON이 아닌 응답
+    }
+    return new Error(`변환 요청 실패: ${response.status}${detail ? ` (${detail})` : ''}`);
+}
+
+// 스트림 한 줄 파싱 (서버가 중간에 멈춘 경우 {"error": ...} 객체가 옴)
+function parseStreamLine(jsonLine) {
+    const data = JSON.parse(jsonLine);
+    if (data.error) {
+        throw new Error(data.error);
+    }
+    return data;
+}
+
+// 입력 페이지에서 넘겨준 대기 중인 텍스트가 있으면 스트리밍 변환 시작
+// 줄이 도착할 때마다 onLine 호출, 끝나면 결과 전체를 세션에 저장
+async function loadPendingConversion(onLine) {
+    const pendingText = sessionStorage.getItem('pendingText');
+    if (pendingText === null) {
+        return null;
+    }
+    sessionStorage.removeItem('pendingText');
+
+    const data = {
+        lines: [],
+        detail_mode: sessionStorage.getItem('detailMode') === 'true'
+    };
+
+    await streamConvert(pendingText, (line, lineIndex) => {
+        data.lines.push(line);
+        onLine(data, line, lineIndex);
+    });
+
+    sessionStorage.setItem('convertedData', JSON.stringify(data));
+
+    // 스트리밍으로 분석한 줄도 서버 저장소에 있으므로 다음 증분 변환에서 해시만 보냄
+    if (window.crypto && crypto.subtle) {
+        saveKnownHashes(loadKnownHashes(), await Promise.all(pendingText.split('\n').map(lineHash)));
+    }
+    return data;
+}
+
+// 압축 응답(format: 'compact')을 기존 형식으로 복원 (이미 기존 형식이면 그대로 반환)
+function decodeConvertedData(data) {
+    if (!data || data.format !== 'compact') {
+        return data;
+    }
+
+    const strings = data.strings;
+    const fields = data.fields;
+    const fieldCount = fields.length;
+
+    const lines = data.lines.map(([originalIndex, words, truncated]) => {
+        const decodedWords = words.map(([surfaceIndex, selectedId, candidates]) => {
+            const alternatives = [];
+            for (let i = 0; i < candidates.length; i += fieldCount) {
+                const alt = {};
+                fields.forEach((field, j) => {
+                    alt[field] = strings[candidates[i + j]];
+                });
+                alternatives.push(alt);
+            }
+            return {
+                surface: strings[surfaceIndex],
+                selected_id: selectedId,
+                alternative_pronunciations: alternatives
+            };
+        });
+
+        const line = {
+            original_text: strings[originalIndex],
+            word_count: decodedWords.length,
+            words: decodedWords
+        };
+        if (truncated) {
+            line.truncated = true;
+        }
+        return line;
+    });
+
+    const result = {};
+    Object.keys(data).forEach(key => {
+        if (!['format', 'fields', 'strings', 'lines'].includes(key)) {
+            result[key] = data[key];
+        }
+    });
+    result.lines = lines;
+    return result;
+}
+
+// 줄 앞뒤에서 제거하는 공백 (서버 line_cache.LINE_WHITESPACE, 즉 Python str.strip()과 같은 집합)
+// String.prototype.trim()은 U+FEFF를 제거하고 U+001C~U+001F, U+0085는 남겨서 서버와 해시가 달라짐
+const LINE_WHITESPACE = /^[\t\n\v\f\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]+|[\t\n\v\f\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]+$/g;
+
+// 서버 line_cache.normalize_line과 같은 정규화 (앞뒤 공백 제거)
+function normalizeLine(text) {
+    return text.replace(LINE_WHITESPACE, '');
+}
+
+// 서버 줄 해시와 같은 방식 (앞뒤 공백을 제거한 줄의 UTF-8 SHA-256 앞 64비트, 16진수 16자리)
+async function lineHash(text) {
+    const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(normalizeLine(text)));
+    return Array.from(new Uint8Array(digest, 0, 8), b => b.toString(16).padStart(2, '0')).join('');
+}
+
+// 서버에 결과가 있을 것으로 보는 줄 해시 (최근 것만 보관)
+const KNOWN_HASHES_KEY = 'knownLineHashes';
+const MAX_KNOWN_HASHES = 5000;
+
+function loadKnownHashes() {
+    try {
+        return new Set(JSON.parse(sessionStorage.getItem(KNOWN_HASHES_KEY) || '[]'));
+    } catch (error) {
+        return new Set();
+    }
+}
+
+function saveKnownHashes(knownHashes, hashes) {
+    // 이번에 쓴 해시를 가장 최근으로 옮기고 오래된 해시부터 버림
+    hashes.forEach(hash => {
+        knownHashes.delete(hash);
+        knownHashes.add(hash);
+    });
+    const list = Array.from(knownHashes).slice(-MAX_KNOWN_HASHES);
+    sessionStorage.setItem(KNOWN_HASHES_KEY, JSON.stringify(list));
+}
+
+// 증분 변환: 줄 해시를 모두 보내고 원문은 처음 보는 줄만 보냄
+// 응답 본문(문자열)을 그대로 반환, 해시 계산을 할 수 없는 환경(비보안 컨텍스트)이면 전체 변환
+async function convertIncremental(text, detailMode) {
+    const lines = text.split('\n');
+    const body = {
+        detail_mode: detailMode,
+        format: 'compact'
+    };
+
+    if (!window.crypto || !crypto.subtle) {
+        body.text = text;
+        const response = await fetch('/api/convert', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(body)
+        });
+        if (!response.ok) {
+            throw await requestError(response);
+        }
+        return await response.text();
+    }
+
+    const hashes = await Promise.all(lines.map(lineHash));
+    const textByHash = {};
+    hashes.forEach((hash, i) => {
+        textByHash[hash] = lines[i];
+    });
+
+    const knownHashes = loadKnownHashes();
+    body.hashes = hashes;
+    body.texts = {};
+    hashes.forEach(hash => {
+        if (!knownHashes.has(hash)) {
+            body.texts[hash] = textByHash[hash];
+        }
+    });
+
+    // 서버 저장소에서 밀려난 줄이 있으면 원문을 채워서 한 번 더 요청
+    for (let attempt = 0; attempt < 2; attempt++) {
+        const response = await fetch('/api/convert_incremental', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(body)
+        });
+        if (response.status === 409) {
+            const { missing } = await response.json();
+            missing.forEach(hash => {
+                body.texts[hash] = textByHash[hash];
+            });
+            continue;
+        }
+        if (!response.ok) {
+            throw await requestError(response);
+        }
+
+        saveKnownHashes(knownHashes, hashes);
+        return await response.text();
+    }
+
+    throw new Error('변환 요청 실패: 누락된 줄을 다시 보냈지만 결과를 받지 못했습니다');
+}
+
+// 문서 해시 (서버 line_cache.document_hash와 같은 방식)
+// 줄마다 앞뒤 공백 제거, 앞뒤 빈 줄 제거 후 개행으로 연결한 텍스트의 SHA-256 앞 16바이트(16진수)
+async function documentHash(text) {
+    const lines = text.split('\n').map(normalizeLine);
+    let start = 0;
+    let end = lines.length;
+    while (start < end && !lines[start]) start++;
+    while (end > start && !lines[end - 1]) end--;
+    const document = lines.slice(start, end).join('\n');
+    const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(document));
+    return Array.from(new Uint8Array(digest, 0, 16), b => b.toString(16).padStart(2, '0')).join('');
+}
+
+// 변환 결과를 내용 주소 GET(/api/result/문서 해시)으로 먼저 조회하고, 없으면 증분 변환
+// GET 응답은 브라우저/CDN이 캐시하므로 같은 가사를 다시 변환하면 서버까지 가지 않을 수 있음
+// 응답 본문(압축 형식 문자열)을 그대로 반환
+async function convertCached(text, detailMode) {
+    if (window.crypto && crypto.subtle) {
+        const hash = await documentHash(text);
+        const response = await fetch(`/api/result/${hash}?format=compact${detailMode ? '&detail_mode=true' : ''}`);
+        if (response.ok) {
+            return await response.text();
+        }
+        // 404(서버에 없는 문서) 등은 POST 변환으로 대체
+    }
+    return await convertIncremental(text, detailMode);
+}
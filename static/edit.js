@@ -3,7 +3,22 @@
 let convertedData = null;
 
 // 페이지 로드 시 데이터 로드
-window.addEventListener('DOMContentLoaded', function() {
+window.addEventListener('DOMContentLoaded', async function() {
+    if (sessionStorage.getItem('pendingText') !== null) {
+        // 스트리밍 변환: 줄이 도착하는 대로 표시
+        try {
+            await loadPendingConversion((data, line, lineIndex) => {
+                convertedData = data;
+                appendEditLine(line, lineIndex);
+            });
+        } catch (error) {
+            console.error('변환 오류:', error);
+            alert('변환 중 오류가 발생했습니다.');
+            window.location.href = '/input';
+        }
+        return;
+    }
+    
     const dataStr = sessionStorage.getItem('convertedData');
     if (!dataStr) {
         alert('변환된 데이터가 없습니다.');
@@ -11,7 +26,7 @@ window.addEventListener('DOMContentLoaded', function() {
         return;
     }
     
-    convertedData = JSON.parse(dataStr);
+    convertedData = decodeConvertedData(JSON.parse(dataStr));
     renderEditPanel();
     updateBorderVisibility();
 });
@@ -25,26 +40,38 @@ function renderEditPanel() {
     panel.innerHTML = '';
     
     convertedData.lines.forEach((line, lineIndex) => {
-        const lineDiv = document.createElement('div');
-        lineDiv.className = 'edit-line';
-        
-        if (line.words.length === 0) {
-            // 빈 줄
-            lineDiv.innerHTML = '<br>';
-        } else {
-            line.words.forEach((word, wordIndex) => {
-                const wordGroup = createWordGroup(word, lineIndex, wordIndex);
-                lineDiv.appendChild(wordGroup);
-            });
-        }
-        
-        panel.appendChild(lineDiv);
+        panel.appendChild(createEditLine(line, lineIndex));
     });
     
     updateDisplay();
     updateBorderVisibility();
 }
 
+function createEditLine(line, lineIndex) {
+    const lineDiv = document.createElement('div');
+    lineDiv.className = 'edit-line';
+    
+    if (line.words.length === 0) {
+        // 빈 줄
+        lineDiv.innerHTML = '<br>';
+    } else {
+        line.words.forEach((word, wordIndex) => {
+            const wordGroup = createWordGroup(word, lineIndex, wordIndex);
+            lineDiv.appendChild(wordGroup);
+        });
+    }
+    
+    return lineDiv;
+}
+
+// 스트리밍 중 도착한 줄 하나를 편집 패널 끝에 추가
+function appendEditLine(line, lineIndex) {
+    const lineDiv = createEditLine(line, lineIndex);
+    document.getElementById('editPanel').appendChild(lineDiv);
+    updateDisplay(lineDiv);
+    updateBorderVisibility(lineDiv);
+}
+
 function createWordGroup(word, lineIndex, wordIndex) {
     const group = document.createElement('div');
     group.className = 'word-group';
@@ -172,19 +199,19 @@ function selectPronunciation(lineIndex, wordIndex, selectedId) {
 
 
 
-function updateDisplay() {
+function updateDisplay(root = document) {
     const useHyphen = document.getElementById('useHyphen').checked;
     
-    document.querySelectorAll('.word-group').forEach(group => {
+    root.querySelectorAll('.word-group').forEach(group => {
         const hangulDiv = group.querySelector('.word-pronunciation');
         // 하이픈 사용 여부에 따라 pron 또는 kana 표시
         hangulDiv.textContent = useHyphen ? hangulDiv.dataset.pron : hangulDiv.dataset.kana;
     });
 }
 
-function updateBorderVisibility() {
+function updateBorderVisibility(root = document) {
     // 여러 발음이 있을 때만 테두리 표시 (고정)
-    document.querySelectorAll('.word-group').forEach(group => {
+    root.querySelectorAll('.word-group').forEach(group => {
         // clickable 클래스가 있으면 (여러 발음) 테두리 표시
         if (group.classList.contains('clickable')) {
             group.style.border = '2px solid #2196F3';
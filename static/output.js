@@ -3,7 +3,24 @@
 let convertedData = null;
 
 // 페이지 로드 시 데이터 로드
-window.addEventListener('DOMContentLoaded', function() {
+window.addEventListener('DOMContentLoaded', async function() {
+    restoreSettings();
+    
+    if (sessionStorage.getItem('pendingText') !== null) {
+        // 스트리밍 변환: 줄이 도착하는 대로 표시
+        try {
+            await loadPendingConversion((data, line, lineIndex) => {
+                convertedData = data;
+                appendOutputLine(line);
+            });
+        } catch (error) {
+            console.error('변환 오류:', error);
+            alert('변환 중 오류가 발생했습니다.');
+            window.location.href = '/input';
+        }
+        return;
+    }
+    
     const dataStr = sessionStorage.getItem('convertedData');
     if (!dataStr) {
         alert('변환된 데이터가 없습니다.');
@@ -11,9 +28,12 @@ window.addEventListener('DOMContentLoaded', function() {
         return;
     }
     
-    convertedData = JSON.parse(dataStr);
-    
-    // 설정 복원
+    convertedData = decodeConvertedData(JSON.parse(dataStr));
+    updateOutput();
+});
+
+// 세션에 저장된 출력 설정 복원
+function restoreSettings() {
     const useHyphen = sessionStorage.getItem('useHyphen');
     if (useHyphen !== null) {
         document.getElementById('useHyphen').checked = useHyphen === 'true';
@@ -38,9 +58,7 @@ window.addEventListener('DOMContentLoaded', function() {
     if (clarifyXts !== null) {
         document.getElementById('clarifyXts').checked = clarifyXts === 'true';
     }
-    
-    updateOutput();
-});
+}
 
 function goBack() {
     window.location.href = '/input';
@@ -238,7 +256,7 @@ function processWordInternal(text, clarifyNnFlag, clarifyXtsFlag, isProperNoun)
     return result;
 }
 
-// 공백 추가 로직을 포함한 텍스트 생성
+// 공백 추가 로직을 포함한 텍스트 생성 (서버의 hangul_render.render_line과 같은 규칙, 수정 시 함께 변경)
 function getLineTextWithOptions(words, useHyphen, addSpace, clarifyNnFlag, clarifyXtsFlag) {
     if (words.length === 0) return '';
     
@@ -332,51 +350,70 @@ function getLineTextWithOptions(words, useHyphen, addSpace, clarifyNnFlag, clari
 }
 
 
+// 현재 체크박스 상태로 출력 옵션 읽기
+function getOutputOptions() {
+    return {
+        useHyphen: document.getElementById('useHyphen').checked,
+        addSpace: document.getElementById('addSpace').checked,
+        showOriginal: document.getElementById('showOriginal').checked,
+        clarifyNn: document.getElementById('clarifyNn').checked,
+        clarifyXts: document.getElementById('clarifyXts').checked
+    };
+}
+
+function createOutputLine(line, options) {
+    const lineContainer = document.createElement('div');
+    lineContainer.className = 'output-line-container';
+    
+    if (line.words.length === 0) {
+        // 빈 줄
+        lineContainer.innerHTML = '<br>';
+    } else {
+        // 원문 표시
+        if (options.showOriginal) {
+            const originalDiv = document.createElement('div');
+            originalDiv.className = 'output-original';
+            originalDiv.textContent = line.original_text;
+            lineContainer.appendChild(originalDiv);
+        }
+        
+        // 변환된 텍스트
+        const convertedDiv = document.createElement('div');
+        convertedDiv.className = 'output-converted';
+        
+        const lineText = getLineTextWithOptions(line.words, options.useHyphen, options.addSpace, options.clarifyNn, options.clarifyXts);
+        
+        convertedDiv.textContent = lineText;
+        lineContainer.appendChild(convertedDiv);
+    }
+    
+    return lineContainer;
+}
+
+// 스트리밍 중 도착한 줄 하나를 출력 패널 끝에 추가
+function appendOutputLine(line) {
+    const panel = document.getElementById('outputPanel');
+    panel.appendChild(createOutputLine(line, getOutputOptions()));
+}
+
 function updateOutput() {
     const panel = document.getElementById('outputPanel');
-    const useHyphen = document.getElementById('useHyphen').checked;
-    const addSpace = document.getElementById('addSpace').checked;
-    const showOriginal = document.getElementById('showOriginal').checked;
-    const clarifyNnFlag = document.getElementById('clarifyNn').checked;
-    const clarifyXtsFlag = document.getElementById('clarifyXts').checked;
+    const options = getOutputOptions();
     
     panel.innerHTML = ''; // 초기화
     
-    convertedData.lines.forEach(line => {
-        const lineContainer = document.createElement('div');
-        lineContainer.className = 'output-line-container';
-        
-        if (line.words.length === 0) {
-            // 빈 줄
-            lineContainer.innerHTML = '<br>';
-        } else {
-            // 원문 표시
-            if (showOriginal) {
-                const originalDiv = document.createElement('div');
-                originalDiv.className = 'output-original';
-                originalDiv.textContent = line.original_text;
-                lineContainer.appendChild(originalDiv);
-            }
-            
-            // 변환된 텍스트
-            const convertedDiv = document.createElement('div');
-            convertedDiv.className = 'output-converted';
-            
-            const lineText = getLineTextWithOptions(line.words, useHyphen, addSpace, clarifyNnFlag, clarifyXtsFlag);
-            
-            convertedDiv.textContent = lineText;
-            lineContainer.appendChild(convertedDiv);
-        }
-        
-        panel.appendChild(lineContainer);
-    });
+    if (convertedData) {
+        convertedData.lines.forEach(line => {
+            panel.appendChild(createOutputLine(line, options));
+        });
+    }
     
     // 세션에 저장
-    sessionStorage.setItem('useHyphen', useHyphen);
-    sessionStorage.setItem('addSpace', addSpace);
-    sessionStorage.setItem('showOriginal', showOriginal);
-    sessionStorage.setItem('clarifyNn', clarifyNnFlag);
-    sessionStorage.setItem('clarifyXts', clarifyXtsFlag);
+    sessionStorage.setItem('useHyphen', options.useHyphen);
+    sessionStorage.setItem('addSpace', options.addSpace);
+    sessionStorage.setItem('showOriginal', options.showOriginal);
+    sessionStorage.setItem('clarifyNn', options.clarifyNn);
+    sessionStorage.setItem('clarifyXts', options.clarifyXts);
 }
 
 function copyToClipboard(event) {
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+MeCab.Tagger 풀
+Tagger와 lattice 상태는 스레드 간 공유가 안전하지 않으므로
+한 번에 한 스레드만 Tagger를 사용하도록 대여/반납 방식으로 관리
+"""
+
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+
+class TaggerPool:
+    """
+    대여/반납 방식의 Tagger 풀
+
+    필요할 때만 새 Tagger를 만들고, max_size개를 모두 빌려간 상태라면
+    다른 스레드가 반납할 때까지 기다린다.
+    """
+
+    def __init__(self, factory: Callable[[], Any], max_size: Optional[int] = None,
+                 initial: Optional[Any] = None):
+        """
+        Args:
+            factory: 새 Tagger를 만드는 함수
+            max_size: 최대 Tagger 수 (None이면 CPU 코어 수)
+            initial: 미리 만들어 둔 Tagger (풀에 바로 넣음)
+        """
+        self.factory = factory
+        self.max_size = max(1, max_size or os.cpu_count() or 1)
+        self._idle: "queue.LifoQueue[Any]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+
+        if initial is not None:
+            self._created = 1
+            self._idle.put(initial)
+
+    @property
+    def size(self) -> int:
+        """지금까지 만든 Tagger 수"""
+        return self._created
+
+    def acquire(self, timeout: Optional[float] = None) -> Any:
+        """
+        Tagger 대여
+
+        Args:
+            timeout: 모든 Tagger가 사용 중일 때 기다릴 최대 시간 (None이면 무한정)
+
+        Returns:
+            MeCab.Tagger
+
+        Raises:
+            queue.Empty: timeout 안에 반납된 Tagger가 없는 경우
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            create = self._created < self.max_size
+            if create:
+                self._created += 1
+
+        if create:
+            try:
+                return self.factory()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+
+        return self._idle.get(timeout=timeout)
+
+    def release(self, tagger: Any) -> None:
+        """
+        Tagger 반납
+
+        Args:
+            tagger: acquire로 빌린 Tagger
+        """
+        self._idle.put(tagger)
+
+    @contextmanager
+    def checkout(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """
+        with 문으로 Tagger를 빌리고 블록이 끝나면 반납
+
+        Args:
+            timeout: acquire 대기 시간
+        """
+        tagger = self.acquire(timeout)
+        try:
+            yield tagger
+        finally:
+            self.release(tagger)